@@ -0,0 +1,242 @@
+/******************************************************************************
+ * Project: PicoScope 6000E Driver
+ * File: _ps6000a_fast.c
+ *
+ * Optional native bindings for the hottest driver calls.
+ *
+ * Each function parses plain integer arguments with PyArg_ParseTuple, calls
+ * the driver directly (with the GIL released), and returns the raw status
+ * code as a Python int. Pointer arguments are passed as integer addresses.
+ * This skips the libffi marshalling that ctypes does on every call.
+ *
+ * The module is only built when PICO_SDK_DIR is set at build time (see
+ * setup.py). ps6000a.functions falls back to ctypes when it is missing.
+ *
+ * Copyright (c) 2024 Marcus Engineering, LLC (MIT Licensed)
+ *
+ *****************************************************************************/
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+#include <stdint.h>
+
+#include "ps6000aApi.h"
+
+static PyObject *
+fast_run_block(PyObject *self, PyObject *args)
+{
+	int16_t handle;
+	unsigned long long pre_trigger, post_trigger, time_indisposed, segment;
+	unsigned long long ready, parameter;
+	unsigned int timebase;
+	PICO_STATUS status;
+
+	if (!PyArg_ParseTuple(
+			args, "hKKIKKKK", &handle, &pre_trigger, &post_trigger,
+			&timebase, &time_indisposed, &segment, &ready, &parameter))
+		return NULL;
+
+	Py_BEGIN_ALLOW_THREADS
+	status = ps6000aRunBlock(
+		handle, pre_trigger, post_trigger, timebase,
+		(double *)(uintptr_t)time_indisposed, segment,
+		(ps6000aBlockReady)(uintptr_t)ready, (PICO_POINTER)(uintptr_t)parameter);
+	Py_END_ALLOW_THREADS
+
+	return PyLong_FromUnsignedLong(status);
+}
+
+static PyObject *
+fast_is_ready(PyObject *self, PyObject *args)
+{
+	int16_t handle;
+	unsigned long long ready;
+	PICO_STATUS status;
+
+	if (!PyArg_ParseTuple(args, "hK", &handle, &ready))
+		return NULL;
+
+	Py_BEGIN_ALLOW_THREADS
+	status = ps6000aIsReady(handle, (int16_t *)(uintptr_t)ready);
+	Py_END_ALLOW_THREADS
+
+	return PyLong_FromUnsignedLong(status);
+}
+
+static PyObject *
+fast_get_values(PyObject *self, PyObject *args)
+{
+	int16_t handle;
+	unsigned long long start, no_of_samples, ratio, segment, overflow;
+	unsigned int mode;
+	PICO_STATUS status;
+
+	if (!PyArg_ParseTuple(
+			args, "hKKKIKK", &handle, &start, &no_of_samples, &ratio, &mode,
+			&segment, &overflow))
+		return NULL;
+
+	Py_BEGIN_ALLOW_THREADS
+	status = ps6000aGetValues(
+		handle, start, (uint64_t *)(uintptr_t)no_of_samples, ratio,
+		(PICO_RATIO_MODE)mode, segment, (int16_t *)(uintptr_t)overflow);
+	Py_END_ALLOW_THREADS
+
+	return PyLong_FromUnsignedLong(status);
+}
+
+static PyObject *
+fast_get_values_bulk(PyObject *self, PyObject *args)
+{
+	int16_t handle;
+	unsigned long long start, no_of_samples, from_segment, to_segment;
+	unsigned long long ratio, overflow;
+	unsigned int mode;
+	PICO_STATUS status;
+
+	if (!PyArg_ParseTuple(
+			args, "hKKKKKIK", &handle, &start, &no_of_samples, &from_segment,
+			&to_segment, &ratio, &mode, &overflow))
+		return NULL;
+
+	Py_BEGIN_ALLOW_THREADS
+	status = ps6000aGetValuesBulk(
+		handle, start, (uint64_t *)(uintptr_t)no_of_samples, from_segment,
+		to_segment, ratio, (PICO_RATIO_MODE)mode,
+		(int16_t *)(uintptr_t)overflow);
+	Py_END_ALLOW_THREADS
+
+	return PyLong_FromUnsignedLong(status);
+}
+
+static PyObject *
+fast_set_no_of_captures(PyObject *self, PyObject *args)
+{
+	int16_t handle;
+	unsigned long long n_captures;
+	PICO_STATUS status;
+
+	if (!PyArg_ParseTuple(args, "hK", &handle, &n_captures))
+		return NULL;
+
+	Py_BEGIN_ALLOW_THREADS
+	status = ps6000aSetNoOfCaptures(handle, n_captures);
+	Py_END_ALLOW_THREADS
+
+	return PyLong_FromUnsignedLong(status);
+}
+
+static PyObject *
+fast_set_output_edge_detect(PyObject *self, PyObject *args)
+{
+	int16_t handle, state;
+	PICO_STATUS status;
+
+	if (!PyArg_ParseTuple(args, "hh", &handle, &state))
+		return NULL;
+
+	Py_BEGIN_ALLOW_THREADS
+	status = ps6000aSetOutputEdgeDetect(handle, state);
+	Py_END_ALLOW_THREADS
+
+	return PyLong_FromUnsignedLong(status);
+}
+
+static PyObject *
+fast_configure_capture(PyObject *self, PyObject *args)
+{
+	int16_t handle, edge_state;
+	unsigned long long n_captures;
+	PICO_STATUS status;
+
+	if (!PyArg_ParseTuple(args, "hKh", &handle, &n_captures, &edge_state))
+		return NULL;
+
+	Py_BEGIN_ALLOW_THREADS
+	status = ps6000aSetNoOfCaptures(handle, n_captures);
+	if (status == PICO_OK)
+		status = ps6000aSetOutputEdgeDetect(handle, edge_state);
+	Py_END_ALLOW_THREADS
+
+	return PyLong_FromUnsignedLong(status);
+}
+
+static PyObject *
+fast_get_trigger_info(PyObject *self, PyObject *args)
+{
+	int16_t handle;
+	unsigned long long trigger_info, first_segment, segment_count;
+	PICO_STATUS status;
+
+	if (!PyArg_ParseTuple(
+			args, "hKKK", &handle, &trigger_info, &first_segment,
+			&segment_count))
+		return NULL;
+
+	Py_BEGIN_ALLOW_THREADS
+	status = ps6000aGetTriggerInfo(
+		handle, (PICO_TRIGGER_INFO *)(uintptr_t)trigger_info, first_segment,
+		segment_count);
+	Py_END_ALLOW_THREADS
+
+	return PyLong_FromUnsignedLong(status);
+}
+
+static PyObject *
+fast_get_adc_limits(PyObject *self, PyObject *args)
+{
+	int16_t handle, min_value = 0, max_value = 0;
+	unsigned int resolution;
+	PICO_STATUS status;
+
+	if (!PyArg_ParseTuple(args, "hI", &handle, &resolution))
+		return NULL;
+
+	Py_BEGIN_ALLOW_THREADS
+	status = ps6000aGetAdcLimits(
+		handle, (PICO_DEVICE_RESOLUTION)resolution, &min_value, &max_value);
+	Py_END_ALLOW_THREADS
+
+	return Py_BuildValue("(khh)", (unsigned long)status, min_value, max_value);
+}
+
+static PyMethodDef fast_methods[] = {
+	{"run_block", fast_run_block, METH_VARARGS,
+	 "Call ps6000aRunBlock, returning the raw status code."},
+	{"is_ready", fast_is_ready, METH_VARARGS,
+	 "Call ps6000aIsReady, returning the raw status code."},
+	{"get_values", fast_get_values, METH_VARARGS,
+	 "Call ps6000aGetValues, returning the raw status code."},
+	{"get_values_bulk", fast_get_values_bulk, METH_VARARGS,
+	 "Call ps6000aGetValuesBulk, returning the raw status code."},
+	{"set_no_of_captures", fast_set_no_of_captures, METH_VARARGS,
+	 "Call ps6000aSetNoOfCaptures, returning the raw status code."},
+	{"set_output_edge_detect", fast_set_output_edge_detect, METH_VARARGS,
+	 "Call ps6000aSetOutputEdgeDetect, returning the raw status code."},
+	{"configure_capture", fast_configure_capture, METH_VARARGS,
+	 "Call ps6000aSetNoOfCaptures then ps6000aSetOutputEdgeDetect."},
+	{"get_trigger_info", fast_get_trigger_info, METH_VARARGS,
+	 "Call ps6000aGetTriggerInfo, returning the raw status code."},
+	{"get_adc_limits", fast_get_adc_limits, METH_VARARGS,
+	 "Call ps6000aGetAdcLimits, returning (status, min, max)."},
+	{NULL, NULL, 0, NULL},
+};
+
+static struct PyModuleDef fast_module = {
+	PyModuleDef_HEAD_INIT,
+	"_ps6000a_fast",
+	"Optional native bindings for the hottest driver calls.",
+	-1,
+	fast_methods,
+	NULL,
+	NULL,
+	NULL,
+	NULL,
+};
+
+PyMODINIT_FUNC
+PyInit__ps6000a_fast(void)
+{
+	return PyModule_Create(&fast_module);
+}
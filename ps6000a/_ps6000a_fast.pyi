@@ -0,0 +1,46 @@
+"""Type stubs for the optional native bindings in _ps6000a_fast.c."""
+
+def run_block(
+	handle: int,
+	no_of_pre_trigger_samples: int,
+	no_of_post_trigger_samples: int,
+	timebase: int,
+	time_indisposed_ms: int,
+	segment_index: int,
+	cb_ready: int,
+	cb_parameter: int,
+	/,
+) -> int: ...
+def is_ready(handle: int, ready: int, /) -> int: ...
+def get_values(
+	handle: int,
+	start_index: int,
+	no_of_samples: int,
+	down_sample_ratio: int,
+	down_sample_ratio_mode: int,
+	segment_index: int,
+	overflow: int,
+	/,
+) -> int: ...
+def get_values_bulk(
+	handle: int,
+	start_index: int,
+	no_of_samples: int,
+	from_segment_index: int,
+	to_segment_index: int,
+	down_sample_ratio: int,
+	down_sample_ratio_mode: int,
+	overflow: int,
+	/,
+) -> int: ...
+def set_no_of_captures(handle: int, n_captures: int, /) -> int: ...
+def set_output_edge_detect(handle: int, state: int, /) -> int: ...
+def configure_capture(handle: int, n_captures: int, edge_state: int, /) -> int: ...
+def get_trigger_info(
+	handle: int,
+	trigger_info: int,
+	first_segment_index: int,
+	segment_count: int,
+	/,
+) -> int: ...
+def get_adc_limits(handle: int, resolution: int, /) -> tuple[int, int, int]: ...
@@ -16,10 +16,77 @@
 from ctypes import Array
 from dataclasses import dataclass, field
 from enum import Enum, auto
+from functools import lru_cache
+
+import numpy as np
+import numpy.typing as npt
 
 from ps6000a.constants import PicoChannel, PicoDataType, PicoRatioMode
 from ps6000a.types import PicoStreamingDataInfo
 
+BUFFER_ALIGNMENT = 64
+"""Byte alignment of arrays allocated by this module (one cache line)."""
+
+
+def _aligned_zeros(
+	n_samples: int, dtype: npt.DTypeLike, alignment: int = BUFFER_ALIGNMENT
+) -> np.ndarray:
+	"""
+	Allocate a zero-filled, one-dimensional array with an aligned start address.
+
+	:param n_samples: Number of elements in the array.
+	:type n_samples: int
+	:param dtype: Element type of the array.
+	:type dtype: npt.DTypeLike
+	:param alignment: Required alignment of the first element, in bytes.
+	:type alignment: int
+	:return: Zero-filled array starting on an ``alignment`` byte boundary.
+	:rtype: np.ndarray
+	"""
+	dtype = np.dtype(dtype)
+	raw = np.zeros(n_samples * dtype.itemsize + alignment, dtype=np.uint8)
+	offset = -raw.ctypes.data % alignment
+	return raw[offset : offset + n_samples * dtype.itemsize].view(dtype)
+
+
+def make_waveform_buffer(max_samples: int) -> np.ndarray:
+	"""
+	Allocate a reusable, cache-line aligned buffer for AWG waveform uploads.
+
+	Fill the buffer in place and pass it to ``sig_gen_waveform`` as
+	``buf.ctypes.data_as(c_void_p)`` with ``len(buf)`` (or fewer) samples.
+	Reusing one buffer across uploads, rather than allocating a new one each
+	time, keeps the waveform data resident in cache.
+
+	:param max_samples: Largest waveform, in samples, the buffer must hold.
+	:type max_samples: int
+	:return: Zero-filled ``np.int16`` array of length ``max_samples``.
+	:rtype: np.ndarray
+	:raises ValueError: Will raise if ``max_samples`` is not positive.
+	"""
+	if max_samples <= 0:
+		raise ValueError(f"Invalid waveform buffer size {max_samples}")
+	return _aligned_zeros(max_samples, np.int16)
+
+
+def make_data_array(data_type: PicoDataType, n_samples: int) -> Array:
+	"""
+	Allocate a zero-filled, cache-line aligned ctypes array for sample data.
+
+	The memory is owned by a NumPy array, which the ctypes array keeps alive,
+	so the samples start on a ``BUFFER_ALIGNMENT`` byte boundary and can be
+	viewed with NumPy without copying.
+
+	:param data_type: The data type of the array elements.
+	:type data_type: PicoDataType
+	:param n_samples: The length of the array, in samples.
+	:type n_samples: int
+	:return: Zero-filled ctypes array of ``n_samples`` ``data_type.ctype``.
+	:rtype: Array
+	"""
+	data = _aligned_zeros(n_samples, data_type.numpy_type)
+	return (data_type.ctype * n_samples).from_buffer(data.data)
+
 
 class BufferMaxMin(Enum):
 	"""
@@ -35,7 +102,7 @@ class BufferMaxMin(Enum):
 	MIN = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BufferClass:
 	# noinspection PyUnresolvedReferences
 	"""
@@ -57,7 +124,29 @@ class BufferClass:
 	segment: int
 
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=256)
+def get_buffer_class(
+	channel: PicoChannel, datatype: PicoDataType, segment: int
+) -> BufferClass:
+	"""
+	Get the (shared, cached) ``BufferClass`` for a channel/datatype/segment.
+
+	Buffer classes are looked up on every buffer registry access, so reusing
+	one instance per combination avoids building a new dataclass each time.
+
+	:param channel: The oscilloscope channel.
+	:type channel: PicoChannel
+	:param datatype: The datatype of buffer elements.
+	:type datatype: PicoDataType
+	:param segment: The segment index.
+	:type segment: int
+	:return: The matching buffer class.
+	:rtype: BufferClass
+	"""
+	return BufferClass(channel=channel, datatype=datatype, segment=segment)
+
+
+@dataclass(frozen=True, slots=True)
 class Buffer:
 	# noinspection PyUnresolvedReferences
 	"""
@@ -95,9 +184,7 @@ class Buffer:
 		:return: Subset of contained data as ``BufferClass`` object.
 		:rtype: BufferClass
 		"""
-		return BufferClass(
-			channel=self.channel, datatype=self.datatype, segment=self.segment
-		)
+		return get_buffer_class(self.channel, self.datatype, self.segment)
 
 	@property
 	def empty_streaming_info(self) -> PicoStreamingDataInfo:
@@ -129,3 +216,18 @@ class Buffer:
 		:rtype: int
 		"""
 		return len(self.buffer)
+
+	def as_ndarray(self) -> np.ndarray:
+		"""
+		Get a NumPy view of the buffer, without copying.
+
+		The view shares memory with the buffer, so it reflects data written by
+		the driver after it is created. Buffers allocated by ``PS6000A`` start
+		on a ``BUFFER_ALIGNMENT`` byte boundary. Scale the view with NumPy
+		rather than iterating over the buffer, e.g.
+		``buffer.as_ndarray() * scale + offset``.
+
+		:return: One-dimensional array of ``datatype.numpy_type``.
+		:rtype: np.ndarray
+		"""
+		return np.frombuffer(memoryview(self.buffer), dtype=self.datatype.numpy_type)
@@ -15,9 +15,21 @@
 #
 ###############################################################################
 
-from ctypes import POINTER, WINFUNCTYPE, c_int16, c_uint16, c_uint32, c_uint64, c_void_p
+from ctypes import (
+	POINTER,
+	WINFUNCTYPE,
+	c_int16,
+	c_uint8,
+	c_uint16,
+	c_uint32,
+	c_uint64,
+	c_void_p,
+)
 from ctypes import cast as c_cast
-from typing import TYPE_CHECKING, Callable, Protocol, Sequence, Union
+import importlib
+from typing import TYPE_CHECKING, Any, Callable, Optional, Protocol, Sequence, Union
+
+import numpy as np
 
 from ps6000a.constants import (
 	PicoChannel,
@@ -29,10 +41,13 @@ from ps6000a.constants import (
 	PicoTemperatureReference,
 )
 from ps6000a.types import (
+	DIGITAL_PORT_INTERACTIONS_DTYPE,
+	USER_PROBE_INTERACTIONS_DTYPE,
 	PicoDigitalPortInteractions,
 	PicoHandle,
 	PicoProbeButtonPressParameter,
 	PicoUserProbeInteractions,
+	intern_handle,
 )
 
 if TYPE_CHECKING:
@@ -46,6 +61,31 @@ if TYPE_CHECKING:
 # to say we just don't use it at all.
 
 
+def _struct_array_view(
+	address: Optional[int], dtype: np.dtype, count: int
+) -> np.ndarray:
+	"""
+	View a driver-owned array of structures as a NumPy structured array.
+
+	No data is copied. The view is only valid for as long as the driver keeps
+	the memory alive, which for callback arguments is until the callback
+	returns. Copy it (``view.copy()``) to keep the data any longer.
+
+	:param address: Address of the first structure, or None for NULL.
+	:type address: Optional[int]
+	:param dtype: Structured dtype matching the C structure.
+	:type dtype: np.dtype
+	:param count: Number of structures in the array.
+	:type count: int
+	:return: Structured array viewing the driver's memory.
+	:rtype: np.ndarray
+	"""
+	if not address or count <= 0:
+		return np.empty(0, dtype=dtype)
+	raw = (c_uint8 * (dtype.itemsize * count)).from_address(address)
+	return np.frombuffer(memoryview(raw), dtype=dtype)
+
+
 # ps6000aBlockReady
 
 
@@ -89,7 +129,7 @@ def wrap_block_ready(callback: BlockReadyCallback) -> BlockReadyCType:
 		status: int,  # Value should be in PicoStatus enum.
 		parameter: c_void_p,
 	) -> None:
-		callback(PicoHandle(handle), PicoStatus(status))
+		callback(intern_handle(handle), PicoStatus.from_int(status))
 
 	out = BlockReadyCType(_callback)
 	setattr(callback, holder, (_callback, out))
@@ -143,7 +183,9 @@ def wrap_data_ready(callback: DataReadyCallback) -> DataReadyCType:
 		overflow: int,
 		parameter: c_void_p,
 	) -> None:
-		callback(PicoHandle(handle), PicoStatus(status), num_samples, overflow)
+		callback(
+			intern_handle(handle), PicoStatus.from_int(status), num_samples, overflow
+		)
 
 	out = DataReadyCType(_callback)
 	setattr(callback, holder, (_callback, out))
@@ -206,7 +248,58 @@ def wrap_digital_port_interactions(
 	) -> None:
 		c_struct_p = POINTER(PicoDigitalPortInteractions * num_ports)
 		ports_live = c_cast(ports, c_struct_p)
-		callback(PicoHandle(handle), PicoStatus(status), tuple(ports_live.contents))
+		callback(
+			intern_handle(handle),
+			PicoStatus.from_int(status),
+			tuple(ports_live.contents),
+		)
+
+	out = DigitalPortInteractionsCType(_callback)
+	setattr(callback, holder, (_callback, out))
+	return out
+
+
+class DigitalPortInteractionsArrayCallback(Protocol):
+	"""Version of DigitalPortInteractionsCallback taking a NumPy array."""
+
+	def __call__(
+		self, handle: PicoHandle, status: PicoStatus, ports: np.ndarray
+	) -> None:
+		"""Handle callback call."""
+		...
+
+
+def wrap_digital_port_interactions_array(
+	callback: DigitalPortInteractionsArrayCallback,
+) -> DigitalPortInteractionsCType:
+	"""
+	Create C function pointer from Python function taking a NumPy array.
+
+	Rather than a tuple of ``PicoDigitalPortInteractions`` structures, the
+	callback receives a ``DIGITAL_PORT_INTERACTIONS_DTYPE`` structured array
+	viewing the driver's memory directly. The array is only valid until the
+	callback returns.
+
+	:param callback: The Python function to make a pointer to.
+	:type callback: DigitalPortInteractionsArrayCallback
+	:return: C function pointer according to "ps6000aDigitalPortInteractions"
+		typedef.
+	:rtype: DigitalPortInteractionsCType
+	"""
+	holder = "__ps6000a_DigitalPortInteractionsCType_array"
+	if hasattr(callback, holder):
+		return getattr(callback, holder)[1]  # type: ignore
+
+	def _callback(
+		handle: int,
+		status: int,  # Value should be in PicoStatus enum.
+		ports: Optional[int],  # Points to array of PicoDigitalPortInteractions.
+		num_ports: int,  # Length of ports array.
+	) -> None:
+		ports_view = _struct_array_view(
+			ports, DIGITAL_PORT_INTERACTIONS_DTYPE, num_ports
+		)
+		callback(intern_handle(handle), PicoStatus.from_int(status), ports_view)
 
 	out = DigitalPortInteractionsCType(_callback)
 	setattr(callback, holder, (_callback, out))
@@ -255,7 +348,7 @@ def wrap_pico_update_firmware_progress(
 		return getattr(callback, holder)[1]  # type: ignore
 
 	def _callback(handle: int, progress: int) -> None:
-		callback(PicoHandle(handle), progress)
+		callback(intern_handle(handle), progress)
 
 	out = PicoUpdateFirmwareProgressCType(_callback)
 	setattr(callback, holder, (_callback, out))
@@ -317,7 +410,57 @@ def wrap_pico_probe_interactions(
 	) -> None:
 		c_struct_p = POINTER(PicoUserProbeInteractions * num_probes)
 		probes_live = c_cast(probes, c_struct_p)
-		callback(PicoHandle(handle), PicoStatus(status), tuple(probes_live.contents))
+		callback(
+			intern_handle(handle),
+			PicoStatus.from_int(status),
+			tuple(probes_live.contents),
+		)
+
+	out = PicoProbeInteractionsCType(_callback)
+	setattr(callback, holder, (_callback, out))
+	return out
+
+
+class PicoProbeInteractionsArrayCallback(Protocol):
+	"""Version of PicoProbeInteractionsCallback taking a NumPy array."""
+
+	def __call__(
+		self, handle: PicoHandle, status: PicoStatus, probes: np.ndarray
+	) -> None:
+		"""Handle callback call."""
+		...
+
+
+def wrap_pico_probe_interactions_array(
+	callback: PicoProbeInteractionsArrayCallback,
+) -> PicoProbeInteractionsCType:
+	"""
+	Create C function pointer from Python function taking a NumPy array.
+
+	Rather than a tuple of ``PicoUserProbeInteractions`` structures, the
+	callback receives a ``USER_PROBE_INTERACTIONS_DTYPE`` structured array
+	viewing the driver's memory directly. The array is only valid until the
+	callback returns.
+
+	:param callback: The Python function to make a pointer to.
+	:type callback: PicoProbeInteractionsArrayCallback
+	:return: C function pointer according to "PicoProbeInteractions" typedef.
+	:rtype: PicoProbeInteractionsCType
+	"""
+	holder = "__ps6000a_PicoProbeInteractionsCType_array"
+	if hasattr(callback, holder):
+		return getattr(callback, holder)[1]  # type: ignore
+
+	def _callback(
+		handle: int,
+		status: int,  # Value should be in PicoStatus enum.
+		probes: Optional[int],  # Points to array of PicoUserProbeInteractions.
+		num_probes: int,  # Length of probes array.
+	) -> None:
+		probes_view = _struct_array_view(
+			probes, USER_PROBE_INTERACTIONS_DTYPE, num_probes
+		)
+		callback(intern_handle(handle), PicoStatus.from_int(status), probes_view)
 
 	out = PicoProbeInteractionsCType(_callback)
 	setattr(callback, holder, (_callback, out))
@@ -383,9 +526,9 @@ def wrap_pico_data_ready_using_reads(
 		parameter: c_void_p,
 	) -> None:
 		callback(
-			PicoHandle(handle),
+			intern_handle(handle),
 			PicoReadSelection(read),
-			PicoStatus(status),
+			PicoStatus.from_int(status),
 			from_segment_index,
 			to_segment_index,
 		)
@@ -445,7 +588,11 @@ def wrap_pico_external_reference_interactions(
 		status: int,  # Value should be in PicoStatus enum.
 		reference: int,  # Value should be in PicoClockReference enum.
 	) -> None:
-		callback(PicoHandle(handle), PicoStatus(status), PicoClockReference(reference))
+		callback(
+			intern_handle(handle),
+			PicoStatus.from_int(status),
+			PicoClockReference.from_int(reference),
+		)
 
 	out = PicoExternalReferenceInteractionsCType(_callback)
 	setattr(callback, holder, (_callback, out))
@@ -496,7 +643,7 @@ def wrap_pico_awg_overrange_interactions(
 	def _callback(
 		handle: int, status: int  # Value should be in PicoStatus enum.
 	) -> None:
-		callback(PicoHandle(handle), PicoStatus(status))
+		callback(intern_handle(handle), PicoStatus.from_int(status))
 
 	out = PicoAWGOverrangeInteractionsCType(_callback)
 	setattr(callback, holder, (_callback, out))
@@ -552,7 +699,7 @@ def wrap_pico_temperature_sensor_interactions(
 		handle: int,
 		temperature_status: int,  # Value should be in PicoTemperatureReference enum.
 	) -> None:
-		callback(PicoHandle(handle), PicoTemperatureReference(temperature_status))
+		callback(intern_handle(handle), PicoTemperatureReference(temperature_status))
 
 	out = PicoTemperatureSensorInteractionsCType(_callback)
 	setattr(callback, holder, (_callback, out))
@@ -627,8 +774,8 @@ def wrap_pico_probe_user_action(
 		else:
 			raise RuntimeError(f"Cannot handle action {action}.")
 		callback(
-			PicoHandle(handle),
-			PicoStatus(status),
+			intern_handle(handle),
+			PicoStatus.from_int(status),
 			PicoChannel(channel),
 			PicoConnectProbe(probe),
 			py_action,
@@ -638,3 +785,95 @@ def wrap_pico_probe_user_action(
 	out = PicoProbeUserActionCType(_callback)
 	setattr(callback, holder, (_callback, out))
 	return out
+
+
+PICO_PROBE_USER_ACTION_SIGNATURE = (
+	"void(int16, uint32, uint32, uint32, uint32, voidptr, voidptr)"
+)
+"""Numba signature of the PicoProbeUserAction C function type."""
+
+
+def jit_pico_probe_user_action(
+	callback: Callable[[int, int, int, int, int, int, int], None],
+) -> PicoProbeUserActionCType:
+	"""
+	Create C function pointer from a Python function, compiled if possible.
+
+	Unlike ``wrap_pico_probe_user_action``, the callback receives the raw
+	arguments of the C function type as plain integers (the two pointers as
+	addresses), in the same order. If numba is installed, the callback is
+	compiled with ``numba.cfunc`` in nopython mode, so each event runs as
+	native code without taking the GIL. Otherwise, it is wrapped as a normal
+	ctypes callback with the same arguments.
+
+	:param callback: The Python function to make a pointer to.
+	:type callback: Callable[[int, int, int, int, int, int, int], None]
+	:return: C function pointer according to "PicoProbeUserAction" typedef.
+	:rtype: PicoProbeUserActionCType
+	"""
+	return _jit_callback(  # type: ignore[no-any-return]
+		callback,
+		PICO_PROBE_USER_ACTION_SIGNATURE,
+		PicoProbeUserActionCType,
+		"__ps6000a_PicoProbeUserActionCType_jit",
+	)
+
+
+PICO_EXTERNAL_REFERENCE_INTERACTIONS_SIGNATURE = "void(int16, uint32, uint32)"
+"""Numba signature of the PicoExternalReferenceInteractions C function type."""
+
+
+def jit_pico_external_reference_interactions(
+	callback: Callable[[int, int, int], None],
+) -> PicoExternalReferenceInteractionsCType:
+	"""
+	Create C function pointer from a Python function, compiled if possible.
+
+	As ``jit_pico_probe_user_action``, but for the
+	"PicoExternalReferenceInteractions" typedef. The callback receives the
+	handle, status, and clock reference as plain integers.
+
+	:param callback: The Python function to make a pointer to.
+	:type callback: Callable[[int, int, int], None]
+	:return: C function pointer according to
+		"PicoExternalReferenceInteractions" typedef.
+	:rtype: PicoExternalReferenceInteractionsCType
+	"""
+	return _jit_callback(  # type: ignore[no-any-return]
+		callback,
+		PICO_EXTERNAL_REFERENCE_INTERACTIONS_SIGNATURE,
+		PicoExternalReferenceInteractionsCType,
+		"__ps6000a_PicoExternalReferenceInteractionsCType_jit",
+	)
+
+
+def _jit_callback(
+	callback: Callable[..., None], signature: str, ctype: Any, holder: str
+) -> Any:
+	"""
+	Compile a raw-argument callback with numba, or wrap it with ctypes.
+
+	:param callback: The Python function to make a pointer to.
+	:type callback: Callable[..., None]
+	:param signature: Numba signature of the C function type.
+	:type signature: str
+	:param ctype: ctypes function type to fall back to.
+	:type ctype: Any
+	:param holder: Attribute of ``callback`` to keep the result alive in.
+	:type holder: str
+	:return: C function pointer.
+	:rtype: Any
+	"""
+	if hasattr(callback, holder):
+		return getattr(callback, holder)[1]
+
+	try:
+		numba = importlib.import_module("numba")
+	except ImportError:
+		compiled = None
+		out = ctype(callback)
+	else:
+		compiled = numba.cfunc(signature, nopython=True)(callback)
+		out = compiled.ctypes
+	setattr(callback, holder, (compiled, out))
+	return out
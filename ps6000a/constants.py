@@ -19,7 +19,7 @@
 # noinspection PyUnresolvedReferences
 # We need _SimpleCData for typing to work right. API stability unknown.
 from ctypes import _SimpleCData, c_int8, c_int16, c_int32, c_int64, c_uint32
-from typing import Optional, Type, cast
+from typing import Any, Optional, Type, cast
 
 import numpy as np
 
@@ -697,7 +697,12 @@ class PicoDigitalPort(FlexIntEnum):
 
 
 class PicoStatus(FlexIntEnum):
-	"""The status code returned by every API function."""
+	"""
+	The status code returned by every API function.
+
+	Undocumented codes returned by the driver do not raise ``ValueError``;
+	they are enumerated as cached "fake" members named like ``UNKNOWN_0x7000``.
+	"""
 
 	NOT_YET_RUN = -1
 	OK = 0x00000000
@@ -1095,6 +1100,20 @@ class PicoStatus(FlexIntEnum):
 	SOURCE_FTD2XX_NOT_FOUND = 0x20000008
 	SOURCE_FTD2XX_NO_FUNCTION = 0x20000009
 
+	@classmethod
+	def _fake_member_name(cls, value: Any) -> str:
+		"""
+		Get the name to give a "fake" member for an undocumented status code.
+
+		:param value: Undocumented status code.
+		:type value: Any
+		:return: Name of the new fake member, e.g. ``UNKNOWN_0x7000``.
+		:rtype: str
+		"""
+		if isinstance(value, int):
+			return f"UNKNOWN_{value:#x}"
+		return str(value)
+
 
 class PicoInfo(FlexIntEnum):
 	"""A piece of information about an oscilloscope."""
@@ -13,6 +13,12 @@
 # Some functions are not fully Pythonized or documented because they are not
 # expected to be used in the scope of this project.
 #
+# Acquisition loops compiled with numba cannot call these wrappers directly.
+# ``objmode_get_values`` returns only plain integers so that it can be called
+# from inside a ``numba.objmode`` block without leaving the compiled loop.
+#
+# ``warmup`` can be called to take the driver's first-call latency up front.
+#
 # APPLICABLE DLL VERSION: 1.0.67.2674
 #
 # Portions Copyright 2018-2019 Pico Technology Ltd. (ISC Licensed)
@@ -27,6 +33,7 @@
 
 from ctypes import (
 	Array,
+	Structure,
 	addressof,
 	byref,
 	c_char_p,
@@ -42,7 +49,9 @@ from ctypes import (
 from ctypes import cast as c_cast
 from ctypes import create_string_buffer, sizeof, windll
 from ctypes.util import find_library
-from typing import Optional, Sequence, Union
+from typing import Any, Callable, Optional, Sequence, TypeVar, Union
+
+import numpy as np
 
 from ps6000a.callbacks import (
 	BlockReadyCType,
@@ -74,6 +83,7 @@ from ps6000a.constants import (
 	PicoTriggerWithinPreTrigger,
 )
 from ps6000a.types import (
+	CHANNEL_OVERVOLTAGE_TRIPPED_DTYPE,
 	PicoCondition,
 	PicoDirection,
 	PicoHandle,
@@ -87,11 +97,99 @@ from ps6000a.types import (
 lib_path = find_library("ps6000a")
 if lib_path is None:
 	raise ImportError("Could not load ps6000a driver (not installed?).")
+# The driver must be loaded as a WinDLL (or CDLL), never a PyDLL: ctypes only
+# releases the GIL around foreign calls for the former, and long blocking calls
+# such as ``start_firmware_update`` must not stall other Python threads.
 _dll = windll.LoadLibrary(lib_path)
 
-_open_unit = _dll.ps6000aOpenUnit
-_open_unit.restype = c_uint32
-_open_unit.argtypes = [c_void_p, c_char_p, c_int32]
+# Optional native bindings for the hottest calls (see setup.py). The ctypes
+# path below is always available as a fallback.
+try:
+	import ps6000a._ps6000a_fast as _fast
+
+	_HAVE_FAST = True
+except ImportError:
+	_HAVE_FAST = False
+
+
+def _wrap(code: int) -> PicoStatus:
+	"""
+	Convert a raw status code into a ``PicoStatus``.
+
+	:param code: Raw status code returned by the driver.
+	:type code: int
+	:return: Matching status.
+	:rtype: PicoStatus
+	"""
+	return PicoStatus.from_int(code)
+
+
+# Return and argument types of every bound driver function, by C name.
+_signatures: dict[str, tuple[Any, ...]] = {}
+
+
+def _bind(name: str, argtypes: list[Any]) -> Any:
+	"""
+	Look up a driver function and set its argument and return types.
+
+	:param name: Name of the driver function, e.g. ``"ps6000aOpenUnit"``.
+	:type name: str
+	:param argtypes: ctypes types of the function's arguments.
+	:type argtypes: list[Any]
+	:return: The ctypes function object, returning a raw status code.
+	:rtype: Any
+	"""
+	fn = getattr(_dll, name)
+	fn.restype = c_uint32
+	fn.argtypes = argtypes
+	_signatures[name] = (c_uint32, *argtypes)
+	return fn
+
+
+def _address(pointer: Any) -> int:
+	"""
+	Get the address referred to by a pointer-like ctypes argument.
+
+	:param pointer: Anything ctypes accepts as a ``c_void_p`` argument, such as
+		the result of ``byref``, an array, a callback, or None.
+	:type pointer: Any
+	:return: The address, or 0 for NULL.
+	:rtype: int
+	"""
+	address = c_cast(pointer, c_void_p).value
+	return 0 if address is None else address
+
+
+_S = TypeVar("_S", bound=Structure)
+
+
+def _struct_array(
+	items: Union[Sequence[_S], "Array[_S]"], struct_type: type[_S]
+) -> "Array[_S]":
+	"""
+	Get a ctypes array of structures, copying only if not given one already.
+
+	:param items: The structures, or a ctypes array of them.
+	:type items: Union[Sequence[_S], Array[_S]]
+	:param struct_type: The structure type the driver expects.
+	:type struct_type: type[_S]
+	:return: ``items`` if it is already a ctypes array of ``struct_type``,
+		otherwise a new array holding copies of ``items``.
+	:rtype: Array[_S]
+	:raises TypeError: Will raise if ``items`` is a ctypes array of another
+		element type.
+	"""
+	if isinstance(items, Array):
+		if items._type_ is not struct_type:
+			raise TypeError(
+				f"Expected an array of {struct_type.__name__}, "
+				f"not of {items._type_.__name__}"
+			)
+		return items
+	return (struct_type * len(items))(*items)
+
+
+_open_unit = _bind("ps6000aOpenUnit", [c_void_p, c_char_p, c_int32])
 
 
 def open_unit(
@@ -129,13 +227,11 @@ def open_unit(
 	if serial is not None:
 		ser_chars = create_string_buffer(serial.encode("ASCII"))
 		ser_char_p = c_cast(addressof(ser_chars), c_char_p)
-	status = PicoStatus(_open_unit(byref(handle), ser_char_p, resolution))
+	status = _wrap(_open_unit(byref(handle), ser_char_p, resolution))
 	return status, PicoHandle(handle.value)
 
 
-_open_unit_async = _dll.ps6000aOpenUnitAsync
-_open_unit_async.restype = c_uint32
-_open_unit_async.argtypes = [c_void_p, c_char_p, c_int32]
+_open_unit_async = _bind("ps6000aOpenUnitAsync", [c_void_p, c_char_p, c_int32])
 
 
 def open_unit_async(
@@ -167,13 +263,11 @@ def open_unit_async(
 	if serial is not None:
 		ser_chars = create_string_buffer(serial.encode("ASCII"))
 		ser_char_p = c_cast(addressof(ser_chars), c_char_p)
-	status = PicoStatus(_open_unit_async(byref(status2), ser_char_p, resolution))
+	status = _wrap(_open_unit_async(byref(status2), ser_char_p, resolution))
 	return status, bool(status2.value)
 
 
-_open_unit_progress = _dll.ps6000aOpenUnitProgress
-_open_unit_progress.restype = c_uint32
-_open_unit_progress.argtypes = [c_void_p, c_void_p, c_void_p]
+_open_unit_progress = _bind("ps6000aOpenUnitProgress", [c_void_p, c_void_p, c_void_p])
 
 
 def open_unit_progress() -> tuple[PicoStatus, PicoHandle, int, bool]:
@@ -203,15 +297,13 @@ def open_unit_progress() -> tuple[PicoStatus, PicoHandle, int, bool]:
 	handle = c_int16()
 	progress = c_int16()
 	complete = c_int16()
-	status = PicoStatus(
-		_open_unit_progress(byref(handle), byref(progress), byref(complete))
-	)
+	status = _wrap(_open_unit_progress(byref(handle), byref(progress), byref(complete)))
 	return status, PicoHandle(handle.value), progress.value, bool(complete.value)
 
 
-_get_unit_info = _dll.ps6000aGetUnitInfo
-_get_unit_info.restype = c_uint32
-_get_unit_info.argtypes = [c_int16, c_char_p, c_int16, c_void_p, c_int32]
+_get_unit_info = _bind(
+	"ps6000aGetUnitInfo", [c_int16, c_char_p, c_int16, c_void_p, c_int32]
+)
 
 
 def get_unit_info(handle: PicoHandle, info: PicoInfo) -> tuple[PicoStatus, str]:
@@ -235,16 +327,14 @@ def get_unit_info(handle: PicoHandle, info: PicoInfo) -> tuple[PicoStatus, str]:
 	info_length = c_int16(256)
 	info_chars = create_string_buffer(info_length.value)
 	info_char_p = c_cast(addressof(info_chars), c_char_p)
-	status = PicoStatus(
+	status = _wrap(
 		_get_unit_info(handle, info_char_p, info_length, byref(info_length), info)
 	)
 	info_string = info_chars.value.decode("ASCII")
 	return status, info_string
 
 
-_close_unit = _dll.ps6000aCloseUnit
-_close_unit.restype = c_uint32
-_close_unit.argtypes = [c_int16]
+_close_unit = _bind("ps6000aCloseUnit", [c_int16])
 
 
 def close_unit(handle: PicoHandle) -> PicoStatus:
@@ -258,12 +348,11 @@ def close_unit(handle: PicoHandle) -> PicoStatus:
 	:return: Status.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(_close_unit(handle))
+	clear_channel_combinations_cache(handle)
+	return _wrap(_close_unit(handle))
 
 
-_flash_led = _dll.ps6000aFlashLed
-_flash_led.restype = c_uint32
-_flash_led.argtypes = [c_int16, c_int16]
+_flash_led = _bind("ps6000aFlashLed", [c_int16, c_int16])
 
 
 def flash_led(handle: PicoHandle, start: int) -> PicoStatus:
@@ -288,12 +377,10 @@ def flash_led(handle: PicoHandle, start: int) -> PicoStatus:
 	:return: Status.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(_flash_led(handle, start))
+	return _wrap(_flash_led(handle, start))
 
 
-_memory_segments = _dll.ps6000aMemorySegments
-_memory_segments.restype = c_uint32
-_memory_segments.argtypes = [c_int16, c_uint64, c_void_p]
+_memory_segments = _bind("ps6000aMemorySegments", [c_int16, c_uint64, c_void_p])
 
 
 def memory_segments(handle: PicoHandle, n_segments: int) -> tuple[PicoStatus, int]:
@@ -320,13 +407,13 @@ def memory_segments(handle: PicoHandle, n_segments: int) -> tuple[PicoStatus, in
 	:rtype: tuple[PicoStatus, int]
 	"""
 	n_max_samples = c_uint64()
-	status = PicoStatus(_memory_segments(handle, n_segments, byref(n_max_samples)))
+	status = _wrap(_memory_segments(handle, n_segments, byref(n_max_samples)))
 	return status, n_max_samples.value
 
 
-_memory_segments_by_samples = _dll.ps6000aMemorySegmentsBySamples
-_memory_segments_by_samples.restype = c_uint32
-_memory_segments_by_samples.argtypes = [c_int16, c_uint64, c_void_p]
+_memory_segments_by_samples = _bind(
+	"ps6000aMemorySegmentsBySamples", [c_int16, c_uint64, c_void_p]
+)
 
 
 def memory_segments_by_samples(
@@ -354,15 +441,15 @@ def memory_segments_by_samples(
 	:rtype: tuple[PicoStatus, int]
 	"""
 	n_max_segments = c_uint64()
-	status = PicoStatus(
+	status = _wrap(
 		_memory_segments_by_samples(handle, n_samples, byref(n_max_segments))
 	)
 	return status, n_max_segments.value
 
 
-_get_maximum_available_memory = _dll.ps6000aGetMaximumAvailableMemory
-_get_maximum_available_memory.restype = c_uint32
-_get_maximum_available_memory.argtypes = [c_int16, c_void_p, c_uint32]
+_get_maximum_available_memory = _bind(
+	"ps6000aGetMaximumAvailableMemory", [c_int16, c_void_p, c_uint32]
+)
 
 
 def get_maximum_available_memory(
@@ -382,21 +469,15 @@ def get_maximum_available_memory(
 	:rtype: tuple[PicoStatus, int]
 	"""
 	n_max_samples = c_uint64()
-	status = PicoStatus(
+	status = _wrap(
 		_get_maximum_available_memory(handle, byref(n_max_samples), resolution)
 	)
 	return status, n_max_samples.value
 
 
-_query_max_segments_by_samples = _dll.ps6000aQueryMaxSegmentsBySamples
-_query_max_segments_by_samples.restype = c_uint32
-_query_max_segments_by_samples.argtypes = [
-	c_int16,
-	c_uint64,
-	c_int32,
-	c_void_p,
-	c_uint32,
-]
+_query_max_segments_by_samples = _bind(
+	"ps6000aQueryMaxSegmentsBySamples", [c_int16, c_uint64, c_int32, c_void_p, c_uint32]
+)
 
 
 def query_max_segments_by_samples(
@@ -423,7 +504,7 @@ def query_max_segments_by_samples(
 	:rtype: tuple[PicoStatus, int]
 	"""
 	n_max_segments = c_uint64()
-	status = PicoStatus(
+	status = _wrap(
 		_query_max_segments_by_samples(
 			handle, n_samples, n_channels_enabled, byref(n_max_segments), resolution
 		)
@@ -431,9 +512,9 @@ def query_max_segments_by_samples(
 	return status, n_max_segments.value
 
 
-_set_channel_on = _dll.ps6000aSetChannelOn
-_set_channel_on.restype = c_uint32
-_set_channel_on.argtypes = [c_int16, c_uint32, c_uint32, c_uint32, c_double, c_uint32]
+_set_channel_on = _bind(
+	"ps6000aSetChannelOn", [c_int16, c_uint32, c_uint32, c_uint32, c_double, c_uint32]
+)
 
 
 def set_channel_on(
@@ -472,14 +553,12 @@ def set_channel_on(
 	:return: Status.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(
+	return _wrap(
 		_set_channel_on(handle, channel, coupling, range_, analog_offset, bandwidth)
 	)
 
 
-_set_channel_off = _dll.ps6000aSetChannelOff
-_set_channel_off.restype = c_uint32
-_set_channel_off.argtypes = [c_int16, c_uint32]
+_set_channel_off = _bind("ps6000aSetChannelOff", [c_int16, c_uint32])
 
 
 def set_channel_off(handle: PicoHandle, channel: PicoChannel) -> PicoStatus:
@@ -498,18 +577,18 @@ def set_channel_off(handle: PicoHandle, channel: PicoChannel) -> PicoStatus:
 	:return: Status.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(_set_channel_off(handle, channel))
+	return _wrap(_set_channel_off(handle, channel))
 
 
-_set_digital_port_on = _dll.ps6000aSetDigitalPortOn
-_set_digital_port_on.restype = c_uint32
-_set_digital_port_on.argtypes = [c_int16, c_uint32, c_void_p, c_int16, c_uint32]
+_set_digital_port_on = _bind(
+	"ps6000aSetDigitalPortOn", [c_int16, c_uint32, c_void_p, c_int16, c_uint32]
+)
 
 
 def set_digital_port_on(
 	handle: PicoHandle,
 	port: PicoChannel,
-	logic_threshold_level: Sequence[int],
+	logic_threshold_level: Union[Sequence[int], np.ndarray],
 	hysteresis: PicoDigitalPortHysteresis,
 ) -> PicoStatus:
 	"""
@@ -529,24 +608,29 @@ def set_digital_port_on(
 	:type port: PicoChannel
 	:param logic_threshold_level: A sequence of threshold voltages, one for each
 		port pin, used to distinguish the 0 and 1 states. Range: –32767 (–5 V)
-		to 32767 (+5 V). This determines how many pins are enabled.
-	:type logic_threshold_level: Sequence[int]
+		to 32767 (+5 V). This determines how many pins are enabled. A
+		contiguous ``np.int16`` array is passed to the driver as is, without
+		conversion.
+	:type logic_threshold_level: Union[Sequence[int], np.ndarray]
 	:param hysteresis: The hysteresis to apply to all channels in the port.
 	:type hysteresis: PicoDigitalPortHysteresis
 	:return: Status.
 	:rtype: PicoStatus
 	"""
 	ltl_count = len(logic_threshold_level)
-	ltl_array = (c_int16 * ltl_count)(*logic_threshold_level)
-	ltl_ptr = c_cast(addressof(ltl_array), c_void_p)
-	return PicoStatus(
-		_set_digital_port_on(handle, port, ltl_ptr, ltl_count, hysteresis)
-	)
+	if (
+		isinstance(logic_threshold_level, np.ndarray)
+		and logic_threshold_level.dtype == np.int16
+		and logic_threshold_level.flags.c_contiguous
+	):
+		ltl_address = logic_threshold_level.ctypes.data
+	else:
+		ltl_array = (c_int16 * ltl_count)(*logic_threshold_level)
+		ltl_address = addressof(ltl_array)
+	return _wrap(_set_digital_port_on(handle, port, ltl_address, ltl_count, hysteresis))
 
 
-_set_digital_port_off = _dll.ps6000aSetDigitalPortOff
-_set_digital_port_off.restype = c_uint32
-_set_digital_port_off.argtypes = [c_int16, c_uint32]
+_set_digital_port_off = _bind("ps6000aSetDigitalPortOff", [c_int16, c_uint32])
 
 
 def set_digital_port_off(handle: PicoHandle, port: PicoChannel) -> PicoStatus:
@@ -563,12 +647,12 @@ def set_digital_port_off(handle: PicoHandle, port: PicoChannel) -> PicoStatus:
 	:return: Status.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(_set_digital_port_off(handle, port))
+	return _wrap(_set_digital_port_off(handle, port))
 
 
-_get_timebase = _dll.ps6000aGetTimebase
-_get_timebase.restype = c_uint32
-_get_timebase.argtypes = [c_int16, c_uint32, c_uint64, c_void_p, c_void_p, c_uint64]
+_get_timebase = _bind(
+	"ps6000aGetTimebase", [c_int16, c_uint32, c_uint64, c_void_p, c_void_p, c_uint64]
+)
 
 
 def get_timebase(
@@ -613,7 +697,7 @@ def get_timebase(
 	"""
 	time_interval_ns = c_double()
 	max_samples = c_uint64()
-	status = PicoStatus(
+	status = _wrap(
 		_get_timebase(
 			handle,
 			timebase,
@@ -626,17 +710,10 @@ def get_timebase(
 	return status, time_interval_ns.value, max_samples.value
 
 
-_set_simple_trigger = _dll.ps6000aSetSimpleTrigger
-_set_simple_trigger.restype = c_uint32
-_set_simple_trigger.argtypes = [
-	c_int16,
-	c_int16,
-	c_uint32,
-	c_int16,
-	c_uint32,
-	c_uint64,
-	c_uint32,
-]
+_set_simple_trigger = _bind(
+	"ps6000aSetSimpleTrigger",
+	[c_int16, c_int16, c_uint32, c_int16, c_uint32, c_uint64, c_uint32],
+)
 
 
 def set_simple_trigger(
@@ -674,7 +751,7 @@ def set_simple_trigger(
 	:return: Status.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(
+	return _wrap(
 		_set_simple_trigger(
 			handle,
 			int(enable),
@@ -687,9 +764,9 @@ def set_simple_trigger(
 	)
 
 
-_trigger_within_pre_trigger_samples = _dll.ps6000aTriggerWithinPreTriggerSamples
-_trigger_within_pre_trigger_samples.restype = c_uint32
-_trigger_within_pre_trigger_samples.argtypes = [c_int16, c_uint32]
+_trigger_within_pre_trigger_samples = _bind(
+	"ps6000aTriggerWithinPreTriggerSamples", [c_int16, c_uint32]
+)
 
 
 def trigger_within_pre_trigger_samples(
@@ -708,23 +785,20 @@ def trigger_within_pre_trigger_samples(
 	:return: Status.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(_trigger_within_pre_trigger_samples(handle, state))
+	return _wrap(_trigger_within_pre_trigger_samples(handle, state))
 
 
-_set_trigger_channel_properties = _dll.ps6000aSetTriggerChannelProperties
-_set_trigger_channel_properties.restype = c_uint32
-_set_trigger_channel_properties.argtypes = [
-	c_int16,
-	c_void_p,
-	c_int16,
-	c_int16,
-	c_uint32,
-]
+_set_trigger_channel_properties = _bind(
+	"ps6000aSetTriggerChannelProperties",
+	[c_int16, c_void_p, c_int16, c_int16, c_uint32],
+)
 
 
 def set_trigger_channel_properties(
 	handle: PicoHandle,
-	channel_properties: Sequence[PicoTriggerChannelProperties],
+	channel_properties: Union[
+		Sequence[PicoTriggerChannelProperties], "Array[PicoTriggerChannelProperties]"
+	],
 	aux_output_enable: int,
 	auto_trigger_micro_seconds: int,
 ) -> PicoStatus:
@@ -739,8 +813,10 @@ def set_trigger_channel_properties(
 	:param channel_properties: A sequence of ``PicoTriggerChannelProperties``
 		describing the requested properties. The sequence can contain a single
 		object describing the properties of one channel, or a number of objects
-		describing several channels. If empty, triggering is switched off.
-	:type channel_properties: Sequence[PicoTriggerChannelProperties]
+		describing several channels. If empty, triggering is switched off. A
+		ctypes array of the structures is passed to the driver as is.
+	:type channel_properties: Union[Sequence[PicoTriggerChannelProperties],
+		Array[PicoTriggerChannelProperties]]
 	:param aux_output_enable: "Not used."
 	:type aux_output_enable: int
 	:param auto_trigger_micro_seconds: The time in microseconds for which the
@@ -750,11 +826,13 @@ def set_trigger_channel_properties(
 	:type auto_trigger_micro_seconds: int
 	:return: Status.
 	:rtype: PicoStatus
+	:raises TypeError: Will raise if ``channel_properties`` is a ctypes array
+		of a type other than ``PicoTriggerChannelProperties``.
 	"""
 	cprop_count = len(channel_properties)
-	cprop_array = (PicoTriggerChannelProperties * cprop_count)(*channel_properties)
+	cprop_array = _struct_array(channel_properties, PicoTriggerChannelProperties)
 	cprop_ptr = c_cast(addressof(cprop_array), c_void_p)
-	return PicoStatus(
+	return _wrap(
 		_set_trigger_channel_properties(
 			handle,
 			cprop_ptr,
@@ -765,13 +843,15 @@ def set_trigger_channel_properties(
 	)
 
 
-_set_trigger_channel_conditions = _dll.ps6000aSetTriggerChannelConditions
-_set_trigger_channel_conditions.restype = c_uint32
-_set_trigger_channel_conditions.argtypes = [c_int16, c_void_p, c_int16, c_uint32]
+_set_trigger_channel_conditions = _bind(
+	"ps6000aSetTriggerChannelConditions", [c_int16, c_void_p, c_int16, c_uint32]
+)
 
 
 def set_trigger_channel_conditions(
-	handle: PicoHandle, conditions: Sequence[PicoCondition], action: PicoAction
+	handle: PicoHandle,
+	conditions: Union[Sequence[PicoCondition], "Array[PicoCondition]"],
+	action: PicoAction,
 ) -> PicoStatus:
 	"""
 	Set triggering logic (ps6000aSetTriggerChannelConditions).
@@ -790,29 +870,31 @@ def set_trigger_channel_conditions(
 		conditions that should be applied to each channel. In the simplest case,
 		the sequence consists of a single element. When there is more than one
 		element, the overall trigger condition is the logical OR of all the
-		elements. If the sequence is empty, triggering is switched off.
-	:type conditions: Sequence[PicoCondition]
+		elements. If the sequence is empty, triggering is switched off. A ctypes
+		array of the structures is passed to the driver as is.
+	:type conditions: Union[Sequence[PicoCondition], Array[PicoCondition]]
 	:param action: Specifies how to apply the new conditions to any existing
 		trigger conditions (i.e. append or replace).
 	:type action: PicoAction
 	:return: Status.
 	:rtype: PicoStatus
+	:raises TypeError: Will raise if ``conditions`` is a ctypes array of a type
+		other than ``PicoCondition``.
 	"""
 	cond_count = len(conditions)
-	cond_array = (PicoCondition * cond_count)(*conditions)
+	cond_array = _struct_array(conditions, PicoCondition)
 	cond_ptr = c_cast(addressof(cond_array), c_void_p)
-	return PicoStatus(
-		_set_trigger_channel_conditions(handle, cond_ptr, cond_count, action)
-	)
+	return _wrap(_set_trigger_channel_conditions(handle, cond_ptr, cond_count, action))
 
 
-_set_trigger_channel_directions = _dll.ps6000aSetTriggerChannelDirections
-_set_trigger_channel_directions.restype = c_uint32
-_set_trigger_channel_directions.argtypes = [c_int16, c_void_p, c_int16]
+_set_trigger_channel_directions = _bind(
+	"ps6000aSetTriggerChannelDirections", [c_int16, c_void_p, c_int16]
+)
 
 
 def set_trigger_channel_directions(
-	handle: PicoHandle, directions: Sequence[PicoDirection]
+	handle: PicoHandle,
+	directions: Union[Sequence[PicoDirection], "Array[PicoDirection]"],
 ) -> PicoStatus:
 	"""
 	Set trigger directions (ps6000aSetTriggerChannelDirections).
@@ -822,20 +904,21 @@ def set_trigger_channel_directions(
 	:param handle: The device identifier returned by ``open_unit``.
 	:type handle: PicoHandle
 	:param directions: A sequence of ``PicoDirection`` objects, each specifying
-		the trigger direction for a channel.
-	:type directions: Sequence[PicoDirection]
+		the trigger direction for a channel. A ctypes array of the structures is
+		passed to the driver as is.
+	:type directions: Union[Sequence[PicoDirection], Array[PicoDirection]]
 	:return: Status.
 	:rtype: PicoStatus
+	:raises TypeError: Will raise if ``directions`` is a ctypes array of a type
+		other than ``PicoDirection``.
 	"""
 	dir_count = len(directions)
-	dir_array = (PicoDirection * dir_count)(*directions)
+	dir_array = _struct_array(directions, PicoDirection)
 	dir_ptr = c_cast(addressof(dir_array), c_void_p)
-	return PicoStatus(_set_trigger_channel_directions(handle, dir_ptr, dir_count))
+	return _wrap(_set_trigger_channel_directions(handle, dir_ptr, dir_count))
 
 
-_set_trigger_delay = _dll.ps6000aSetTriggerDelay
-_set_trigger_delay.restype = c_uint32
-_set_trigger_delay.argtypes = [c_int16, c_uint64]
+_set_trigger_delay = _bind("ps6000aSetTriggerDelay", [c_int16, c_uint64])
 
 
 def set_trigger_delay(handle: PicoHandle, delay: int) -> PicoStatus:
@@ -853,21 +936,13 @@ def set_trigger_delay(handle: PicoHandle, delay: int) -> PicoStatus:
 	:return: Status.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(_set_trigger_delay(handle, delay))
+	return _wrap(_set_trigger_delay(handle, delay))
 
 
-_set_data_buffer = _dll.ps6000aSetDataBuffer
-_set_data_buffer.restype = c_uint32
-_set_data_buffer.argtypes = [
-	c_int16,
-	c_uint32,
-	c_void_p,
-	c_int32,
-	c_uint32,
-	c_uint64,
-	c_uint32,
-	c_uint32,
-]
+_set_data_buffer = _bind(
+	"ps6000aSetDataBuffer",
+	[c_int16, c_uint32, c_void_p, c_int32, c_uint32, c_uint64, c_uint32, c_uint32],
+)
 
 
 def set_data_buffer(
@@ -933,7 +1008,7 @@ def set_data_buffer(
 		if sizeof(buffer) != (n_samples * sizeof(data_type.ctype)):
 			raise TypeError("Buffer size mismatch, is data type wrong?")
 		buffer_ptr = c_cast(addressof(buffer), c_void_p)
-	status = PicoStatus(
+	status = _wrap(
 		_set_data_buffer(
 			handle,
 			channel,
@@ -948,19 +1023,20 @@ def set_data_buffer(
 	return status
 
 
-_set_data_buffers = _dll.ps6000aSetDataBuffers
-_set_data_buffers.restype = c_uint32
-_set_data_buffers.argtypes = [
-	c_int16,
-	c_uint32,
-	c_void_p,
-	c_void_p,
-	c_int32,
-	c_uint32,
-	c_uint64,
-	c_uint32,
-	c_uint32,
-]
+_set_data_buffers = _bind(
+	"ps6000aSetDataBuffers",
+	[
+		c_int16,
+		c_uint32,
+		c_void_p,
+		c_void_p,
+		c_int32,
+		c_uint32,
+		c_uint64,
+		c_uint32,
+		c_uint32,
+	],
+)
 
 
 def set_data_buffers(
@@ -1042,7 +1118,7 @@ def set_data_buffers(
 			if sizeof(buffer_min) != (n_samples * sizeof(data_type.ctype)):
 				raise TypeError("Buffer (min) size mismatch, is data type wrong?")
 			buffer_min_ptr = c_cast(addressof(buffer_min), c_void_p)
-	status = PicoStatus(
+	status = _wrap(
 		_set_data_buffers(
 			handle,
 			channel,
@@ -1058,18 +1134,10 @@ def set_data_buffers(
 	return status
 
 
-_run_streaming = _dll.ps6000aRunStreaming
-_run_streaming.restype = c_uint32
-_run_streaming.argtypes = [
-	c_int16,
-	c_void_p,
-	c_uint32,
-	c_uint64,
-	c_uint64,
-	c_int16,
-	c_uint64,
-	c_uint32,
-]
+_run_streaming = _bind(
+	"ps6000aRunStreaming",
+	[c_int16, c_void_p, c_uint32, c_uint64, c_uint64, c_int16, c_uint64, c_uint32],
+)
 
 
 def run_streaming(
@@ -1130,7 +1198,7 @@ def run_streaming(
 	:rtype: tuple[PicoStatus, float]
 	"""
 	sample_interval_out = c_double(sample_interval)
-	status = PicoStatus(
+	status = _wrap(
 		_run_streaming(
 			handle,
 			byref(sample_interval_out),
@@ -1145,9 +1213,9 @@ def run_streaming(
 	return status, sample_interval_out.value
 
 
-_get_streaming_latest_values = _dll.ps6000aGetStreamingLatestValues
-_get_streaming_latest_values.restype = c_uint32
-_get_streaming_latest_values.argtypes = [c_int16, c_void_p, c_uint64, c_void_p]
+_get_streaming_latest_values = _bind(
+	"ps6000aGetStreamingLatestValues", [c_int16, c_void_p, c_uint64, c_void_p]
+)
 
 
 def get_streaming_latest_values(
@@ -1163,6 +1231,9 @@ def get_streaming_latest_values(
 	``PicoStreamingDataTriggerInfo`` structures to indicate that a trigger has
 	occurred and at what location.
 
+	The driver is called with the GIL released, so a processing thread can
+	work on earlier samples while this one polls.
+
 	:param handle: The device identifier returned by ``open_unit``.
 	:type handle: PicoHandle
 	:param streaming_data_info: Data structures to be populated with buffer
@@ -1181,7 +1252,7 @@ def get_streaming_latest_values(
 	streaming_info_ptr = c_cast(addressof(streaming_info_array), c_void_p)
 	streaming_trigger_array = (PicoStreamingDataTriggerInfo * streaming_info_count)()
 	streaming_trigger_ptr = c_cast(addressof(streaming_trigger_array), c_void_p)
-	status = PicoStatus(
+	status = _wrap(
 		_get_streaming_latest_values(
 			handle, streaming_info_ptr, streaming_info_count, streaming_trigger_ptr
 		)
@@ -1189,9 +1260,7 @@ def get_streaming_latest_values(
 	return status, streaming_info_array, streaming_trigger_array
 
 
-_no_of_streaming_values = _dll.ps6000aNoOfStreamingValues
-_no_of_streaming_values.restype = c_uint32
-_no_of_streaming_values.argtypes = [c_int16, c_void_p]
+_no_of_streaming_values = _bind("ps6000aNoOfStreamingValues", [c_int16, c_void_p])
 
 
 def no_of_streaming_values(handle: PicoHandle) -> tuple[PicoStatus, int]:
@@ -1207,13 +1276,11 @@ def no_of_streaming_values(handle: PicoHandle) -> tuple[PicoStatus, int]:
 	:rtype: tuple[PicoStatus, int]
 	"""
 	no_of_values = c_uint64()
-	status = PicoStatus(_no_of_streaming_values(handle, byref(no_of_values)))
+	status = _wrap(_no_of_streaming_values(handle, byref(no_of_values)))
 	return status, no_of_values.value
 
 
-_stop = _dll.ps6000aStop
-_stop.restype = c_uint32
-_stop.argtypes = [c_int16]
+_stop = _bind("ps6000aStop", [c_int16])
 
 
 def stop(handle: PicoHandle) -> PicoStatus:
@@ -1236,12 +1303,12 @@ def stop(handle: PicoHandle) -> PicoStatus:
 	:return: Status.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(_stop(handle))
+	return _wrap(_stop(handle))
 
 
-_get_trigger_info = _dll.ps6000aGetTriggerInfo
-_get_trigger_info.restype = c_uint32
-_get_trigger_info.argtypes = [c_int16, c_void_p, c_uint64, c_uint64]
+_get_trigger_info = _bind(
+	"ps6000aGetTriggerInfo", [c_int16, c_void_p, c_uint64, c_uint64]
+)
 
 
 def get_trigger_info(
@@ -1271,16 +1338,19 @@ def get_trigger_info(
 	:rtype: tuple[PicoStatus, Array[PicoTriggerInfo]]
 	"""
 	trigger_info = (PicoTriggerInfo * segment_count)()
-	trigger_info_p = c_cast(addressof(trigger_info), c_void_p)
-	status = PicoStatus(
-		_get_trigger_info(handle, trigger_info_p, first_segment_index, segment_count)
-	)
-	return status, trigger_info
+	if _HAVE_FAST:
+		code = _fast.get_trigger_info(
+			handle, addressof(trigger_info), first_segment_index, segment_count
+		)
+	else:
+		trigger_info_p = c_cast(addressof(trigger_info), c_void_p)
+		code = _get_trigger_info(
+			handle, trigger_info_p, first_segment_index, segment_count
+		)
+	return _wrap(code), trigger_info
 
 
-_enumerate_units = _dll.ps6000aEnumerateUnits
-_enumerate_units.restype = c_uint32
-_enumerate_units.argtypes = [c_void_p, c_char_p, c_void_p]
+_enumerate_units = _bind("ps6000aEnumerateUnits", [c_void_p, c_char_p, c_void_p])
 
 
 def enumerate_units(parameters: str = "") -> tuple[PicoStatus, int, str]:
@@ -1332,16 +1402,14 @@ def enumerate_units(parameters: str = "") -> tuple[PicoStatus, int, str]:
 		parameters.encode("ASCII"), serials_length.value
 	)
 	serials_char_p = c_cast(addressof(serials_chars), c_char_p)
-	status = PicoStatus(
+	status = _wrap(
 		_enumerate_units(byref(count), serials_char_p, byref(serials_length))
 	)
 	serials_string = serials_chars.value.decode("ASCII")
 	return status, count.value, serials_string
 
 
-_ping_unit = _dll.ps6000aPingUnit
-_ping_unit.restype = c_uint32
-_ping_unit.argtypes = [c_int16]
+_ping_unit = _bind("ps6000aPingUnit", [c_int16])
 
 
 def ping_unit(handle: PicoHandle) -> PicoStatus:
@@ -1356,12 +1424,12 @@ def ping_unit(handle: PicoHandle) -> PicoStatus:
 	:return: Status.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(_ping_unit(handle))
+	return _wrap(_ping_unit(handle))
 
 
-_get_analogue_offset_limits = _dll.ps6000aGetAnalogueOffsetLimits
-_get_analogue_offset_limits.restype = c_uint32
-_get_analogue_offset_limits.argtypes = [c_int16, c_uint32, c_uint32, c_void_p, c_void_p]
+_get_analogue_offset_limits = _bind(
+	"ps6000aGetAnalogueOffsetLimits", [c_int16, c_uint32, c_uint32, c_void_p, c_void_p]
+)
 
 
 def get_analog_offset_limits(
@@ -1386,7 +1454,7 @@ def get_analog_offset_limits(
 	"""
 	maximum_voltage = c_double()
 	minimum_voltage = c_double()
-	status = PicoStatus(
+	status = _wrap(
 		_get_analogue_offset_limits(
 			handle, range_, coupling, byref(maximum_voltage), byref(minimum_voltage)
 		)
@@ -1394,15 +1462,10 @@ def get_analog_offset_limits(
 	return status, minimum_voltage.value, maximum_voltage.value
 
 
-_get_minimum_timebase_stateless = _dll.ps6000aGetMinimumTimebaseStateless
-_get_minimum_timebase_stateless.restype = c_uint32
-_get_minimum_timebase_stateless.argtypes = [
-	c_int16,
-	c_uint32,
-	c_void_p,
-	c_void_p,
-	c_uint32,
-]
+_get_minimum_timebase_stateless = _bind(
+	"ps6000aGetMinimumTimebaseStateless",
+	[c_int16, c_uint32, c_void_p, c_void_p, c_uint32],
+)
 
 
 def get_minimum_timebase_stateless(
@@ -1436,7 +1499,7 @@ def get_minimum_timebase_stateless(
 	"""
 	timebase = c_uint32()
 	time_interval = c_double()
-	status = PicoStatus(
+	status = _wrap(
 		_get_minimum_timebase_stateless(
 			handle,
 			enabled_channel_flags,
@@ -1448,16 +1511,10 @@ def get_minimum_timebase_stateless(
 	return status, timebase.value, time_interval.value
 
 
-_nearest_sample_interval_stateless = _dll.ps6000aNearestSampleIntervalStateless
-_nearest_sample_interval_stateless.restype = c_uint32
-_nearest_sample_interval_stateless.argtypes = [
-	c_int16,
-	c_uint32,
-	c_double,
-	c_uint32,
-	c_void_p,
-	c_void_p,
-]
+_nearest_sample_interval_stateless = _bind(
+	"ps6000aNearestSampleIntervalStateless",
+	[c_int16, c_uint32, c_double, c_uint32, c_void_p, c_void_p],
+)
 
 
 def nearest_sample_interval_stateless(
@@ -1494,7 +1551,7 @@ def nearest_sample_interval_stateless(
 	"""
 	timebase = c_uint32()
 	time_interval_available = c_double()
-	status = PicoStatus(
+	status = _wrap(
 		_nearest_sample_interval_stateless(
 			handle,
 			enabled_channel_flags,
@@ -1507,9 +1564,7 @@ def nearest_sample_interval_stateless(
 	return status, timebase.value, time_interval_available.value
 
 
-_set_device_resolution = _dll.ps6000aSetDeviceResolution
-_set_device_resolution.restype = c_uint32
-_set_device_resolution.argtypes = [c_int16, c_uint32]
+_set_device_resolution = _bind("ps6000aSetDeviceResolution", [c_int16, c_uint32])
 
 
 def set_device_resolution(
@@ -1536,12 +1591,10 @@ def set_device_resolution(
 	:return: Status.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(_set_device_resolution(handle, resolution))
+	return _wrap(_set_device_resolution(handle, resolution))
 
 
-_get_device_resolution = _dll.ps6000aGetDeviceResolution
-_get_device_resolution.restype = c_uint32
-_get_device_resolution.argtypes = [c_int16, c_void_p]
+_get_device_resolution = _bind("ps6000aGetDeviceResolution", [c_int16, c_void_p])
 
 
 def get_device_resolution(
@@ -1558,13 +1611,11 @@ def get_device_resolution(
 	:rtype: tuple[PicoStatus, PicoDeviceResolution]
 	"""
 	resolution = c_uint32()
-	status = PicoStatus(_get_device_resolution(handle, byref(resolution)))
+	status = _wrap(_get_device_resolution(handle, byref(resolution)))
 	return status, PicoDeviceResolution(resolution.value)
 
 
-_get_scaling_values = _dll.ps6000aGetScalingValues
-_get_scaling_values.restype = c_uint32
-_get_scaling_values.argtypes = [c_int16, c_void_p, c_int16]
+_get_scaling_values = _bind("ps6000aGetScalingValues", [c_int16, c_void_p, c_int16])
 
 
 def get_scaling_values(
@@ -1587,14 +1638,10 @@ def get_scaling_values(
 		*scaling_values
 	)
 	scaling_values_ptr = c_cast(addressof(scaling_values_array), c_void_p)
-	return PicoStatus(
-		_get_scaling_values(handle, scaling_values_ptr, scaling_values_count)
-	)
+	return _wrap(_get_scaling_values(handle, scaling_values_ptr, scaling_values_count))
 
 
-_get_adc_limits = _dll.ps6000aGetAdcLimits
-_get_adc_limits.restype = c_uint32
-_get_adc_limits.argtypes = [c_int16, c_uint32, c_void_p, c_void_p]
+_get_adc_limits = _bind("ps6000aGetAdcLimits", [c_int16, c_uint32, c_void_p, c_void_p])
 
 
 def get_adc_limits(
@@ -1614,9 +1661,12 @@ def get_adc_limits(
 	:return: Status, then minimum sample value, then maximum sample value.
 	:rtype: tuple[PicoStatus, int, int]
 	"""
+	if _HAVE_FAST:
+		code, min_int, max_int = _fast.get_adc_limits(handle, resolution)
+		return _wrap(code), min_int, max_int
 	min_value = c_int16()
 	max_value = c_int16()
-	status = PicoStatus(
+	status = _wrap(
 		_get_adc_limits(handle, resolution, byref(min_value), byref(max_value))
 	)
 	return status, min_value.value, max_value.value
@@ -1678,8 +1728,19 @@ def run_block(
 	:rtype: Tuple[PicoStatus, float]
 	"""
 	time_indisposed_ms = c_double()
-	status = PicoStatus(
-		_run_block(
+	if _HAVE_FAST:
+		code = _fast.run_block(
+			handle,
+			no_of_pre_trigger_samples,
+			no_of_post_trigger_samples,
+			timebase,
+			addressof(time_indisposed_ms),
+			segment_index,
+			_address(cb_ready),
+			_address(cb_parameter),
+		)
+	else:
+		code = _run_block(
 			handle,
 			no_of_pre_trigger_samples,
 			no_of_post_trigger_samples,
@@ -1689,13 +1750,10 @@ def run_block(
 			cb_ready,
 			cb_parameter,
 		)
-	)
-	return status, time_indisposed_ms.value
+	return _wrap(code), time_indisposed_ms.value
 
 
-_is_ready = _dll.ps6000aIsReady
-_is_ready.restype = c_uint32
-_is_ready.argtypes = [c_int16, c_void_p]
+_is_ready = _bind("ps6000aIsReady", [c_int16, c_void_p])
 
 
 def is_ready(handle: PicoHandle) -> tuple[PicoStatus, bool]:
@@ -1719,21 +1777,17 @@ def is_ready(handle: PicoHandle) -> tuple[PicoStatus, bool]:
 	:rtype: Tuple[PicoStatus, bool]
 	"""
 	ready = c_int16()
-	status = PicoStatus(_is_ready(handle, byref(ready)))
-	return status, bool(ready.value)
+	if _HAVE_FAST:
+		code = _fast.is_ready(handle, addressof(ready))
+	else:
+		code = _is_ready(handle, byref(ready))
+	return _wrap(code), bool(ready.value)
 
 
-_get_values = _dll.ps6000aGetValues
-_get_values.restype = c_uint32
-_get_values.argtypes = [
-	c_int16,
-	c_uint64,
-	c_void_p,
-	c_uint64,
-	c_uint32,
-	c_uint64,
-	c_void_p,
-]
+_get_values = _bind(
+	"ps6000aGetValues",
+	[c_int16, c_uint64, c_void_p, c_uint64, c_uint32, c_uint64, c_void_p],
+)
 
 
 def get_values(
@@ -1752,7 +1806,8 @@ def get_values(
 	the stored data from the scope after data collection has stopped, and
 	store it in a user buffer previously passed to ``ps6000aSetDataBuffer()``
 	or ``ps6000aSetDataBuffers()``. It blocks the calling function while
-	retrieving data.
+	retrieving data, but releases the GIL, so other Python threads keep
+	running during large transfers.
 
 	:param handle: The device identifier returned by ``open_unit``.
 	:type handle: PicoHandle
@@ -1781,10 +1836,70 @@ def get_values(
 
 	:rtype: Tuple[PicoStatus, int, PicoChannelFlags]
 	"""
+	code, n_samples, overflow = objmode_get_values(
+		handle,
+		start_index,
+		no_of_samples,
+		down_sample_ratio,
+		down_sample_ratio_mode,
+		segment_index,
+	)
+	return _wrap(code), n_samples, PicoChannelFlags(overflow)
+
+
+def objmode_get_values(
+	handle: int,
+	start_index: int,
+	no_of_samples: int,
+	down_sample_ratio: int,
+	down_sample_ratio_mode: int,
+	segment_index: int,
+) -> tuple[int, int, int]:
+	"""
+	Retrieve block-mode data, returning only plain integers.
+
+	This is the implementation behind ``get_values``, which only converts the
+	results to enums. No enum objects are constructed here, so the results can
+	be passed straight back into numba-compiled code through an ``objmode``
+	block::
+
+		@numba.njit
+		def kernel(handle, n, ...):
+			...
+			with numba.objmode(st="uint32", n_ret="uint64", ov="int16"):
+				st, n_ret, ov = objmode_get_values(handle, 0, n, 1, 0, 0)
+			...
+
+	:param handle: The device identifier returned by ``open_unit``.
+	:type handle: int
+	:param start_index: See ``get_values``.
+	:type start_index: int
+	:param no_of_samples: See ``get_values``.
+	:type no_of_samples: int
+	:param down_sample_ratio: See ``get_values``.
+	:type down_sample_ratio: int
+	:param down_sample_ratio_mode: See ``get_values``.
+	:type down_sample_ratio_mode: int
+	:param segment_index: See ``get_values``.
+	:type segment_index: int
+	:return: Raw status code, then the actual number of raw samples retrieved,
+		then the raw overvoltage channel flags.
+	:rtype: tuple[int, int, int]
+	"""
 	c_no_of_samples = c_uint64(no_of_samples)
 	overflow = c_int16()
-	status = PicoStatus(
-		_get_values(
+	if _HAVE_FAST:
+		status = _fast.get_values(
+			handle,
+			start_index,
+			addressof(c_no_of_samples),
+			down_sample_ratio,
+			down_sample_ratio_mode,
+			segment_index,
+			addressof(overflow),
+		)
+	else:
+		status = _get_values(
 			handle,
 			start_index,
 			byref(c_no_of_samples),
@@ -1793,24 +1908,17 @@ def get_values(
 			segment_index,
 			byref(overflow),
 		)
-	)
-	return status, c_no_of_samples.value, PicoChannelFlags(overflow.value)
+	return status, c_no_of_samples.value, overflow.value
 
 
 # Functions below this line are not planned to be "Pythonized".
 # Actually, I'd like to do the rest of the block mode stuff at some point.
 # But don't hold your breath for the signal generator.
 
-_get_accessory_info = _dll.ps6000aGetAccessoryInfo
-_get_accessory_info.restype = c_uint32
-_get_accessory_info.argtypes = [
-	c_int16,
-	c_uint32,
-	c_char_p,
-	c_int16,
-	c_void_p,
-	c_uint16,
-]
+_get_accessory_info = _bind(
+	"ps6000aGetAccessoryInfo",
+	[c_int16, c_uint32, c_char_p, c_int16, c_void_p, c_uint16],
+)
 
 
 def get_accessory_info(
@@ -1839,14 +1947,14 @@ def get_accessory_info(
 	:return: (ps6000aGetAccessoryInfo) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(
+	return _wrap(
 		_get_accessory_info(handle, channel, string, string_length, required_size, info)
 	)
 
 
-_sig_gen_waveform = _dll.ps6000aSigGenWaveform
-_sig_gen_waveform.restype = c_uint32
-_sig_gen_waveform.argtypes = [c_int16, c_uint32, c_void_p, c_uint16]
+_sig_gen_waveform = _bind(
+	"ps6000aSigGenWaveform", [c_int16, c_uint32, c_void_p, c_uint16]
+)
 
 
 def sig_gen_waveform(
@@ -1855,6 +1963,9 @@ def sig_gen_waveform(
 	"""
 	Call ps6000aSigGenWaveform (autogenerated documentation).
 
+	A reusable, aligned waveform buffer can be obtained from
+	``ps6000a.buffers.make_waveform_buffer``.
+
 	:param handle: (int16_t)handle.
 	:type handle: PicoHandle
 	:param wavetype: (PICO_WAVE_TYPE)wavetype.
@@ -1866,12 +1977,10 @@ def sig_gen_waveform(
 	:return: (ps6000aSigGenWaveform) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(_sig_gen_waveform(handle, wavetype, buffer, buffer_length))
+	return _wrap(_sig_gen_waveform(handle, wavetype, buffer, buffer_length))
 
 
-_sig_gen_range = _dll.ps6000aSigGenRange
-_sig_gen_range.restype = c_uint32
-_sig_gen_range.argtypes = [c_int16, c_double, c_double]
+_sig_gen_range = _bind("ps6000aSigGenRange", [c_int16, c_double, c_double])
 
 
 def sig_gen_range(
@@ -1889,12 +1998,12 @@ def sig_gen_range(
 	:return: (ps6000aSignGenRange) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(_sig_gen_range(handle, peak_to_peak_volts, offset_volts))
+	return _wrap(_sig_gen_range(handle, peak_to_peak_volts, offset_volts))
 
 
-_sig_gen_waveform_duty_cycle = _dll.ps6000aSigGenWaveformDutyCycle
-_sig_gen_waveform_duty_cycle.restype = c_uint32
-_sig_gen_waveform_duty_cycle.argtypes = [c_int16, c_double]
+_sig_gen_waveform_duty_cycle = _bind(
+	"ps6000aSigGenWaveformDutyCycle", [c_int16, c_double]
+)
 
 
 def sig_gen_waveform_duty_cycle(
@@ -1910,12 +2019,12 @@ def sig_gen_waveform_duty_cycle(
 	:return: (ps6000aSigGenWaveformDutyCycle) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(_sig_gen_waveform_duty_cycle(handle, duty_cycle_percent))
+	return _wrap(_sig_gen_waveform_duty_cycle(handle, duty_cycle_percent))
 
 
-_sig_gen_trigger = _dll.ps6000aSigGenTrigger
-_sig_gen_trigger.restype = c_uint32
-_sig_gen_trigger.argtypes = [c_int16, c_uint32, c_uint32, c_uint64, c_uint64]
+_sig_gen_trigger = _bind(
+	"ps6000aSigGenTrigger", [c_int16, c_uint32, c_uint32, c_uint64, c_uint64]
+)
 
 
 def sig_gen_trigger(
@@ -1941,16 +2050,14 @@ def sig_gen_trigger(
 	:return: (ps6000aSigGenTrigger) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(
+	return _wrap(
 		_sig_gen_trigger(
 			handle, trigger_type, trigger_source, cycles, auto_trigger_pico_seconds
 		)
 	)
 
 
-_sig_gen_filter = _dll.ps6000aSigGenFilter
-_sig_gen_filter.restype = c_uint32
-_sig_gen_filter.argtypes = [c_int16, c_uint32]
+_sig_gen_filter = _bind("ps6000aSigGenFilter", [c_int16, c_uint32])
 
 
 def sig_gen_filter(handle: PicoHandle, filter_state: int) -> PicoStatus:
@@ -1964,12 +2071,10 @@ def sig_gen_filter(handle: PicoHandle, filter_state: int) -> PicoStatus:
 	:return: (ps6000aSigGenFilter) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(_sig_gen_filter(handle, filter_state))
+	return _wrap(_sig_gen_filter(handle, filter_state))
 
 
-_sig_gen_frequency = _dll.ps6000aSigGenFrequency
-_sig_gen_frequency.restype = c_uint32
-_sig_gen_frequency.argtypes = [c_int16, c_double]
+_sig_gen_frequency = _bind("ps6000aSigGenFrequency", [c_int16, c_double])
 
 
 def sig_gen_frequency(handle: PicoHandle, frequency_hz: float) -> PicoStatus:
@@ -1983,12 +2088,12 @@ def sig_gen_frequency(handle: PicoHandle, frequency_hz: float) -> PicoStatus:
 	:return: (ps6000aSigGenFrequency) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(_sig_gen_frequency(handle, frequency_hz))
+	return _wrap(_sig_gen_frequency(handle, frequency_hz))
 
 
-_sig_gen_frequency_sweep = _dll.ps6000aSigGenFrequencySweep
-_sig_gen_frequency_sweep.restype = c_uint32
-_sig_gen_frequency_sweep.argtypes = [c_int16, c_double, c_double, c_double, c_uint32]
+_sig_gen_frequency_sweep = _bind(
+	"ps6000aSigGenFrequencySweep", [c_int16, c_double, c_double, c_double, c_uint32]
+)
 
 
 def sig_gen_frequency_sweep(
@@ -2014,7 +2119,7 @@ def sig_gen_frequency_sweep(
 	:return: (ps6000aSigGenFrequencySweep) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(
+	return _wrap(
 		_sig_gen_frequency_sweep(
 			handle,
 			stop_frequency_hz,
@@ -2025,9 +2130,7 @@ def sig_gen_frequency_sweep(
 	)
 
 
-_sig_gen_phase = _dll.ps6000aSigGenPhase
-_sig_gen_phase.restype = c_uint32
-_sig_gen_phase.argtypes = [c_int16, c_uint64]
+_sig_gen_phase = _bind("ps6000aSigGenPhase", [c_int16, c_uint64])
 
 
 def sig_gen_phase(handle: PicoHandle, delta_phase: int) -> PicoStatus:
@@ -2041,12 +2144,12 @@ def sig_gen_phase(handle: PicoHandle, delta_phase: int) -> PicoStatus:
 	:return: (ps6000aSigGenPhase) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(_sig_gen_phase(handle, delta_phase))
+	return _wrap(_sig_gen_phase(handle, delta_phase))
 
 
-_sig_gen_phase_sweep = _dll.ps6000aSigGenPhaseSweep
-_sig_gen_phase_sweep.restype = c_uint32
-_sig_gen_phase_sweep.argtypes = [c_int16, c_uint64, c_uint64, c_uint64, c_uint32]
+_sig_gen_phase_sweep = _bind(
+	"ps6000aSigGenPhaseSweep", [c_int16, c_uint64, c_uint64, c_uint64, c_uint32]
+)
 
 
 def sig_gen_phase_sweep(
@@ -2072,16 +2175,14 @@ def sig_gen_phase_sweep(
 	:return: (ps6000aSigGenPhaseSweep) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(
+	return _wrap(
 		_sig_gen_phase_sweep(
 			handle, stop_delta_phase, delta_phase_increment, dwell_count, sweep_type
 		)
 	)
 
 
-_sig_gen_clock_manual = _dll.ps6000aSigGenClockManual
-_sig_gen_clock_manual.restype = c_uint32
-_sig_gen_clock_manual.argtypes = [c_int16, c_double, c_uint64]
+_sig_gen_clock_manual = _bind("ps6000aSigGenClockManual", [c_int16, c_double, c_uint64])
 
 
 def sig_gen_clock_manual(
@@ -2099,14 +2200,12 @@ def sig_gen_clock_manual(
 	:return: (ps6000aSigGenClockManual) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(
-		_sig_gen_clock_manual(handle, dac_clock_frequency, prescale_ratio)
-	)
+	return _wrap(_sig_gen_clock_manual(handle, dac_clock_frequency, prescale_ratio))
 
 
-_sig_gen_software_trigger_control = _dll.ps6000aSigGenSoftwareTriggerControl
-_sig_gen_software_trigger_control.restype = c_uint32
-_sig_gen_software_trigger_control.argtypes = [c_int16, c_uint32]
+_sig_gen_software_trigger_control = _bind(
+	"ps6000aSigGenSoftwareTriggerControl", [c_int16, c_uint32]
+)
 
 
 def sig_gen_software_trigger_control(
@@ -2122,23 +2221,24 @@ def sig_gen_software_trigger_control(
 	:return: (ps6000aSigGenSoftwareTriggerControl) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(_sig_gen_software_trigger_control(handle, trigger_state))
-
-
-_sig_gen_apply = _dll.ps6000aSigGenApply
-_sig_gen_apply.restype = c_uint32
-_sig_gen_apply.argtypes = [
-	c_int16,
-	c_int16,
-	c_int16,
-	c_int16,
-	c_int16,
-	c_int16,
-	c_void_p,
-	c_void_p,
-	c_void_p,
-	c_void_p,
-]
+	return _wrap(_sig_gen_software_trigger_control(handle, trigger_state))
+
+
+_sig_gen_apply = _bind(
+	"ps6000aSigGenApply",
+	[
+		c_int16,
+		c_int16,
+		c_int16,
+		c_int16,
+		c_int16,
+		c_int16,
+		c_void_p,
+		c_void_p,
+		c_void_p,
+		c_void_p,
+	],
+)
 
 
 def sig_gen_apply(
@@ -2179,7 +2279,7 @@ def sig_gen_apply(
 	:return: (ps6000aSigGenApply) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(
+	return _wrap(
 		_sig_gen_apply(
 			handle,
 			sig_gen_enabled,
@@ -2195,9 +2295,9 @@ def sig_gen_apply(
 	)
 
 
-_sig_gen_limits = _dll.ps6000aSigGenLimits
-_sig_gen_limits.restype = c_uint32
-_sig_gen_limits.argtypes = [c_int16, c_uint32, c_double, c_double, c_double]
+_sig_gen_limits = _bind(
+	"ps6000aSigGenLimits", [c_int16, c_uint32, c_double, c_double, c_double]
+)
 
 
 def sig_gen_limits(
@@ -2223,7 +2323,7 @@ def sig_gen_limits(
 	:return: (ps6000aSigGenLimits) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(
+	return _wrap(
 		_sig_gen_limits(
 			handle,
 			parameter,
@@ -2234,22 +2334,23 @@ def sig_gen_limits(
 	)
 
 
-_sig_gen_frequency_limits = _dll.ps6000aSigGenFrequencyLimits
-_sig_gen_frequency_limits.restype = c_uint32
-_sig_gen_frequency_limits.argtypes = [
-	c_int16,
-	c_uint32,
-	c_void_p,
-	c_void_p,
-	c_int16,
-	c_void_p,
-	c_void_p,
-	c_void_p,
-	c_void_p,
-	c_void_p,
-	c_void_p,
-	c_void_p,
-]
+_sig_gen_frequency_limits = _bind(
+	"ps6000aSigGenFrequencyLimits",
+	[
+		c_int16,
+		c_uint32,
+		c_void_p,
+		c_void_p,
+		c_int16,
+		c_void_p,
+		c_void_p,
+		c_void_p,
+		c_void_p,
+		c_void_p,
+		c_void_p,
+		c_void_p,
+	],
+)
 
 
 def sig_gen_frequency_limits(
@@ -2296,7 +2397,7 @@ def sig_gen_frequency_limits(
 	:return: (ps6000aSigGenFrequencyLimits) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(
+	return _wrap(
 		_sig_gen_frequency_limits(
 			handle,
 			wave_type,
@@ -2314,9 +2415,7 @@ def sig_gen_frequency_limits(
 	)
 
 
-_sig_gen_pause = _dll.ps6000aSigGenPause
-_sig_gen_pause.restype = c_uint32
-_sig_gen_pause.argtypes = [c_int16]
+_sig_gen_pause = _bind("ps6000aSigGenPause", [c_int16])
 
 
 def sig_gen_pause(handle: PicoHandle) -> PicoStatus:
@@ -2328,12 +2427,10 @@ def sig_gen_pause(handle: PicoHandle) -> PicoStatus:
 	:return: (ps6000aSigGenPause) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(_sig_gen_pause(handle))
+	return _wrap(_sig_gen_pause(handle))
 
 
-_sig_gen_restart = _dll.ps6000aSigGenRestart
-_sig_gen_restart.restype = c_uint32
-_sig_gen_restart.argtypes = [c_int16]
+_sig_gen_restart = _bind("ps6000aSigGenRestart", [c_int16])
 
 
 def sig_gen_restart(handle: PicoHandle) -> PicoStatus:
@@ -2345,12 +2442,12 @@ def sig_gen_restart(handle: PicoHandle) -> PicoStatus:
 	:return: (ps6000aSigGenRestart) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(_sig_gen_restart(handle))
+	return _wrap(_sig_gen_restart(handle))
 
 
-_set_pulse_width_qualifier_properties = _dll.ps6000aSetPulseWidthQualifierProperties
-_set_pulse_width_qualifier_properties.restype = c_uint32
-_set_pulse_width_qualifier_properties.argtypes = [c_int16, c_uint32, c_uint32, c_uint32]
+_set_pulse_width_qualifier_properties = _bind(
+	"ps6000aSetPulseWidthQualifierProperties", [c_int16, c_uint32, c_uint32, c_uint32]
+)
 
 
 def set_pulse_width_qualifier_properties(
@@ -2370,14 +2467,12 @@ def set_pulse_width_qualifier_properties(
 	:return: (ps6000aSetPulseWidthQualifierProperties) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(
-		_set_pulse_width_qualifier_properties(handle, lower, upper, type_)
-	)
+	return _wrap(_set_pulse_width_qualifier_properties(handle, lower, upper, type_))
 
 
-_set_pulse_width_qualifier_conditions = _dll.ps6000aSetPulseWidthQualifierConditions
-_set_pulse_width_qualifier_conditions.restype = c_uint32
-_set_pulse_width_qualifier_conditions.argtypes = [c_int16, c_void_p, c_int16, c_uint32]
+_set_pulse_width_qualifier_conditions = _bind(
+	"ps6000aSetPulseWidthQualifierConditions", [c_int16, c_void_p, c_int16, c_uint32]
+)
 
 
 def set_pulse_width_qualifier_conditions(
@@ -2397,14 +2492,14 @@ def set_pulse_width_qualifier_conditions(
 	:return: (ps6000aSetPulseWidthQualifierConditions) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(
+	return _wrap(
 		_set_pulse_width_qualifier_conditions(handle, conditions, n_conditions, action)
 	)
 
 
-_set_pulse_width_qualifier_directions = _dll.ps6000aSetPulseWidthQualifierDirections
-_set_pulse_width_qualifier_directions.restype = c_uint32
-_set_pulse_width_qualifier_directions.argtypes = [c_int16, c_void_p, c_int16]
+_set_pulse_width_qualifier_directions = _bind(
+	"ps6000aSetPulseWidthQualifierDirections", [c_int16, c_void_p, c_int16]
+)
 
 
 def set_pulse_width_qualifier_directions(
@@ -2422,14 +2517,14 @@ def set_pulse_width_qualifier_directions(
 	:return: (ps6000aSetPulseWidthQualifierDirections) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(
+	return _wrap(
 		_set_pulse_width_qualifier_directions(handle, directions, n_directions)
 	)
 
 
-_set_trigger_digital_port_properties = _dll.ps6000aSetTriggerDigitalPortProperties
-_set_trigger_digital_port_properties.restype = c_uint32
-_set_trigger_digital_port_properties.argtypes = [c_int16, c_uint32, c_void_p, c_int16]
+_set_trigger_digital_port_properties = _bind(
+	"ps6000aSetTriggerDigitalPortProperties", [c_int16, c_uint32, c_void_p, c_int16]
+)
 
 
 def set_trigger_digital_port_properties(
@@ -2449,21 +2544,14 @@ def set_trigger_digital_port_properties(
 	:return: (ps6000aSetTriggerDigitalPortProperties) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(
+	return _wrap(
 		_set_trigger_digital_port_properties(handle, port, directions, n_directions)
 	)
 
 
-_set_pulse_width_digital_port_properties = (
-	_dll.ps6000aSetPulseWidthDigitalPortProperties
+_set_pulse_width_digital_port_properties = _bind(
+	"ps6000aSetPulseWidthDigitalPortProperties", [c_int16, c_uint32, c_void_p, c_int16]
 )
-_set_pulse_width_digital_port_properties.restype = c_uint32
-_set_pulse_width_digital_port_properties.argtypes = [
-	c_int16,
-	c_uint32,
-	c_void_p,
-	c_int16,
-]
 
 
 def set_pulse_width_digital_port_properties(
@@ -2483,14 +2571,14 @@ def set_pulse_width_digital_port_properties(
 	:return: (ps6000aSetPulseWidthDigitalPortProperties) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(
+	return _wrap(
 		_set_pulse_width_digital_port_properties(handle, port, directions, n_directions)
 	)
 
 
-_get_trigger_time_offset = _dll.ps6000aGetTriggerTimeOffset
-_get_trigger_time_offset.restype = c_uint32
-_get_trigger_time_offset.argtypes = [c_int16, c_void_p, c_void_p, c_uint64]
+_get_trigger_time_offset = _bind(
+	"ps6000aGetTriggerTimeOffset", [c_int16, c_void_p, c_void_p, c_uint64]
+)
 
 
 def get_trigger_time_offset(
@@ -2510,18 +2598,13 @@ def get_trigger_time_offset(
 	:return: (ps6000aGetTriggerTimeOffset) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(_get_trigger_time_offset(handle, time, time_units, segment_index))
+	return _wrap(_get_trigger_time_offset(handle, time, time_units, segment_index))
 
 
-_get_values_trigger_time_offset_bulk = _dll.ps6000aGetValuesTriggerTimeOffsetBulk
-_get_values_trigger_time_offset_bulk.restype = c_uint32
-_get_values_trigger_time_offset_bulk.argtypes = [
-	c_int16,
-	c_void_p,
-	c_void_p,
-	c_uint64,
-	c_uint64,
-]
+_get_values_trigger_time_offset_bulk = _bind(
+	"ps6000aGetValuesTriggerTimeOffsetBulk",
+	[c_int16, c_void_p, c_void_p, c_uint64, c_uint64],
+)
 
 
 def get_values_trigger_time_offset_bulk(
@@ -2547,39 +2630,23 @@ def get_values_trigger_time_offset_bulk(
 	:return: (ps6000aGetValuesTriggerTimeOffsetBulk) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(
+	return _wrap(
 		_get_values_trigger_time_offset_bulk(
 			handle, time, time_units, from_segement_index, to_segment_index
 		)
 	)
 
 
-_run_block = _dll.ps6000aRunBlock
-_run_block.restype = c_uint32
-_run_block.argtypes = [
-	c_int16,
-	c_uint64,
-	c_uint64,
-	c_uint32,
-	c_void_p,
-	c_uint64,
-	c_void_p,
-	c_void_p,
-]
+_run_block = _bind(
+	"ps6000aRunBlock",
+	[c_int16, c_uint64, c_uint64, c_uint32, c_void_p, c_uint64, c_void_p, c_void_p],
+)
 
 
-_get_values_bulk = _dll.ps6000aGetValuesBulk
-_get_values_bulk.restype = c_uint32
-_get_values_bulk.argtypes = [
-	c_int16,
-	c_uint64,
-	c_void_p,
-	c_uint64,
-	c_uint64,
-	c_uint64,
-	c_uint32,
-	c_void_p,
-]
+_get_values_bulk = _bind(
+	"ps6000aGetValuesBulk",
+	[c_int16, c_uint64, c_void_p, c_uint64, c_uint64, c_uint64, c_uint32, c_void_p],
+)
 
 
 def get_values_bulk(
@@ -2614,7 +2681,20 @@ def get_values_bulk(
 	:return: (ps6000aGetValuesBulk) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(
+	if _HAVE_FAST:
+		return _wrap(
+			_fast.get_values_bulk(
+				handle,
+				start_index,
+				_address(no_of_samples),
+				from_segment_index,
+				to_segment_index,
+				down_sample_ratio,
+				down_sample_ratio_mode,
+				_address(overflow),
+			)
+		)
+	return _wrap(
 		_get_values_bulk(
 			handle,
 			start_index,
@@ -2628,18 +2708,10 @@ def get_values_bulk(
 	)
 
 
-_get_values_async = _dll.ps6000aGetValuesAsync
-_get_values_async.restype = c_uint32
-_get_values_async.argtypes = [
-	c_int16,
-	c_uint64,
-	c_uint64,
-	c_uint64,
-	c_uint32,
-	c_uint64,
-	c_void_p,
-	c_void_p,
-]
+_get_values_async = _bind(
+	"ps6000aGetValuesAsync",
+	[c_int16, c_uint64, c_uint64, c_uint64, c_uint32, c_uint64, c_void_p, c_void_p],
+)
 
 
 def get_values_async(
@@ -2674,7 +2746,7 @@ def get_values_async(
 	:return: (ps6000aGetValuesAsync) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(
+	return _wrap(
 		_get_values_async(
 			handle,
 			start_index,
@@ -2688,19 +2760,20 @@ def get_values_async(
 	)
 
 
-_get_values_bulk_async = _dll.ps6000aGetValuesBulkAsync
-_get_values_bulk_async.restype = c_uint32
-_get_values_bulk_async.argtypes = [
-	c_int16,
-	c_uint64,
-	c_uint64,
-	c_uint64,
-	c_uint64,
-	c_uint64,
-	c_uint32,
-	c_void_p,
-	c_void_p,
-]
+_get_values_bulk_async = _bind(
+	"ps6000aGetValuesBulkAsync",
+	[
+		c_int16,
+		c_uint64,
+		c_uint64,
+		c_uint64,
+		c_uint64,
+		c_uint64,
+		c_uint32,
+		c_void_p,
+		c_void_p,
+	],
+)
 
 
 def get_values_bulk_async(
@@ -2738,7 +2811,7 @@ def get_values_bulk_async(
 	:return: (ps6000aGetValuesBulkAsync) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(
+	return _wrap(
 		_get_values_bulk_async(
 			handle,
 			start_index,
@@ -2753,18 +2826,10 @@ def get_values_bulk_async(
 	)
 
 
-_get_values_overlapped = _dll.ps6000aGetValuesOverlapped
-_get_values_overlapped.restype = c_uint32
-_get_values_overlapped.argtypes = [
-	c_int16,
-	c_uint64,
-	c_void_p,
-	c_uint64,
-	c_uint32,
-	c_uint64,
-	c_uint64,
-	c_void_p,
-]
+_get_values_overlapped = _bind(
+	"ps6000aGetValuesOverlapped",
+	[c_int16, c_uint64, c_void_p, c_uint64, c_uint32, c_uint64, c_uint64, c_void_p],
+)
 
 
 def get_values_overlapped(
@@ -2799,7 +2864,7 @@ def get_values_overlapped(
 	:return: (ps6000aGetValuesOverlapped) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(
+	return _wrap(
 		_get_values_overlapped(
 			handle,
 			start_index,
@@ -2813,9 +2878,9 @@ def get_values_overlapped(
 	)
 
 
-_stop_using_get_values_overlapped = _dll.ps6000aStopUsingGetValuesOverlapped
-_stop_using_get_values_overlapped.restype = c_uint32
-_stop_using_get_values_overlapped.argtypes = [c_int16]
+_stop_using_get_values_overlapped = _bind(
+	"ps6000aStopUsingGetValuesOverlapped", [c_int16]
+)
 
 
 def stop_using_get_values_overlapped(handle: PicoHandle) -> PicoStatus:
@@ -2827,12 +2892,10 @@ def stop_using_get_values_overlapped(handle: PicoHandle) -> PicoStatus:
 	:return: (ps6000aStopUsingGetValuesOverlapped) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(_stop_using_get_values_overlapped(handle))
+	return _wrap(_stop_using_get_values_overlapped(handle))
 
 
-_get_no_of_captures = _dll.ps6000aGetNoOfCaptures
-_get_no_of_captures.restype = c_uint32
-_get_no_of_captures.argtypes = [c_int16, c_void_p]
+_get_no_of_captures = _bind("ps6000aGetNoOfCaptures", [c_int16, c_void_p])
 
 
 def get_no_of_captures(handle: PicoHandle, n_captures: c_void_p) -> PicoStatus:
@@ -2846,12 +2909,12 @@ def get_no_of_captures(handle: PicoHandle, n_captures: c_void_p) -> PicoStatus:
 	:return: (ps6000aGetNoOfCaptures) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(_get_no_of_captures(handle, n_captures))
+	return _wrap(_get_no_of_captures(handle, n_captures))
 
 
-_get_no_of_processed_captures = _dll.ps6000aGetNoOfProcessedCaptures
-_get_no_of_processed_captures.restype = c_uint32
-_get_no_of_processed_captures.argtypes = [c_int16, c_void_p]
+_get_no_of_processed_captures = _bind(
+	"ps6000aGetNoOfProcessedCaptures", [c_int16, c_void_p]
+)
 
 
 def get_no_of_processed_captures(
@@ -2867,12 +2930,19 @@ def get_no_of_processed_captures(
 	:return: (ps6000aGetNoOfProcessedCaptures) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(_get_no_of_processed_captures(handle, n_processed_captures))
+	return _wrap(_get_no_of_processed_captures(handle, n_processed_captures))
 
 
-_set_no_of_captures = _dll.ps6000aSetNoOfCaptures
-_set_no_of_captures.restype = c_uint32
-_set_no_of_captures.argtypes = [c_int16, c_uint64]
+# Neither ctypes nor the native bindings range check unsigned arguments (values
+# are silently truncated or wrapped), so sizes that come straight from the
+# caller are checked here before the call.
+_UINT8_MAX = 0xFF
+_UINT64_MAX = 0xFFFF_FFFF_FFFF_FFFF
+
+_set_no_of_captures = _bind("ps6000aSetNoOfCaptures", [c_int16, c_uint64])
+_set_no_of_captures_impl: Callable[..., int] = _set_no_of_captures
+if _HAVE_FAST:
+	_set_no_of_captures_impl = _fast.set_no_of_captures
 
 
 def set_no_of_captures(handle: PicoHandle, n_captures: int) -> PicoStatus:
@@ -2885,13 +2955,14 @@ def set_no_of_captures(handle: PicoHandle, n_captures: int) -> PicoStatus:
 	:type n_captures: int
 	:return: (ps6000aSetNoOfCaptures) result.
 	:rtype: PicoStatus
+	:raises ValueError: Will raise if ``n_captures`` does not fit in a uint64_t.
 	"""
-	return PicoStatus(_set_no_of_captures(handle, n_captures))
+	if not 0 <= n_captures <= _UINT64_MAX:
+		raise ValueError(f"Invalid number of captures {n_captures}")
+	return _wrap(_set_no_of_captures_impl(handle, n_captures))
 
 
-_query_output_edge_detect = _dll.ps6000aQueryOutputEdgeDetect
-_query_output_edge_detect.restype = c_uint32
-_query_output_edge_detect.argtypes = [c_int16, c_void_p]
+_query_output_edge_detect = _bind("ps6000aQueryOutputEdgeDetect", [c_int16, c_void_p])
 
 
 def query_output_edge_detect(handle: PicoHandle, state: c_void_p) -> PicoStatus:
@@ -2905,12 +2976,13 @@ def query_output_edge_detect(handle: PicoHandle, state: c_void_p) -> PicoStatus:
 	:return: (ps6000aQueryOutputEdgeDetect) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(_query_output_edge_detect(handle, state))
+	return _wrap(_query_output_edge_detect(handle, state))
 
 
-_set_output_edge_detect = _dll.ps6000aSetOutputEdgeDetect
-_set_output_edge_detect.restype = c_uint32
-_set_output_edge_detect.argtypes = [c_int16, c_int16]
+_set_output_edge_detect = _bind("ps6000aSetOutputEdgeDetect", [c_int16, c_int16])
+_set_output_edge_detect_impl: Callable[..., int] = _set_output_edge_detect
+if _HAVE_FAST:
+	_set_output_edge_detect_impl = _fast.set_output_edge_detect
 
 
 def set_output_edge_detect(handle: PicoHandle, state: int) -> PicoStatus:
@@ -2924,12 +2996,42 @@ def set_output_edge_detect(handle: PicoHandle, state: int) -> PicoStatus:
 	:return: (ps6000aSetOutputEdgeDetect) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(_set_output_edge_detect(handle, state))
+	return _wrap(_set_output_edge_detect_impl(handle, state))
 
 
-_check_for_update = _dll.ps6000aCheckForUpdate
-_check_for_update.restype = c_uint32
-_check_for_update.argtypes = [c_int16, c_void_p, c_void_p, c_void_p]
+def configure_capture(
+	handle: PicoHandle, n_captures: int, edge_state: int
+) -> PicoStatus:
+	"""
+	Set the number of rapid block captures and the output edge detect state.
+
+	Equivalent to ``set_no_of_captures`` followed by ``set_output_edge_detect``,
+	stopping at the first failure. With the native bindings available this is a
+	single call into compiled code.
+
+	:param handle: The device identifier returned by ``open_unit``.
+	:type handle: PicoHandle
+	:param n_captures: Number of captures, as for ``set_no_of_captures``.
+	:type n_captures: int
+	:param edge_state: Edge detect state, as for ``set_output_edge_detect``.
+	:type edge_state: int
+	:return: Status of the first failed call, or of the last call.
+	:rtype: PicoStatus
+	:raises ValueError: Will raise if ``n_captures`` does not fit in a uint64_t.
+	"""
+	if not 0 <= n_captures <= _UINT64_MAX:
+		raise ValueError(f"Invalid number of captures {n_captures}")
+	if _HAVE_FAST:
+		return _wrap(_fast.configure_capture(handle, n_captures, edge_state))
+	status = _wrap(_set_no_of_captures(handle, n_captures))
+	if status != PicoStatus.OK:
+		return status
+	return _wrap(_set_output_edge_detect(handle, edge_state))
+
+
+_check_for_update = _bind(
+	"ps6000aCheckForUpdate", [c_int16, c_void_p, c_void_p, c_void_p]
+)
 
 
 def check_for_update(
@@ -2938,6 +3040,9 @@ def check_for_update(
 	"""
 	Call ps6000aCheckForUpdate (autogenerated documentation).
 
+	The GIL is released for the duration of the call, so other Python threads
+	keep running while the driver talks to the device.
+
 	:param handle: (int16_t)handle.
 	:type handle: PicoHandle
 	:param current: (PICO_VERSION*)current.
@@ -2949,12 +3054,10 @@ def check_for_update(
 	:return: (ps6000aCheckForUpdate) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(_check_for_update(handle, current, update, update_required))
+	return _wrap(_check_for_update(handle, current, update, update_required))
 
 
-_start_firmware_update = _dll.ps6000aStartFirmwareUpdate
-_start_firmware_update.restype = c_uint32
-_start_firmware_update.argtypes = [c_int16, c_void_p]
+_start_firmware_update = _bind("ps6000aStartFirmwareUpdate", [c_int16, c_void_p])
 
 
 def start_firmware_update(
@@ -2963,6 +3066,10 @@ def start_firmware_update(
 	"""
 	Call ps6000aStartFirmwareUpdate (autogenerated documentation).
 
+	This call blocks until the update has finished, which can take many
+	seconds. The GIL is released for the duration of the call, so other Python
+	threads keep running; ``progress`` reacquires it each time it is called.
+
 	:param handle: (int16_t)handle.
 	:type handle: PicoHandle
 	:param progress: (PicoUpdateFirmwareProgress)progress.
@@ -2970,78 +3077,121 @@ def start_firmware_update(
 	:return: (ps6000aStartFirmwareUpdate) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(_start_firmware_update(handle, progress))
+	return _wrap(_start_firmware_update(handle, progress))
+
+
+def _overvoltage_tripped_array(
+	out: Optional[np.ndarray], n_channels: int
+) -> np.ndarray:
+	"""
+	Check or allocate an array to receive overvoltage trip status.
+
+	:param out: Existing array to check, or None to allocate a new one.
+	:type out: Optional[np.ndarray]
+	:param n_channels: Number of elements to allocate if ``out`` is None.
+	:type n_channels: int
+	:return: Array of ``CHANNEL_OVERVOLTAGE_TRIPPED_DTYPE``.
+	:rtype: np.ndarray
+	:raises ValueError: Will raise if ``out`` has the wrong dtype, is not
+		contiguous, or has more elements than fit in a uint8_t.
+	"""
+	if out is None:
+		if not 0 <= n_channels <= _UINT8_MAX:
+			raise ValueError(f"Invalid overvoltage status count {n_channels}")
+		return np.zeros(n_channels, dtype=CHANNEL_OVERVOLTAGE_TRIPPED_DTYPE)
+	if len(out) > _UINT8_MAX:
+		raise ValueError(f"Invalid overvoltage status array length {len(out)}")
+	if out.dtype != CHANNEL_OVERVOLTAGE_TRIPPED_DTYPE:
+		raise ValueError(f"Invalid overvoltage status array dtype {out.dtype}")
+	if not out.flags.c_contiguous:
+		raise ValueError("Overvoltage status array must be contiguous")
+	return out
 
 
-_reset_channels_and_report_all_channels_overvoltage_trip_status = (
-	_dll.ps6000aResetChannelsAndReportAllChannelsOvervoltageTripStatus
+_reset_channels_and_report_all_channels_overvoltage_trip_status = _bind(
+	"ps6000aResetChannelsAndReportAllChannelsOvervoltageTripStatus",
+	[c_int16, c_void_p, c_uint8],
 )
-_reset_channels_and_report_all_channels_overvoltage_trip_status.restype = c_uint32
-_reset_channels_and_report_all_channels_overvoltage_trip_status.argtypes = [
-	c_int16,
-	c_void_p,
-	c_uint8,
-]
 
 
 def reset_channels_and_report_all_channels_overvoltage_trip_status(
 	handle: PicoHandle,
-	all_channels_tripped_status: c_void_p,
-	n_channel_tripped_status: int,
-) -> PicoStatus:
+	all_channels_tripped_status: Optional[np.ndarray] = None,
+	n_channel_tripped_status: int = 8,
+) -> tuple[PicoStatus, np.ndarray]:
 	"""
 	Call ps6000aResetChannelsAndReportAllChannelsOvervoltageTripStatus (no documentation available).
 
 	:param handle: (int16_t)handle.
 	:type handle: PicoHandle
 	:param all_channels_tripped_status: (PICO_CHANNEL_OVERVOLTAGE_TRIPPED*)allChannelsTrippedStatus.
-	:type all_channels_tripped_status: PicoChannelOvervoltageTripped
+		Array of ``CHANNEL_OVERVOLTAGE_TRIPPED_DTYPE`` to fill in. Optional,
+		allocated if None. Pass the same array on every call when polling.
+	:type all_channels_tripped_status: Optional[np.ndarray]
 	:param n_channel_tripped_status: (uint8_t)nChannelTrippedStatus.
+		Number of elements to allocate, if ``all_channels_tripped_status`` is
+		None. Ignored otherwise.
 	:type n_channel_tripped_status: int
-	:return: (ps6000aSetProbeInteractionCallback) result.
-	:rtype: PicoStatus
-	"""
-	return PicoStatus(
+	:return: (ps6000aResetChannelsAndReportAllChannelsOvervoltageTripStatus)
+		result, then the filled-in array.
+	:rtype: tuple[PicoStatus, np.ndarray]
+	:raises ValueError: Will raise if ``all_channels_tripped_status`` has the
+		wrong dtype, is not contiguous, or is too long, or if
+		``n_channel_tripped_status`` does not fit in a uint8_t.
+	"""
+	out = _overvoltage_tripped_array(
+		all_channels_tripped_status, n_channel_tripped_status
+	)
+	status = _wrap(
 		_reset_channels_and_report_all_channels_overvoltage_trip_status(
-			handle, all_channels_tripped_status, n_channel_tripped_status
+			handle, out.ctypes.data, len(out)
 		)
 	)
+	return status, out
 
 
-_report_all_channels_overvoltage_trip_status = (
-	_dll.ps6000aReportAllChannelsOvervoltageTripStatus
+_report_all_channels_overvoltage_trip_status = _bind(
+	"ps6000aReportAllChannelsOvervoltageTripStatus", [c_int16, c_void_p, c_uint8]
 )
-_report_all_channels_overvoltage_trip_status.restype = c_uint32
-_report_all_channels_overvoltage_trip_status.argtypes = [c_int16, c_void_p, c_uint8]
 
 
 def report_all_channels_overvoltage_trip_status(
 	handle: PicoHandle,
-	all_channels_tripped_status: c_void_p,
-	n_channel_tripped_status: int,
-) -> PicoStatus:
+	all_channels_tripped_status: Optional[np.ndarray] = None,
+	n_channel_tripped_status: int = 8,
+) -> tuple[PicoStatus, np.ndarray]:
 	"""
 	Call ps6000aReportAllChannelsOvervoltageTripStatus (no documentation available).
 
 	:param handle: (int16_t)handle.
 	:type handle: PicoHandle
 	:param all_channels_tripped_status: (PICO_CHANNEL_OVERVOLTAGE_TRIPPED*)allChannelsTrippedStatus.
-	:type all_channels_tripped_status: PicoChannelOvervoltageTripped
+		Array of ``CHANNEL_OVERVOLTAGE_TRIPPED_DTYPE`` to fill in. Optional,
+		allocated if None. Pass the same array on every call when polling.
+	:type all_channels_tripped_status: Optional[np.ndarray]
 	:param n_channel_tripped_status: (uint8_t)nChannelTrippedStatus.
+		Number of elements to allocate, if ``all_channels_tripped_status`` is
+		None. Ignored otherwise.
 	:type n_channel_tripped_status: int
-	:return: (ps6000aSetProbeInteractionCallback) result.
-	:rtype: PicoStatus
-	"""
-	return PicoStatus(
-		_report_all_channels_overvoltage_trip_status(
-			handle, all_channels_tripped_status, n_channel_tripped_status
-		)
+	:return: (ps6000aReportAllChannelsOvervoltageTripStatus) result, then the
+		filled-in array.
+	:rtype: tuple[PicoStatus, np.ndarray]
+	:raises ValueError: Will raise if ``all_channels_tripped_status`` has the
+		wrong dtype, is not contiguous, or is too long, or if
+		``n_channel_tripped_status`` does not fit in a uint8_t.
+	"""
+	out = _overvoltage_tripped_array(
+		all_channels_tripped_status, n_channel_tripped_status
+	)
+	status = _wrap(
+		_report_all_channels_overvoltage_trip_status(handle, out.ctypes.data, len(out))
 	)
+	return status, out
 
 
-_set_probe_interaction_callback = _dll.ps6000aSetDigitalPortInteractionCallback
-_set_probe_interaction_callback.restype = c_uint32
-_set_probe_interaction_callback.argtypes = [c_int16, c_void_p]
+_set_digital_port_interaction_callback = _bind(
+	"ps6000aSetDigitalPortInteractionCallback", [c_int16, c_void_p]
+)
 
 
 def set_digital_port_interaction_callback(
@@ -3054,15 +3204,15 @@ def set_digital_port_interaction_callback(
 	:type handle: PicoHandle
 	:param callback: (PicoDigitalPortInteractions)callback.
 	:type callback: DigitalPortInteractionsCType
-	:return: (ps6000aSetProbeInteractionCallback) result.
+	:return: (ps6000aSetDigitalPortInteractionCallback) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(_set_probe_interaction_callback(handle, callback))
+	return _wrap(_set_digital_port_interaction_callback(handle, callback))
 
 
-_set_probe_interaction_callback = _dll.ps6000aSetProbeInteractionCallback
-_set_probe_interaction_callback.restype = c_uint32
-_set_probe_interaction_callback.argtypes = [c_int16, c_void_p]
+_set_probe_interaction_callback = _bind(
+	"ps6000aSetProbeInteractionCallback", [c_int16, c_void_p]
+)
 
 
 def set_probe_interaction_callback(
@@ -3078,14 +3228,12 @@ def set_probe_interaction_callback(
 	:return: (ps6000aSetProbeInteractionCallback) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(_set_probe_interaction_callback(handle, callback))
+	return _wrap(_set_probe_interaction_callback(handle, callback))
 
 
-_set_external_reference_interaction_callback = (
-	_dll.ps6000aSetExternalReferenceInteractionCallback
+_set_external_reference_interaction_callback = _bind(
+	"ps6000aSetExternalReferenceInteractionCallback", [c_int16, c_void_p]
 )
-_set_external_reference_interaction_callback.restype = c_uint32
-_set_external_reference_interaction_callback.argtypes = [c_int16, c_void_p]
 
 
 def set_external_reference_interaction_callback(
@@ -3101,12 +3249,12 @@ def set_external_reference_interaction_callback(
 	:return: (ps6000aSetExternalReferenceInteractionCallback) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(_set_external_reference_interaction_callback(handle, callback))
+	return _wrap(_set_external_reference_interaction_callback(handle, callback))
 
 
-_set_awg_overrange_interaction_callback = _dll.ps6000aSetAWGOverrangeInteractionCallback
-_set_awg_overrange_interaction_callback.restype = c_uint32
-_set_awg_overrange_interaction_callback.argtypes = [c_int16, c_void_p]
+_set_awg_overrange_interaction_callback = _bind(
+	"ps6000aSetAWGOverrangeInteractionCallback", [c_int16, c_void_p]
+)
 
 
 def set_awg_overrange_interaction_callback(
@@ -3122,14 +3270,12 @@ def set_awg_overrange_interaction_callback(
 	:return: (ps6000aSetAWGOverrangeInteractionCallback) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(_set_awg_overrange_interaction_callback(handle, callback))
+	return _wrap(_set_awg_overrange_interaction_callback(handle, callback))
 
 
-_set_temperature_sensor_interaction_callback = (
-	_dll.ps6000aSetTemperatureSensorInteractionCallback
+_set_temperature_sensor_interaction_callback = _bind(
+	"ps6000aSetTemperatureSensorInteractionCallback", [c_int16, c_void_p]
 )
-_set_temperature_sensor_interaction_callback.restype = c_uint32
-_set_temperature_sensor_interaction_callback.argtypes = [c_int16, c_void_p]
 
 
 def set_temperature_sensor_interaction_callback(
@@ -3145,12 +3291,12 @@ def set_temperature_sensor_interaction_callback(
 	:return: (ps6000aSetTemperatureSensorInteractionCallback) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(_set_temperature_sensor_interaction_callback(handle, callback))
+	return _wrap(_set_temperature_sensor_interaction_callback(handle, callback))
 
 
-_set_probe_user_action_callback = _dll.ps6000aSetProbeUserActionCallback
-_set_probe_user_action_callback.restype = c_uint32
-_set_probe_user_action_callback.argtypes = [c_int16, c_void_p, c_void_p]
+_set_probe_user_action_callback = _bind(
+	"ps6000aSetProbeUserActionCallback", [c_int16, c_void_p, c_void_p]
+)
 
 
 def set_probe_user_action_callback(
@@ -3168,18 +3314,13 @@ def set_probe_user_action_callback(
 	:return: (ps6000aSetTemperatureSensorInteractioNCallback) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(_set_probe_user_action_callback(handle, callback, p_parameter))
+	return _wrap(_set_probe_user_action_callback(handle, callback, p_parameter))
 
 
-_channel_combinations_stateless = _dll.ps6000aChannelCombinationsStateless
-_channel_combinations_stateless.restype = c_uint32
-_channel_combinations_stateless.argtypes = [
-	c_int16,
-	c_void_p,
-	c_void_p,
-	c_uint32,
-	c_uint32,
-]
+_channel_combinations_stateless = _bind(
+	"ps6000aChannelCombinationsStateless",
+	[c_int16, c_void_p, c_void_p, c_uint32, c_uint32],
+)
 
 
 def channel_combinations_stateless(
@@ -3205,7 +3346,7 @@ def channel_combinations_stateless(
 	:return: (ps6000aChannelCombinationsStateless) result.
 	:rtype: PicoStatus
 	"""
-	return PicoStatus(
+	return _wrap(
 		_channel_combinations_stateless(
 			handle,
 			channel_flags_combinations,
@@ -3214,3 +3355,172 @@ def channel_combinations_stateless(
 			timebase,
 		)
 	)
+
+
+_MAX_CHANNEL_COMBINATIONS = 1024
+_channel_combinations_cache: dict[
+	tuple[int, int, int], tuple[PicoChannelFlags, ...]
+] = {}
+
+
+def channel_combinations_stateless_cached(
+	handle: PicoHandle, resolution: PicoDeviceResolution, timebase: int
+) -> tuple[PicoStatus, tuple[PicoChannelFlags, ...]]:
+	"""
+	Call ps6000aChannelCombinationsStateless, caching successful results.
+
+	The valid channel combinations only depend on the device, the resolution,
+	and the timebase, so the result of the first successful call for each
+	``(handle, resolution, timebase)`` is kept and returned by later calls
+	without talking to the device. The cache for a handle is cleared by
+	``close_unit``, or can be cleared with ``clear_channel_combinations_cache``.
+
+	:param handle: The device identifier returned by ``open_unit``.
+	:type handle: PicoHandle
+	:param resolution: The device resolution to check.
+	:type resolution: PicoDeviceResolution
+	:param timebase: The timebase to check.
+	:type timebase: int
+	:return: Status, then the valid channel combinations (empty on failure).
+	:rtype: tuple[PicoStatus, tuple[PicoChannelFlags, ...]]
+	"""
+	key = (int(handle), int(resolution), timebase)
+	combinations = _channel_combinations_cache.get(key)
+	if combinations is not None:
+		return PicoStatus.OK, combinations
+
+	flags = (c_uint32 * _MAX_CHANNEL_COMBINATIONS)()
+	n_flags = c_uint32(_MAX_CHANNEL_COMBINATIONS)
+	status = _wrap(
+		_channel_combinations_stateless(
+			handle, flags, byref(n_flags), resolution, timebase
+		)
+	)
+	if status != PicoStatus.OK:
+		return status, ()
+	combinations = tuple(PicoChannelFlags(f) for f in flags[: n_flags.value])
+	_channel_combinations_cache[key] = combinations
+	return status, combinations
+
+
+def clear_channel_combinations_cache(handle: Optional[PicoHandle] = None) -> None:
+	"""
+	Clear results cached by ``channel_combinations_stateless_cached``.
+
+	:param handle: Only clear results for this device, or everything if None.
+	:type handle: Optional[PicoHandle]
+	"""
+	if handle is None:
+		_channel_combinations_cache.clear()
+		return
+	for key in [k for k in _channel_combinations_cache if k[0] == handle]:
+		del _channel_combinations_cache[key]
+
+
+# Low-overhead API.
+# The aliases below are the raw driver functions, with argument types already
+# set. They take the same arguments as the C functions (pointers included) and
+# return the raw status code as a plain int, skipping one Python frame and the
+# enum construction per call. Callers in tight acquisition loops can compare
+# the result against ``PicoStatus.OK`` directly and only call ``to_status`` on
+# failure.
+
+
+def get_function_address(name: str) -> int:
+	"""
+	Get the address of a driver function, for calling it from native code.
+
+	:param name: Name of the driver function, e.g. ``"ps6000aSetNoOfCaptures"``.
+	:type name: str
+	:return: Address of the function in the loaded driver.
+	:rtype: int
+	:raises AttributeError: Will raise if the driver has no such function.
+	"""
+	return _address(getattr(_dll, name))
+
+
+_NUMBA_TYPE_NAMES = {
+	c_char_p: "voidptr",
+	c_double: "float64",
+	c_int16: "int16",
+	c_int32: "int32",
+	c_uint8: "uint8",
+	c_uint16: "uint16",
+	c_uint32: "uint32",
+	c_uint64: "uint64",
+	c_void_p: "voidptr",
+}
+
+
+def get_function_signature(name: str) -> str:
+	"""
+	Get the signature of a driver function as a Numba signature string.
+
+	Together with ``get_function_address`` this is enough to declare the
+	function for Numba (or any other FFI that understands these type names),
+	e.g. ``"uint32(int16, voidptr)"`` for ``"ps6000aQueryOutputEdgeDetect"``.
+	Pointer arguments of every type are given as ``voidptr``.
+
+	:param name: Name of the driver function, e.g. ``"ps6000aSetNoOfCaptures"``.
+	:type name: str
+	:return: Signature, with the return type first.
+	:rtype: str
+	:raises KeyError: Will raise if the function is not bound by this module.
+	"""
+	restype, *argtypes = _signatures[name]
+	args = ", ".join(_NUMBA_TYPE_NAMES[t] for t in argtypes)
+	return f"{_NUMBA_TYPE_NAMES[restype]}({args})"
+
+
+def get_function_signatures() -> dict[str, str]:
+	"""
+	Get the signatures of all bound driver functions, by name.
+
+	:return: Signatures as returned by ``get_function_signature``.
+	:rtype: dict[str, str]
+	"""
+	return {name: get_function_signature(name) for name in _signatures}
+
+
+def to_status(code: int) -> PicoStatus:
+	"""
+	Convert a raw status code from the low-overhead API into a ``PicoStatus``.
+
+	:param code: Raw status code returned by one of the ``raw_*`` functions.
+	:type code: int
+	:return: Matching status.
+	:rtype: PicoStatus
+	"""
+	return _wrap(code)
+
+
+raw_set_data_buffers = _set_data_buffers
+raw_run_block = _run_block
+raw_is_ready = _is_ready
+raw_get_values = _get_values
+raw_get_values_bulk = _get_values_bulk
+raw_get_values_async = _get_values_async
+raw_get_values_bulk_async = _get_values_bulk_async
+raw_get_values_overlapped = _get_values_overlapped
+raw_get_streaming_latest_values = _get_streaming_latest_values
+raw_no_of_streaming_values = _no_of_streaming_values
+raw_get_trigger_info = _get_trigger_info
+
+
+def warmup() -> None:
+	"""
+	Call the block mode polling functions once, with an invalid handle.
+
+	The first call into the driver (and through the native bindings, if
+	available) is noticeably slower than later ones. This makes that first
+	call up front, so it does not land in the middle of an acquisition. Only
+	functions that read from the device are called, and the handle is never
+	valid, so the calls fail without side effects.
+	"""
+	handle = PicoHandle(0)
+	is_ready(handle)
+	get_values(handle, 0, 0, 1, PicoRatioMode.RAW, 0)
+	n_captures = c_uint64()
+	get_no_of_captures(handle, c_void_p(addressof(n_captures)))
+	state = c_int16()
+	query_output_edge_detect(handle, c_void_p(addressof(state)))
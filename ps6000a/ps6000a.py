@@ -19,11 +19,24 @@
 ###############################################################################
 
 from collections import defaultdict
-from ctypes import Array
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from ctypes import Array, addressof, memset, sizeof
 import logging
-from typing import Any, Optional, Sequence
-
-from ps6000a.buffers import Buffer, BufferClass, BufferMaxMin
+import threading
+import time
+from typing import Callable, Iterator, NoReturn, Optional, Sequence, Union
+from weakref import WeakValueDictionary
+
+import numpy as np
+
+from ps6000a.buffers import (
+	Buffer,
+	BufferClass,
+	BufferMaxMin,
+	get_buffer_class,
+	make_data_array,
+)
 from ps6000a.callbacks import BlockReadyCallback, wrap_block_ready
 from ps6000a.constants import (
 	PicoAction,
@@ -44,6 +57,7 @@ from ps6000a.constants import (
 )
 from ps6000a.exceptions import PicoHandleError, PicoStatusError
 import ps6000a.functions as ll
+from ps6000a.settings import ChannelSettings, TriggerSettings
 from ps6000a.types import (
 	PicoCondition,
 	PicoDirection,
@@ -57,6 +71,33 @@ from ps6000a.types import (
 
 logger = logging.getLogger(__name__)
 
+# Driver functions called once or more per capture, bound here to save a module
+# attribute lookup per call in acquisition loops.
+_get_adc_limits = ll.get_adc_limits
+_get_streaming_latest_values = ll.get_streaming_latest_values
+_get_values = ll.get_values
+_is_ready = ll.is_ready
+_raw_set_data_buffers = ll.raw_set_data_buffers
+_no_of_streaming_values = ll.no_of_streaming_values
+_run_block = ll.run_block
+_set_data_buffers = ll.set_data_buffers
+_stop = ll.stop
+
+MIN_POOLED_BUFFER_BYTES = 4096
+"""Released buffers smaller than this are not kept for reuse."""
+
+MAX_POOLED_BUFFERS = 4
+"""Most released buffers kept for reuse per data type and length."""
+
+ENUMERATION_CACHE_TTL = 2.0
+"""Seconds for which ``PS6000A.enumerate_units`` results are reused."""
+
+# Unit info items that may change while a unit is open, and are not cached.
+_UNCACHED_INFO = frozenset({PicoInfo.SHADOW_CAL})
+
+# Results of enumerate_units by parameter string: time, count, serials.
+_enumeration_cache: dict[str, tuple[float, int, str]] = {}
+
 
 class PS6000A:
 	"""
@@ -65,6 +106,11 @@ class PS6000A:
 	Encapsulates handle and exception management but does not automate top-level
 	acquisition flows.
 
+	Every driver call releases the GIL while it waits on the device (see
+	``ps6000a.functions``), so other Python threads keep running during slow
+	calls such as ``open_unit``, ``get_values`` or ``ping_unit``. Instances are
+	not otherwise thread-safe; use one thread per instance, or serialize calls.
+
 	:ivar raw_handle: The currently-held handle, if any, which may be invalid.
 	:type raw_handle: Optional[PicoHandle]
 	:ivar last_status: The status result of the last run method. Defaults
@@ -72,9 +118,36 @@ class PS6000A:
 	:type last_status: PicoStatus
 	"""
 
-	raw_handle: Optional[PicoHandle]
+	__slots__ = (
+		"_raw_handle",
+		"_valid_handle",
+		"last_status",
+		"buffers",
+		"_buffer_pool",
+		"_pool_arrays",
+		"_info_cache",
+		"_max_memory_cache",
+		"_max_segments_cache",
+		"_streaming_info_cache",
+		"_buffer_count",
+		"_pending_buffers",
+		"__weakref__",
+	)
+
+	_raw_handle: Optional[PicoHandle]
+	_valid_handle: Optional[PicoHandle]
 	last_status: PicoStatus
-	buffers: dict[BufferClass, set[Buffer]]
+	buffers: dict[BufferClass, list[Buffer]]
+	_buffer_pool: dict[tuple[PicoDataType, int], list[Array]]
+	_pool_arrays: "WeakValueDictionary[int, Array]"
+	_info_cache: dict[PicoInfo, str]
+	_max_memory_cache: dict[PicoDeviceResolution, int]
+	_max_segments_cache: dict[tuple[int, int, PicoDeviceResolution], int]
+	_streaming_info_cache: Optional[list[PicoStreamingDataInfo]]
+	_buffer_count: int
+	_pending_buffers: Optional[
+		dict[tuple[BufferClass, PicoRatioMode], tuple[Buffer, Optional[Array], bool]]
+	]
 
 	def __init__(self) -> None:
 		"""
@@ -83,9 +156,39 @@ class PS6000A:
 		Note that this will NOT open any hardware. Call ``open_unit`` or use
 		async opening flow before calling any non-static functions.
 		"""
-		self.raw_handle: Optional[PicoHandle] = None
+		self.raw_handle = None
 		self.last_status: PicoStatus = PicoStatus.NOT_YET_RUN
-		self.buffers: dict[BufferClass, set[Buffer]] = defaultdict(set)
+		self.buffers: dict[BufferClass, list[Buffer]] = {}
+		self._buffer_pool: dict[tuple[PicoDataType, int], list[Array]] = defaultdict(
+			list
+		)
+		# Arrays handed out by ``_allocate_buffer`` and not yet released, by id;
+		# only these may be pooled.
+		self._pool_arrays: WeakValueDictionary[int, Array] = WeakValueDictionary()
+		self._info_cache: dict[PicoInfo, str] = {}
+		self._max_memory_cache: dict[PicoDeviceResolution, int] = {}
+		self._max_segments_cache: dict[tuple[int, int, PicoDeviceResolution], int] = {}
+		self._streaming_info_cache: Optional[list[PicoStreamingDataInfo]] = None
+		self._buffer_count = 0
+		self._pending_buffers = None
+
+	@property
+	def raw_handle(self) -> Optional[PicoHandle]:
+		"""
+		Get or set the currently-held handle, if any, which may be invalid.
+
+		:getter: Get the currently-held handle.
+		:setter: Set the currently-held handle.
+		:return: The currently-held handle, or None.
+		:rtype: Optional[PicoHandle]
+		"""
+		return self._raw_handle
+
+	@raw_handle.setter
+	def raw_handle(self, handle: Optional[PicoHandle]) -> None:
+		self._raw_handle = handle
+		# Checked once here, rather than on every call to _raw_handle_checked.
+		self._valid_handle = handle if handle else None
 
 	@property
 	def handle(self) -> PicoHandle:
@@ -97,10 +200,39 @@ class PS6000A:
 		:raise PicoHandleException: Will raise if no handle is held or the
 			currently held handle is invalid.
 		"""
-		if self.raw_handle is not None and self.raw_handle.valid:
-			return self.raw_handle
-		else:
-			raise PicoHandleError(self.raw_handle)
+		return self._raw_handle_checked()
+
+	def _raw_handle_checked(self) -> PicoHandle:
+		"""
+		Get handle to hardware device, as for the ``handle`` property.
+
+		This is what every method here calls first. The handle is validated
+		when ``raw_handle`` is set, so this is a single attribute load and
+		``None`` check. The polling methods (``is_ready``, ``get_values``,
+		``get_streaming_latest_values``, ``get_trigger_info``) inline the same
+		check to save the method call. Code calling ``ps6000a.functions``
+		directly in a tight loop can call this once and reuse the handle.
+
+		:return: Valid handle.
+		:rtype: PicoHandle
+		:raise PicoHandleException: Will raise if no handle is held or the
+			currently held handle is invalid.
+		"""
+		handle = self._valid_handle
+		if handle is None:
+			raise PicoHandleError(self._raw_handle)
+		return handle
+
+	def _clear_unit_caches(self) -> None:
+		"""
+		Forget cached information about the open unit.
+
+		:return: None.
+		:rtype: None
+		"""
+		self._info_cache.clear()
+		self._max_memory_cache.clear()
+		self._max_segments_cache.clear()
 
 	def _verify_status(self, status: PicoStatus) -> None:
 		"""
@@ -117,8 +249,24 @@ class PS6000A:
 			``PicoStatus.OK``.
 		"""
 		self.last_status = status
-		if status != PicoStatus.OK:
-			raise PicoStatusError(status)
+		if status:  # PicoStatus.OK is 0.
+			self._raise(status)
+
+	@staticmethod
+	def _raise(status: PicoStatus) -> NoReturn:
+		"""
+		Raise the exception for a failed status, for ``_verify_status``.
+
+		Kept separate so that the success path of ``_verify_status`` stays
+		short.
+
+		:param status: The failed status code.
+		:type status: PicoStatus
+		:return: Never returns.
+		:rtype: NoReturn
+		:raises PicoStatusException: Always.
+		"""
+		raise PicoStatusError(status)
 
 	def open_unit(
 		self, serial: Optional[str], resolution: PicoDeviceResolution
@@ -143,14 +291,65 @@ class PS6000A:
 		:raises PicoStatusException: Will raise if driver returns a status code
 			other than ``PicoStatus.OK``.
 		"""
-		if self.raw_handle is not None and self.raw_handle.valid:
+		if self.raw_handle:
 			logger.warning("open_unit called while a unit is already open.")
 			self.close_unit()
+		PS6000A.invalidate_enumeration_cache()
+		self._clear_unit_caches()
 		status, handle = ll.open_unit(serial, resolution)
 		self._verify_status(status)
 		self.raw_handle = handle
 		return handle.valid
 
+	@staticmethod
+	def open_many(
+		serials: Sequence[str], resolution: PicoDeviceResolution
+	) -> list["PS6000A"]:
+		"""
+		Open several scope devices concurrently.
+
+		Opening a unit takes hundreds of milliseconds, nearly all of it spent in
+		the driver with the GIL released. This calls ``open_unit`` for each
+		serial number on its own thread, so opening several units takes about
+		as long as opening one. Each serial number must refer to a different
+		unit.
+
+		:param serials: Serial numbers of the scopes to open.
+		:type serials: Sequence[str]
+		:param resolution: The required vertical resolution, for all units.
+		:type resolution: PicoDeviceResolution
+		:return: An object for each serial number, in the same order. As for
+			``open_unit``, check that each ``raw_handle`` is valid.
+		:rtype: list[PS6000A]
+		:raises PicoStatusException: Will raise if driver returns a status code
+			other than ``PicoStatus.OK`` for any unit. Units that were opened
+			are closed again first.
+		"""
+		if not serials:
+			return []
+
+		def _open(serial: str) -> PS6000A:
+			scope = PS6000A()
+			scope.open_unit(serial, resolution)
+			return scope
+
+		with ThreadPoolExecutor(max_workers=len(serials)) as executor:
+			futures = [executor.submit(_open, serial) for serial in serials]
+		scopes: list[PS6000A] = []
+		error: Optional[BaseException] = None
+		for future in futures:
+			exception = future.exception()
+			if exception is None:
+				scopes.append(future.result())
+			elif error is None:
+				error = exception
+		if error is not None:
+			for scope in scopes:
+				if scope.raw_handle:
+					scope.close_unit()
+			raise error
+		return scopes
+
 	def open_unit_async(
 		self, serial: Optional[str], resolution: PicoDeviceResolution
 	) -> bool:
@@ -162,6 +361,11 @@ class PS6000A:
 		``open_unit_progress`` until that function indicates the operation is
 		complete.
 
+		The progress can be polled from a different thread than the one that
+		started the operation, e.g. a worker thread while the main thread keeps
+		a UI responsive. ``raw_handle`` is only written once, when the operation
+		completes.
+
 		:param serial: A string containing the serial number of the scope to be
 			opened. Optional. If None, then the function opens the first scope
 			found; otherwise, it tries to open the scope that matches the
@@ -176,7 +380,7 @@ class PS6000A:
 		:raises PicoStatusException: Will raise if driver returns a status code
 			other than ``PicoStatus.OK``.
 		"""
-		if self.raw_handle is not None and self.raw_handle.valid:
+		if self.raw_handle:
 			logger.warning("open_unit_async called while a unit is already open.")
 		status, status2 = ll.open_unit_async(serial, resolution)
 		self._verify_status(status)
@@ -187,7 +391,8 @@ class PS6000A:
 		Get status of opening a unit (ps6000aOpenUnitProgress).
 
 		This function checks on the progress of a request made to
-		``open_unit_async`` to open a scope.
+		``open_unit_async`` to open a scope. It may be called from any thread,
+		but only one thread should poll a given instance.
 
 		:return: True if valid handle was returned, False otherwise (including
 			if opening operation is not completed yet). The handle will be
@@ -196,12 +401,14 @@ class PS6000A:
 		:raises PicoStatusException: Will raise if driver returns a status code
 			other than ``PicoStatus.OK``.
 		"""
-		if self.raw_handle is not None and self.raw_handle.valid:
+		if self.raw_handle:
 			logger.warning("open_unit_progress called while a unit is already open.")
 			self.close_unit()
 		status, handle, progress, complete = ll.open_unit_progress()
 		self._verify_status(status)
 		if complete:
+			PS6000A.invalidate_enumeration_cache()
+			self._clear_unit_caches()
 			self.raw_handle = handle
 		return complete and handle.valid
 
@@ -216,6 +423,12 @@ class PS6000A:
 		only detect devices that are not yet being controlled by an
 		application. To query opened devices, use ``get_unit_info``.
 
+		Enumerating takes several milliseconds per device, so results are
+		cached for ``ENUMERATION_CACHE_TTL`` seconds per ``parameters`` value.
+		Opening or closing a unit through this class clears the cache; call
+		``invalidate_enumeration_cache`` after plugging in a device to see it
+		immediately.
+
 		:param parameters: Can optionally contain the following parameter(s) to
 			request information:
 
@@ -252,11 +465,26 @@ class PS6000A:
 		:raises PicoStatusException: Will raise if driver returns a status code
 			other than ``PicoStatus.OK``.
 		"""
+		now = time.monotonic()
+		cached = _enumeration_cache.get(parameters)
+		if cached is not None and now - cached[0] < ENUMERATION_CACHE_TTL:
+			return cached[1], cached[2]
 		status, count, serials = ll.enumerate_units(parameters)
 		if status != PicoStatus.OK:
 			raise PicoStatusError(status)
+		_enumeration_cache[parameters] = (now, count, serials)
 		return count, serials
 
+	@staticmethod
+	def invalidate_enumeration_cache() -> None:
+		"""
+		Clear cached ``enumerate_units`` results.
+
+		:return: None.
+		:rtype: None
+		"""
+		_enumeration_cache.clear()
+
 	def ping_unit(self) -> None:
 		"""
 		Check if device is still connected (ps6000aPingUnit).
@@ -269,7 +497,7 @@ class PS6000A:
 		:raises PicoStatusException: Will raise if driver returns a status code
 			other than ``PicoStatus.OK``.
 		"""
-		handle = self.handle
+		handle = self._raw_handle_checked()
 		status = ll.ping_unit(handle)
 		self._verify_status(status)
 
@@ -282,6 +510,10 @@ class PS6000A:
 		available to explain why the last open unit call failed. To find out
 		about unopened devices, call ``enumerate_units``.
 
+		Except for ``SHADOW_CAL``, the information cannot change while the unit
+		is open, so each item is only read from the device once, and cached
+		until the unit is closed.
+
 		:param info: ``PicoInfo`` enum tag specifying what information is
 			required.
 		:type info: PicoInfo
@@ -290,9 +522,15 @@ class PS6000A:
 		:raises PicoStatusException: Will raise if driver returns a status code
 			other than ``PicoStatus.OK``.
 		"""
-		handle = self.handle
+		handle = self._raw_handle_checked()
+		info_string = self._info_cache.get(info)
+		if info_string is not None:
+			self.last_status = PicoStatus.OK
+			return info_string
 		status, info_string = ll.get_unit_info(handle, info)
 		self._verify_status(status)
+		if info not in _UNCACHED_INFO:
+			self._info_cache[info] = info_string
 		return info_string
 
 	def close_unit(self) -> None:
@@ -306,7 +544,10 @@ class PS6000A:
 		:raises PicoStatusException: Will raise if driver returns a status code
 			other than ``PicoStatus.OK``.
 		"""
-		handle = self.handle
+		handle = self._raw_handle_checked()
+		PS6000A.invalidate_enumeration_cache()
+		self._clear_unit_caches()
+		self._buffer_pool.clear()
 		status = ll.close_unit(handle)
 		self._verify_status(status)
 		self.raw_handle = None
@@ -333,7 +574,7 @@ class PS6000A:
 		:raises PicoStatusException: Will raise if driver returns a status code
 			other than ``PicoStatus.OK``.
 		"""
-		handle = self.handle
+		handle = self._raw_handle_checked()
 		status = ll.flash_led(handle, start)
 		self._verify_status(status)
 
@@ -360,7 +601,7 @@ class PS6000A:
 		:raises PicoStatusException: Will raise if driver returns a status code
 			other than ``PicoStatus.OK``.
 		"""
-		handle = self.handle
+		handle = self._raw_handle_checked()
 		status, n_max_samples = ll.memory_segments(handle, n_segments)
 		self._verify_status(status)
 		return n_max_samples
@@ -387,7 +628,7 @@ class PS6000A:
 		:raises PicoStatusException: Will raise if driver returns a status code
 			other than ``PicoStatus.OK``.
 		"""
-		handle = self.handle
+		handle = self._raw_handle_checked()
 		status, n_max_segments = ll.memory_segments_by_samples(handle, n_samples)
 		self._verify_status(status)
 		return n_max_segments
@@ -397,7 +638,8 @@ class PS6000A:
 		Get maximium available memory (ps6000aGetMaximumAvailableMemory).
 
 		This function returns the maximum number of samples that can be stored
-		at a given hardware resolution.
+		at a given hardware resolution. The result is cached until the unit is
+		closed.
 
 		:param resolution: The vertical resolution.
 		:type resolution: PicoDeviceResolution
@@ -406,9 +648,14 @@ class PS6000A:
 		:raises PicoStatusException: Will raise if driver returns a status code
 			other than ``PicoStatus.OK``.
 		"""
-		handle = self.handle
+		handle = self._raw_handle_checked()
+		n_max_samples = self._max_memory_cache.get(resolution)
+		if n_max_samples is not None:
+			self.last_status = PicoStatus.OK
+			return n_max_samples
 		status, n_max_samples = ll.get_maximum_available_memory(handle, resolution)
 		self._verify_status(status)
+		self._max_memory_cache[resolution] = n_max_samples
 		return n_max_samples
 
 	def query_max_segments_by_samples(
@@ -418,7 +665,8 @@ class PS6000A:
 		Get number of segments (ps6000aQueryMaxSegmentsBySamples).
 
 		This function returns the maximum number of memory segments available
-		given the number of samples per segment.
+		given the number of samples per segment. The result is cached until the
+		unit is closed.
 
 		:param n_samples: The number of samples per segment.
 		:type n_samples: int
@@ -431,11 +679,17 @@ class PS6000A:
 		:raises PicoStatusException: Will raise if driver returns a status code
 			other than ``PicoStatus.OK``.
 		"""
-		handle = self.handle
+		handle = self._raw_handle_checked()
+		key = (n_samples, n_channels_enabled, resolution)
+		n_max_segments = self._max_segments_cache.get(key)
+		if n_max_segments is not None:
+			self.last_status = PicoStatus.OK
+			return n_max_segments
 		status, n_max_segments = ll.query_max_segments_by_samples(
 			handle, n_samples, n_channels_enabled, resolution
 		)
 		self._verify_status(status)
+		self._max_segments_cache[key] = n_max_segments
 		return n_max_segments
 
 	def set_channel_on(
@@ -475,7 +729,7 @@ class PS6000A:
 		:raises PicoStatusException: Will raise if driver returns a status code
 			other than ``PicoStatus.OK``.
 		"""
-		handle = self.handle
+		handle = self._raw_handle_checked()
 		status = ll.set_channel_on(
 			handle, channel, coupling, range_, analog_offset, bandwidth
 		)
@@ -497,14 +751,14 @@ class PS6000A:
 		:raises PicoStatusException: Will raise if driver returns a status code
 			other than ``PicoStatus.OK``.
 		"""
-		handle = self.handle
+		handle = self._raw_handle_checked()
 		status = ll.set_channel_off(handle, channel)
 		self._verify_status(status)
 
 	def set_digital_port_on(
 		self,
 		port: PicoChannel,
-		logic_threshold_level: Sequence[int],
+		logic_threshold_level: Union[Sequence[int], np.ndarray],
 		hysteresis: PicoDigitalPortHysteresis,
 	) -> None:
 		"""
@@ -523,7 +777,9 @@ class PS6000A:
 		:param logic_threshold_level: A sequence of threshold voltages, one for
 			each port pin, used to distinguish the 0 and 1 states. Range: –32767
 			(–5 V) to 32767 (+5 V). This determines how many pins are enabled.
-		:type logic_threshold_level: Sequence[int]
+			A contiguous ``np.int16`` array is passed to the driver without
+			conversion.
+		:type logic_threshold_level: Union[Sequence[int], np.ndarray]
 		:param hysteresis: The hysteresis to apply to all channels in the port.
 		:type hysteresis: PicoDigitalPortHysteresis
 		:return: None.
@@ -531,7 +787,7 @@ class PS6000A:
 		:raises PicoStatusException: Will raise if driver returns a status code
 			other than ``PicoStatus.OK``.
 		"""
-		handle = self.handle
+		handle = self._raw_handle_checked()
 		status = ll.set_digital_port_on(handle, port, logic_threshold_level, hysteresis)
 		self._verify_status(status)
 
@@ -549,7 +805,7 @@ class PS6000A:
 		:raises PicoStatusException: Will raise if driver returns a status code
 			other than ``PicoStatus.OK``.
 		"""
-		handle = self.handle
+		handle = self._raw_handle_checked()
 		status = ll.set_digital_port_off(handle, port)
 		self._verify_status(status)
 
@@ -593,7 +849,7 @@ class PS6000A:
 		:raises PicoStatusException: Will raise if driver returns a status code
 			other than ``PicoStatus.OK``.
 		"""
-		handle = self.handle
+		handle = self._raw_handle_checked()
 		status, time_interval_ns, max_samples = ll.get_timebase(
 			handle, timebase, no_samples, segment_index
 		)
@@ -635,7 +891,7 @@ class PS6000A:
 		:raises PicoStatusException: Will raise if driver returns a status code
 			other than ``PicoStatus.OK``.
 		"""
-		handle = self.handle
+		handle = self._raw_handle_checked()
 		status = ll.set_simple_trigger(
 			handle,
 			enable,
@@ -663,13 +919,69 @@ class PS6000A:
 		:raises PicoStatusException: Will raise if driver returns a status code
 			other than ``PicoStatus.OK``.
 		"""
-		handle = self.handle
+		handle = self._raw_handle_checked()
 		status = ll.trigger_within_pre_trigger_samples(handle, state)
 		self._verify_status(status)
 
+	@staticmethod
+	def pack_trigger_channel_properties(
+		channel_properties: Sequence[PicoTriggerChannelProperties],
+	) -> "Array[PicoTriggerChannelProperties]":
+		"""
+		Pack trigger properties for repeated ``set_trigger_channel_properties``.
+
+		Passing the packed array, rather than a sequence, saves building a new
+		ctypes array on every call.
+
+		:param channel_properties: The trigger properties to pack.
+		:type channel_properties: Sequence[PicoTriggerChannelProperties]
+		:return: ctypes array of the trigger properties.
+		:rtype: Array[PicoTriggerChannelProperties]
+		"""
+		return (PicoTriggerChannelProperties * len(channel_properties))(
+			*channel_properties
+		)
+
+	@staticmethod
+	def pack_conditions(
+		conditions: Sequence[PicoCondition],
+	) -> "Array[PicoCondition]":
+		"""
+		Pack trigger conditions for repeated ``set_trigger_channel_conditions``.
+
+		Passing the packed array, rather than a sequence, saves building a new
+		ctypes array on every call.
+
+		:param conditions: The trigger conditions to pack.
+		:type conditions: Sequence[PicoCondition]
+		:return: ctypes array of the trigger conditions.
+		:rtype: Array[PicoCondition]
+		"""
+		return (PicoCondition * len(conditions))(*conditions)
+
+	@staticmethod
+	def pack_directions(
+		directions: Sequence[PicoDirection],
+	) -> "Array[PicoDirection]":
+		"""
+		Pack trigger directions for repeated ``set_trigger_channel_directions``.
+
+		Passing the packed array, rather than a sequence, saves building a new
+		ctypes array on every call.
+
+		:param directions: The trigger directions to pack.
+		:type directions: Sequence[PicoDirection]
+		:return: ctypes array of the trigger directions.
+		:rtype: Array[PicoDirection]
+		"""
+		return (PicoDirection * len(directions))(*directions)
+
 	def set_trigger_channel_properties(
 		self,
-		channel_properties: Sequence[PicoTriggerChannelProperties],
+		channel_properties: Union[
+			Sequence[PicoTriggerChannelProperties],
+			"Array[PicoTriggerChannelProperties]",
+		],
 		aux_output_enable: int,
 		auto_trigger_micro_seconds: int,
 	) -> None:
@@ -683,8 +995,10 @@ class PS6000A:
 			``PicoTriggerChannelProperties`` describing the requested
 			properties. The sequence can contain a single object describing the
 			properties of one channel, or a number of objects describing several
-			channels. If empty, triggering is switched off.
-		:type channel_properties: Sequence[PicoTriggerChannelProperties]
+			channels. If empty, triggering is switched off. An array from
+			``pack_trigger_channel_properties`` is passed on without copying.
+		:type channel_properties: Union[Sequence[PicoTriggerChannelProperties],
+			Array[PicoTriggerChannelProperties]]
 		:param aux_output_enable: "Not used."
 		:type aux_output_enable: int
 		:param auto_trigger_micro_seconds: The time in microseconds for which
@@ -697,14 +1011,16 @@ class PS6000A:
 		:raises PicoStatusException: Will raise if driver returns a status code
 			other than ``PicoStatus.OK``.
 		"""
-		handle = self.handle
+		handle = self._raw_handle_checked()
 		status = ll.set_trigger_channel_properties(
 			handle, channel_properties, aux_output_enable, auto_trigger_micro_seconds
 		)
 		self._verify_status(status)
 
 	def set_trigger_channel_conditions(
-		self, conditions: Sequence[PicoCondition], action: PicoAction
+		self,
+		conditions: Union[Sequence[PicoCondition], "Array[PicoCondition]"],
+		action: PicoAction,
 	) -> None:
 		"""
 		Set triggering logic (ps6000aSetTriggerChannelConditions).
@@ -722,8 +1038,9 @@ class PS6000A:
 			In the simplest case, the sequence consists of a single element.
 			When there is more than one element, the overall trigger condition
 			is the logical OR of all the elements. If the sequence is empty,
-			triggering is switched off.
-		:type conditions: Sequence[PicoCondition]
+			triggering is switched off. An array from ``pack_conditions`` is
+			passed on without copying.
+		:type conditions: Union[Sequence[PicoCondition], Array[PicoCondition]]
 		:param action: Specifies how to apply the new conditions to any existing
 			trigger conditions (i.e. append or replace).
 		:type action: PicoAction
@@ -732,12 +1049,12 @@ class PS6000A:
 		:raises PicoStatusException: Will raise if driver returns a status code
 			other than ``PicoStatus.OK``.
 		"""
-		handle = self.handle
+		handle = self._raw_handle_checked()
 		status = ll.set_trigger_channel_conditions(handle, conditions, action)
 		self._verify_status(status)
 
 	def set_trigger_channel_directions(
-		self, directions: Sequence[PicoDirection]
+		self, directions: Union[Sequence[PicoDirection], "Array[PicoDirection]"]
 	) -> None:
 		"""
 		Set trigger directions (ps6000aSetTriggerChannelDirections).
@@ -746,17 +1063,89 @@ class PS6000A:
 		channels.
 
 		:param directions: A sequence of ``PicoDirection`` objects, each
-			specifying the trigger direction for a channel.
-		:type directions: Sequence[PicoDirection]
+			specifying the trigger direction for a channel. An array from
+			``pack_directions`` is passed on without copying.
+		:type directions: Union[Sequence[PicoDirection], Array[PicoDirection]]
 		:return: None.
 		:rtype: None
 		:raises PicoStatusException: Will raise if driver returns a status code
 			other than ``PicoStatus.OK``.
 		"""
-		handle = self.handle
+		handle = self._raw_handle_checked()
 		status = ll.set_trigger_channel_directions(handle, directions)
 		self._verify_status(status)
 
+	def configure(
+		self,
+		channels_on: Sequence[ChannelSettings] = (),
+		channels_off: Sequence[PicoChannel] = (),
+		trigger: Optional[TriggerSettings] = None,
+	) -> None:
+		"""
+		Set up channels and triggering in one go.
+
+		Equivalent to calling ``set_channel_on`` for each of ``channels_on``,
+		``set_channel_off`` for each of ``channels_off``, then
+		``set_trigger_channel_conditions``, ``set_trigger_channel_directions``
+		and ``set_trigger_channel_properties`` from ``trigger``. The arguments
+		are checked before anything is sent to the device, and the handle is
+		only checked once.
+
+		:param channels_on: Settings for the channels to enable. Optional,
+			defaults to none.
+		:type channels_on: Sequence[ChannelSettings]
+		:param channels_off: The channels to disable. Optional, defaults to
+			none.
+		:type channels_off: Sequence[PicoChannel]
+		:param trigger: Trigger setup. Optional; if None, the trigger setup is
+			left unchanged.
+		:type trigger: Optional[TriggerSettings]
+		:return: None.
+		:rtype: None
+		:raises PicoStatusException: Will raise if driver returns a status code
+			other than ``PicoStatus.OK``. Settings before the failing call will
+			have been applied.
+		:raises ValueError: Will raise if a channel is both enabled and
+			disabled, or enabled more than once.
+		"""
+		enabled = [settings.channel for settings in channels_on]
+		if len(set(enabled)) != len(enabled):
+			raise ValueError("Channel settings given more than once")
+		both = set(enabled).intersection(channels_off)
+		if both:
+			raise ValueError(f"Channels both enabled and disabled: {both}")
+
+		handle = self._raw_handle_checked()
+		verify = self._verify_status
+		for settings in channels_on:
+			verify(
+				ll.set_channel_on(
+					handle,
+					settings.channel,
+					settings.coupling,
+					settings.range_,
+					settings.analog_offset,
+					settings.bandwidth,
+				)
+			)
+		for channel in channels_off:
+			verify(ll.set_channel_off(handle, channel))
+		if trigger is not None:
+			verify(
+				ll.set_trigger_channel_conditions(
+					handle, trigger.conditions, trigger.action
+				)
+			)
+			verify(ll.set_trigger_channel_directions(handle, trigger.directions))
+			verify(
+				ll.set_trigger_channel_properties(
+					handle,
+					trigger.channel_properties,
+					0,
+					trigger.auto_trigger_micro_seconds,
+				)
+			)
+
 	def set_trigger_delay(self, delay: int) -> None:
 		"""
 		Set post-trigger delay (ps6000aSetTriggerDelay).
@@ -772,10 +1161,71 @@ class PS6000A:
 		:raises PicoStatusException: Will raise if driver returns a status code
 			other than ``PicoStatus.OK``.
 		"""
-		handle = self.handle
+		handle = self._raw_handle_checked()
 		status = ll.set_trigger_delay(handle, delay)
 		self._verify_status(status)
 
+	def _allocate_buffer(self, data_type: PicoDataType, n_samples: int) -> Array:
+		"""
+		Allocate a zeroed ctypes array, reusing a released one if possible.
+
+		:param data_type: The data type of the array elements.
+		:type data_type: PicoDataType
+		:param n_samples: The length of the array, in samples.
+		:type n_samples: int
+		:return: Zero-filled array.
+		:rtype: Array
+		"""
+		pool = self._buffer_pool.get((data_type, n_samples))
+		if pool:
+			# Pooled arrays are zeroed when released.
+			array = pool.pop()
+		else:
+			array = make_data_array(data_type, n_samples)
+		self._pool_arrays[id(array)] = array
+		return array
+
+	def release_buffer(self, buffer: Buffer) -> None:
+		"""
+		Return a buffer's memory for reuse by ``get_data_buffer(s)``.
+
+		Allocating and zeroing large buffers for every capture is slow, so
+		acquisition loops that repeatedly create and clear buffers can release
+		them once they are done with the data. The next buffer of the same data
+		type and length will then reuse the memory. The buffer must not be used
+		after it is released; its contents are zeroed immediately, so that
+		allocation from the pool is just a lookup. Only memory allocated by
+		``get_data_buffer(s)`` is pooled; buffers over caller-owned memory
+		(from ``get_data_buffer_from_array``) or over a shared allocation
+		(from ``prepare_channel_buffers`` or ``prepare_rapid_block``), and
+		buffers smaller than ``MIN_POOLED_BUFFER_BYTES``, are simply dropped.
+		So is a buffer that was already released, so that two later buffers
+		never share its memory, and one released when ``MAX_POOLED_BUFFERS``
+		of the same data type and length are already pooled. The pool is
+		emptied by ``close_unit``.
+
+		:param buffer: The buffer to release. It must have been cleared first
+			(e.g. with ``clear_data_buffers``).
+		:type buffer: Buffer
+		:return: None.
+		:rtype: None
+		:raises ValueError: Will raise if ``buffer`` is still registered with
+			the driver.
+		"""
+		registered = self.buffers.get(buffer.buffer_class, ())
+		if any(b.buffer is buffer.buffer for b in registered):
+			raise ValueError("Cannot release a buffer still registered with driver")
+		if self._pool_arrays.pop(id(buffer.buffer), None) is not buffer.buffer:
+			return
+		size = sizeof(buffer.buffer)
+		if size < MIN_POOLED_BUFFER_BYTES:
+			return
+		pool = self._buffer_pool[(buffer.datatype, buffer.samples)]
+		if len(pool) >= MAX_POOLED_BUFFERS:
+			return
+		memset(addressof(buffer.buffer), 0, size)
+		pool.append(buffer.buffer)
+
 	def get_data_buffer(
 		self,
 		channel: PicoChannel,
@@ -790,7 +1240,8 @@ class PS6000A:
 
 		Unlike the C API, this function will allocate the buffer and provide it
 		to the driver. The buffer will be returned. This object will store
-		a reference to the buffer to prevent garbage collection.
+		a reference to the buffer to prevent garbage collection. Memory from
+		buffers passed to ``release_buffer`` is reused when possible.
 
 		This function tells the driver where to store the data, either
 		unprocessed or downsampled, that will be returned after the next call
@@ -830,7 +1281,67 @@ class PS6000A:
 			other than ``PicoStatus.OK``.
 		"""
 		buffer = Buffer(
-			buffer=(data_type.ctype * n_samples)(),
+			buffer=self._allocate_buffer(data_type, n_samples),
+			channel=channel,
+			datatype=data_type,
+			segment=segment,
+			downsampling_mode=down_sample_ratio_mode,
+			max_min=BufferMaxMin.MAX,
+		)
+		self.set_data_buffers(buffer, clear_others=clear_others)
+		return buffer
+
+	def get_data_buffer_from_array(
+		self,
+		channel: PicoChannel,
+		array: np.ndarray,
+		data_type: PicoDataType,
+		segment: int,
+		down_sample_ratio_mode: PicoRatioMode,
+		clear_others: bool = False,
+	) -> Buffer:
+		"""
+		Provide caller-owned memory as a data buffer (ps6000aSetDataBuffers).
+
+		As ``get_data_buffer``, but instead of allocating a buffer, the driver
+		writes directly into ``array``. This lets acquisition loops fill a
+		preallocated array (or a slice of one) with no extra copy. The returned
+		buffer keeps ``array`` alive while it is registered.
+
+		:param channel: The channel you want to use with the buffer.
+		:type channel: PicoChannel
+		:param array: The destination array. Must be one-dimensional,
+			C-contiguous, writeable, and of the NumPy type matching
+			``data_type``.
+		:type array: np.ndarray
+		:param data_type: The data type that you wish to use for the sample
+			values.
+		:type data_type: PicoDataType
+		:param segment: The segment index. Must be zero for streaming.
+		:type segment: int
+		:param down_sample_ratio_mode: The downsampling mode, as for
+			``get_data_buffer``.
+		:type down_sample_ratio_mode: PicoRatioMode
+		:param clear_others: True to clear any other associated buffers, False
+			to keep them while adding a new one. Defaults to False.
+		:type clear_others: bool
+		:return: Data buffer sharing memory with ``array``.
+		:rtype: Buffer
+		:raises PicoStatusException: Will raise if driver returns a status code
+			other than ``PicoStatus.OK``.
+		:raises ValueError: Will raise if ``array`` cannot be used as a buffer
+			for ``data_type``.
+		"""
+		if array.ndim != 1 or not array.flags.c_contiguous:
+			raise ValueError("Array must be one-dimensional and C-contiguous")
+		if not array.flags.writeable:
+			raise ValueError("Array must be writeable")
+		if array.dtype != np.dtype(data_type.numpy_type):
+			raise ValueError(
+				f"Array dtype {array.dtype} does not match data type {data_type.name}"
+			)
+		buffer = Buffer(
+			buffer=(data_type.ctype * len(array)).from_buffer(array.data),
 			channel=channel,
 			datatype=data_type,
 			segment=segment,
@@ -854,7 +1365,8 @@ class PS6000A:
 
 		Unlike the C API, this function will allocate the buffers and provide
 		them to the driver. The buffers will be returned. This object will
-		store a reference to the buffers to prevent garbage collection.
+		store a reference to the buffers to prevent garbage collection. Memory
+		from buffers passed to ``release_buffer`` is reused when possible.
 
 		This function tells the driver the location of two buffers for
 		receiving data. If you do not need two buffers, because you are not
@@ -896,7 +1408,7 @@ class PS6000A:
 			other than ``PicoStatus.OK``.
 		"""
 		buffer_max = Buffer(
-			buffer=(data_type.ctype * n_samples)(),
+			buffer=self._allocate_buffer(data_type, n_samples),
 			channel=channel,
 			datatype=data_type,
 			segment=segment,
@@ -904,7 +1416,7 @@ class PS6000A:
 			max_min=BufferMaxMin.MAX,
 		)
 		buffer_min = Buffer(
-			buffer=(data_type.ctype * n_samples)(),
+			buffer=self._allocate_buffer(data_type, n_samples),
 			channel=channel,
 			datatype=data_type,
 			segment=segment,
@@ -914,6 +1426,129 @@ class PS6000A:
 		self.set_data_buffers(buffer_max, buffer_min, clear_others=clear_others)
 		return buffer_max, buffer_min
 
+	def prepare_channel_buffers(
+		self,
+		channels: Sequence[PicoChannel],
+		n_samples: int,
+		data_type: PicoDataType,
+		segment: int,
+		down_sample_ratio_mode: PicoRatioMode,
+		clear_others: bool = False,
+	) -> tuple[Array, list[Buffer]]:
+		"""
+		Allocate and provide data buffers for several channels at once.
+
+		This works like calling ``get_data_buffer`` for each channel, except
+		that the buffers are consecutive slices of one contiguous allocation,
+		in the order of ``channels``. The whole allocation is also returned, so
+		that all the channels' data can be processed together, e.g. as a
+		``(len(channels), n_samples)`` NumPy array.
+
+		:param channels: The channels to provide buffers for.
+		:type channels: Sequence[PicoChannel]
+		:param n_samples: The length of each data buffer, in samples.
+		:type n_samples: int
+		:param data_type: The data type that you wish to use for the sample
+			values.
+		:type data_type: PicoDataType
+		:param segment: The segment index. Must be zero for streaming.
+		:type segment: int
+		:param down_sample_ratio_mode: The downsampling mode, as for
+			``get_data_buffer``.
+		:type down_sample_ratio_mode: PicoRatioMode
+		:param clear_others: True to clear any other associated buffers before
+			adding these, False to keep them. Defaults to False.
+		:type clear_others: bool
+		:return: The contiguous allocation, then a buffer for each channel.
+			Each buffer keeps the allocation alive.
+		:rtype: tuple[Array, list[Buffer]]
+		:raises PicoStatusException: Will raise if driver returns a status code
+			other than ``PicoStatus.OK``.
+		"""
+		flat = make_data_array(data_type, n_samples * len(channels))
+		channel_bytes = n_samples * sizeof(data_type.ctype)
+		buffers: list[Buffer] = []
+		for i, channel in enumerate(channels):
+			buffer = Buffer(
+				buffer=(data_type.ctype * n_samples).from_buffer(
+					flat, i * channel_bytes
+				),
+				channel=channel,
+				datatype=data_type,
+				segment=segment,
+				downsampling_mode=down_sample_ratio_mode,
+				max_min=BufferMaxMin.MAX,
+			)
+			self.set_data_buffers(buffer, clear_others=clear_others and i == 0)
+			buffers.append(buffer)
+		return flat, buffers
+
+	def prepare_rapid_block(
+		self,
+		n_segments: int,
+		channels: Sequence[PicoChannel],
+		n_samples: int,
+		data_type: PicoDataType,
+		down_sample_ratio_mode: PicoRatioMode,
+	) -> tuple[Array, list[Buffer]]:
+		"""
+		Set up memory segments, captures, and data buffers for rapid block mode.
+
+		Equivalent to ``memory_segments`` and ``set_no_of_captures`` with
+		``n_segments``, then ``get_data_buffer`` for every channel in every
+		segment, except that the buffers are slices of one contiguous
+		allocation. The allocation is laid out as
+		``(n_segments, len(channels), n_samples)``, so after
+		``get_values_bulk`` the data for all captures can be processed as one
+		NumPy array. Inside ``batched_buffer_setup``, the buffer registrations
+		are deferred like any other ``set_data_buffers`` call.
+
+		:param n_segments: The number of segments, and of captures.
+		:type n_segments: int
+		:param channels: The channels to provide buffers for.
+		:type channels: Sequence[PicoChannel]
+		:param n_samples: The length of each data buffer, in samples.
+		:type n_samples: int
+		:param data_type: The data type that you wish to use for the sample
+			values.
+		:type data_type: PicoDataType
+		:param down_sample_ratio_mode: The downsampling mode, as for
+			``get_data_buffer``.
+		:type down_sample_ratio_mode: PicoRatioMode
+		:return: The contiguous allocation, then the buffers in the same order
+			(segment by segment, then channel by channel). Each buffer keeps
+			the allocation alive.
+		:rtype: tuple[Array, list[Buffer]]
+		:raises PicoStatusException: Will raise if driver returns a status code
+			other than ``PicoStatus.OK``.
+		"""
+		handle = self._raw_handle_checked()
+		verify = self._verify_status
+		status, _ = ll.memory_segments(handle, n_segments)
+		verify(status)
+		verify(ll.set_no_of_captures(handle, n_segments))
+
+		ctype = data_type.ctype
+		array_type = ctype * n_samples
+		buffer_bytes = n_samples * sizeof(ctype)
+		flat = make_data_array(data_type, n_segments * len(channels) * n_samples)
+		buffers: list[Buffer] = []
+		offset = 0
+		for segment in range(n_segments):
+			for channel in channels:
+				buffer = Buffer(
+					buffer=array_type.from_buffer(flat, offset),
+					channel=channel,
+					datatype=data_type,
+					segment=segment,
+					downsampling_mode=down_sample_ratio_mode,
+					max_min=BufferMaxMin.MAX,
+				)
+				offset += buffer_bytes
+				self.set_data_buffers(buffer)
+				buffers.append(buffer)
+		return flat, buffers
+
 	def set_data_buffers(
 		self,
 		buffer_max: Buffer,
@@ -964,31 +1599,143 @@ class PS6000A:
 				)
 			buffer_min_raw = buffer_min.buffer
 
-		handle = self.handle
-		action = PicoAction.ADD
-		if clear_others:
-			action |= PicoAction.CLEAR_ALL
-		status = ll.set_data_buffers(
-			handle,
-			buffer_max.channel,
-			buffer_max.buffer,
-			buffer_min_raw,
-			buffer_max.datatype,
-			buffer_max.segment,
-			buffer_max.downsampling_mode,
-			action,
-		)
-		self._verify_status(status)
-
+		handle = self._raw_handle_checked()
 		buffer_class = buffer_max.buffer_class
+		pending = self._pending_buffers
+		if pending is not None:
+			# Inside ``batched_buffer_setup``: keep only the call that will
+			# still matter once the batch ends.
+			key = (buffer_class, buffer_max.downsampling_mode)
+			clear = clear_others
+			if clear_others:
+				for stale in [k for k in pending if k[0] == buffer_class]:
+					del pending[stale]
+			else:
+				previous = pending.get(key)
+				if previous is not None:
+					_, previous_min_raw, clear = previous
+					if buffer_min_raw is None:
+						buffer_min_raw = previous_min_raw
+					if not clear:
+						# Move the entry to the end, so the replay keeps call
+						# order relative to other buffer classes' calls. A
+						# clearing entry stays put, so that its clear still
+						# runs before any calls that followed it.
+						del pending[key]
+			pending[key] = (buffer_max, buffer_min_raw, clear)
+		else:
+			action = PicoAction.ADD
+			if clear_others:
+				action |= PicoAction.CLEAR_ALL
+			status = _set_data_buffers(
+				handle,
+				buffer_max.channel,
+				buffer_max.buffer,
+				buffer_min_raw,
+				buffer_max.datatype,
+				buffer_max.segment,
+				buffer_max.downsampling_mode,
+				action,
+			)
+			self._verify_status(status)
+
+		buffers = self.buffers
+		register = self._register_buffer
+		self._streaming_info_cache = None
 		if clear_others:
-			self.buffers[buffer_class].clear()
-		self.buffers[buffer_class].add(buffer_max)
+			self._buffer_count -= len(buffers.get(buffer_class, ()))
+			registered = buffers[buffer_class] = []
+		else:
+			registered = buffers.setdefault(buffer_class, [])
+		register(registered, buffer_max)
 		if buffer_min is not None:
-			self.buffers[buffer_class].add(buffer_min)
+			register(registered, buffer_min)
+
+	@contextmanager
+	def batched_buffer_setup(self) -> Iterator[None]:
+		"""
+		Defer and coalesce data buffer registration until the block exits.
+
+		Within the ``with`` block, ``set_data_buffers`` and the
+		``get_data_buffer(s)`` functions update ``buffers`` immediately, but
+		only record the driver call. A later call for the same buffer class and
+		downsampling mode replaces an earlier one, and ``clear_others``
+		discards any recorded calls for its buffer class. On exit, one
+		ps6000aSetDataBuffers call is made for each remaining entry, in the
+		order of the latest calls they record. This saves driver round-trips
+		when setup code replaces buffers several times before capturing.
+		Nested blocks join the outermost one.
+
+		If the block raises, the recorded calls are discarded and the
+		exception propagates; ``reload_data_buffers`` or
+		``clear_data_buffers`` can be used to bring the driver back in line
+		with ``buffers``.
+
+		:return: A context manager, yielding None.
+		:rtype: Iterator[None]
+		:raises PicoStatusException: Will raise on exit if driver returns a
+			status code other than ``PicoStatus.OK``.
+		"""
+		if self._pending_buffers is not None:
+			yield
+			return
+		pending = self._pending_buffers = {}
+		try:
+			yield
+		finally:
+			self._pending_buffers = None
+		handle = self._raw_handle_checked()
+		verify = self._verify_status
+		for (buffer_class, mode), (
+			buffer_max,
+			buffer_min_raw,
+			clear,
+		) in pending.items():
+			action = PicoAction.ADD
+			if clear:
+				action |= PicoAction.CLEAR_ALL
+			verify(
+				_set_data_buffers(
+					handle,
+					buffer_class.channel,
+					buffer_max.buffer,
+					buffer_min_raw,
+					buffer_class.datatype,
+					buffer_class.segment,
+					mode,
+					action,
+				)
+			)
+
+	def _register_buffer(self, registered: list[Buffer], buffer: Buffer) -> None:
+		"""
+		Add a buffer to a registry list, replacing any it takes the place of.
+
+		The driver holds one buffer per channel, data type, segment,
+		downsampling mode, and max/min side; registering another replaces it.
+		Buffers compare equal on exactly these fields. Keeps
+		``total_existing_data_buffers`` up to date.
+
+		:param registered: The registered buffers of ``buffer``'s class.
+		:type registered: list[Buffer]
+		:param buffer: The newly registered buffer.
+		:type buffer: Buffer
+		:return: None.
+		:rtype: None
+		"""
+		for i, existing in enumerate(registered):
+			if existing == buffer:
+				registered[i] = buffer
+				return
+		registered.append(buffer)
+		self._buffer_count += 1
 
 	def clear_data_buffers(
-		self, channel: PicoChannel, data_type: PicoDataType, segment: int
+		self,
+		channel: PicoChannel,
+		data_type: PicoDataType,
+		segment: int,
+		release: bool = False,
 	) -> None:
 		"""
 		Clear/unset data buffers (ps6000aSetDataBuffers).
@@ -1004,11 +1751,17 @@ class PS6000A:
 		:type data_type: PicoDataType
 		:param segment: The segment index.
 		:type segment: int
+		:param release: True to also pass the cleared buffers to
+			``release_buffer``, so that their memory is reused by the next
+			``get_data_buffer(s)`` call. Only do this if the cleared buffers
+			(and any NumPy views of them) will not be used again. Defaults to
+			False.
+		:type release: bool
 		:return: None.
 		:rtype: None
 		"""
-		handle = self.handle
-		status = ll.set_data_buffers(
+		handle = self._raw_handle_checked()
+		status = _set_data_buffers(
 			handle,
 			channel,
 			None,
@@ -1020,16 +1773,25 @@ class PS6000A:
 		)
 		self._verify_status(status)
 
-		buffer_class = BufferClass(channel=channel, datatype=data_type, segment=segment)
-		self.buffers[buffer_class].clear()
+		buffer_class = get_buffer_class(channel, data_type, segment)
+		pending = self._pending_buffers
+		if pending is not None:
+			for stale in [k for k in pending if k[0] == buffer_class]:
+				del pending[stale]
+		cleared = self.buffers.pop(buffer_class, ())
+		self._buffer_count -= len(cleared)
+		self._streaming_info_cache = None
+		if release:
+			for buffer in cleared:
+				self.release_buffer(buffer)
 
 	def get_existing_data_buffers(
 		self, channel: PicoChannel, data_type: PicoDataType, segment: int
-	) -> set[Buffer]:
+	) -> list[Buffer]:
 		"""
 		Retrieve previously created buffers.
 
-		Get a set of previously created/registed buffers, which have not been
+		Get a list of previously created/registed buffers, which have not been
 		subsequently cleared, for a given channel/datatype/segment. This can
 		also be accomplished by accessing the ``buffers`` dict.
 
@@ -1039,22 +1801,23 @@ class PS6000A:
 		:type data_type: PicoDataType
 		:param segment: The segment index of the buffers.
 		:type segment: int
-		:return: A set of previously created buffers. May be empty.
-		:rtype: set[Buffer]
+		:return: A list of previously created buffers, in registration order.
+			May be empty.
+		:rtype: list[Buffer]
 		"""
-		buffer_class = BufferClass(channel=channel, datatype=data_type, segment=segment)
-		return self.buffers[buffer_class]
+		buffer_class = get_buffer_class(channel, data_type, segment)
+		return list(self.buffers.get(buffer_class, ()))
 
 	def get_all_existing_data_buffers(
 		self,
 		channel: Optional[PicoChannel] = None,
 		data_type: Optional[PicoDataType] = None,
 		segment: Optional[int] = None,
-	) -> set[Buffer]:
+	) -> list[Buffer]:
 		"""
 		Retrieve previously created buffers for multiple buffer classes.
 
-		Get a set of previously created/registed buffers, which have not been
+		Get a list of previously created/registed buffers, which have not been
 		subsequently cleared, matching zero or more of ``channel``,
 		``data_type``, and ``segment`` as specified.
 
@@ -1067,19 +1830,18 @@ class PS6000A:
 		:param segment: The segment index of the buffers. Optional; if omitted,
 			the returned buffers may be for any segment.
 		:type segment: int
-		:return: A set of previously created buffers. May be empty.
-		:rtype: set[Buffer]
-		"""
-		out: set[Buffer] = set()
-		for bclass in self.buffers.values():
-			for buffer in bclass:
-				out.add(buffer)
-				if channel is not None and buffer.channel != channel:
-					out.remove(buffer)
-				if data_type is not None and buffer.datatype != data_type:
-					out.remove(buffer)
-				if segment is not None and buffer.segment != segment:
-					out.remove(buffer)
+		:return: A list of previously created buffers. May be empty. Each
+			buffer appears once, since the registry never holds duplicates.
+		:rtype: list[Buffer]
+		"""
+		out: list[Buffer] = []
+		for bclass, buffers in self.buffers.items():
+			if (
+				(channel is None or bclass.channel == channel)
+				and (data_type is None or bclass.datatype == data_type)
+				and (segment is None or bclass.segment == segment)
+			):
+				out.extend(buffers)
 		return out
 
 	def get_existing_data_buffer_pairs(
@@ -1103,38 +1865,28 @@ class PS6000A:
 			the tuple, max buffer is first, and min buffer (or None) is second.
 		:rtype: set[tuple[Buffer, Optional[Buffer]]]
 		"""
-		pairs: dict[Any, list[Optional[Buffer]]] = defaultdict(lambda: [None, None])
-		out: set[tuple[Buffer, Optional[Buffer]]] = set()
-		for bclass in self.buffers.values():
-			for buffer in bclass:
-				key = (
-					buffer.channel,
-					buffer.datatype,
-					buffer.segment,
-					buffer.downsampling_mode,
-				)
-				if buffer.max_min == BufferMaxMin.MAX:
-					pairs[key][0] = buffer
-				elif buffer.max_min == BufferMaxMin.MIN:
-					pairs[key][0] = buffer
-				else:
-					raise TypeError(f"Unknown buffer side: {buffer.max_min}")
-		for pair in pairs.values():
-			buffer_max = pair[0]
-			buffer_min = pair[1]
-			if buffer_max is None:
+		buffer_class = get_buffer_class(channel, data_type, segment)
+		maxes: dict[PicoRatioMode, Buffer] = {}
+		mins: dict[PicoRatioMode, Buffer] = {}
+		for buffer in self.buffers.get(buffer_class, ()):
+			if buffer.max_min is BufferMaxMin.MAX:
+				maxes[buffer.downsampling_mode] = buffer
+			elif buffer.max_min is BufferMaxMin.MIN:
+				mins[buffer.downsampling_mode] = buffer
+			else:
+				raise TypeError(f"Unknown buffer side: {buffer.max_min}")
+		for mode, buffer_min in mins.items():
+			if mode not in maxes:
 				logger.warning(f"No max buffer matching min buffer {buffer_min}")
-				continue
-			out.add((buffer_max, buffer_min))
-		return out
+		return {(buffer_max, mins.get(mode)) for mode, buffer_max in maxes.items()}
 
 	def reload_data_buffers(
 		self, channel: PicoChannel, data_type: PicoDataType, segment: int
-	) -> set[Buffer]:
+	) -> list[Buffer]:
 		"""
 		Re-register existing buffers with the driver.
 
-		Get a set of previously created/registed buffers, which have not been
+		Get a list of previously created/registed buffers, which have not been
 		subsequently cleared, for a given channel/datatype/segment. This can
 		also be accomplished by accessing the ``buffers`` dict.
 
@@ -1145,30 +1897,44 @@ class PS6000A:
 		:param segment: The segment index of the buffers.
 		:type segment: int
 		:return: Any buffers which were reloaded. May be empty.
-		:rtype: set[Buffer]
+		:rtype: list[Buffer]
 		"""
-		handle = self.handle
+		handle = self._raw_handle_checked()
 		pairs = self.get_existing_data_buffer_pairs(
 			channel=channel, data_type=data_type, segment=segment
 		)
-		out: set[Buffer] = set()
-		for pair in pairs:
-			buffer_max = pair[0]
-			buffer_min = pair[1]
-			status = ll.set_data_buffers(
-				handle,
-				buffer_max.channel,
-				buffer_max.buffer,
-				buffer_min.buffer if buffer_min is not None else None,
-				buffer_max.datatype,
-				buffer_max.segment,
-				buffer_max.downsampling_mode,
-				PicoAction.ADD,
+		# These buffers were checked when they were first registered, so the
+		# raw driver function is called directly, with precomputed arguments.
+		calls = [
+			(
+				(
+					handle,
+					buffer_max.channel,
+					addressof(buffer_max.buffer),
+					addressof(buffer_min.buffer) if buffer_min is not None else None,
+					buffer_max.samples,
+					buffer_max.datatype,
+					buffer_max.segment,
+					buffer_max.downsampling_mode,
+					PicoAction.ADD,
+				),
+				buffer_max,
+				buffer_min,
 			)
-			self._verify_status(status)
-			out.add(buffer_max)
+			for buffer_max, buffer_min in pairs
+		]
+		out: list[Buffer] = []
+		out_add = out.append
+		for args, buffer_max, buffer_min in calls:
+			# Raw status codes: only failures are converted to ``PicoStatus``.
+			code = _raw_set_data_buffers(*args)
+			if code:
+				self._verify_status(ll.to_status(code))
+			out_add(buffer_max)
 			if buffer_min is not None:
-				out.add(buffer_min)
+				out_add(buffer_min)
+		if calls:
+			self.last_status = PicoStatus.OK
 		return out
 
 	@property
@@ -1181,10 +1947,7 @@ class PS6000A:
 		:return: The total number of created/registered buffers for this device.
 		:rtype: int
 		"""
-		count = 0
-		for bufset in self.buffers.values():
-			count += len(bufset)
-		return count
+		return self._buffer_count
 
 	def run_streaming(
 		self,
@@ -1240,7 +2003,7 @@ class PS6000A:
 		:raises PicoStatusException: Will raise if driver returns a status code
 			other than ``PicoStatus.OK``.
 		"""
-		handle = self.handle
+		handle = self._raw_handle_checked()
 		if self.total_existing_data_buffers <= 0:
 			logger.warning("run_streaming called without any buffers created.")
 		status, sample_interval = ll.run_streaming(
@@ -1267,11 +2030,17 @@ class PS6000A:
 		``PicoStreamingDataTriggerInfo`` structures to indicate that a trigger
 		has occurred and at what location.
 
+		The driver writes samples straight into the registered buffers. To
+		read the new samples without copying them, slice a NumPy view of the
+		buffer, e.g. ``buffer.as_ndarray()[info.start_index :
+		info.start_index + info.no_of_samples]``.
+
 		:param streaming_data_info: Data structures to be populated with buffer
 			information. Set the channel, downsampling ratio, and datatype
 			before calling this function; the driver will set the rest.
 			Optional. If None, the input structures will be generated
-			automatically from all registed buffers.
+			automatically from all registed buffers (and reused by later
+			calls, until buffers are registered or cleared).
 		:type streaming_data_info: Optional[Sequence[PicoStreamingDataInfo]]
 		:return: A flag which is True if the last buffer is full, then a list
 			of structures containing buffer information, then a list of
@@ -1282,22 +2051,82 @@ class PS6000A:
 			other than ``PicoStatus.OK`` or
 			``PicoStatus.WAITING_FOR_DATA_BUFFERS``.
 		"""
-		handle = self.handle
+		handle = self._valid_handle
+		if handle is None:
+			raise PicoHandleError(self._raw_handle)
 		if streaming_data_info is None:
-			streaming_data_info = list()
-			for buffer in self.get_all_existing_data_buffers(segment=0):
-				streaming_data_info.append(buffer.empty_streaming_info)
+			streaming_data_info = self._streaming_info_cache
+			if streaming_data_info is None:
+				# Streaming only uses segment 0; registry keys carry the segment.
+				streaming_data_info = self._streaming_info_cache = [
+					buffer.empty_streaming_info
+					for buffer_class, buffers in self.buffers.items()
+					if buffer_class.segment == 0
+					for buffer in buffers
+				]
 		(
 			status,
 			streaming_info_array,
 			streaming_trigger_array,
-		) = ll.get_streaming_latest_values(handle, streaming_data_info)
+		) = _get_streaming_latest_values(handle, streaming_data_info)
 		self.last_status = status
 		if status != PicoStatus.OK and status != PicoStatus.WAITING_FOR_DATA_BUFFERS:
 			raise PicoStatusError(status)
 		full = status == PicoStatus.WAITING_FOR_DATA_BUFFERS
 		return full, streaming_info_array, streaming_trigger_array
 
+	def poll_streaming_in_background(
+		self,
+		on_data: Callable[[bool, "Array[PicoStreamingDataInfo]"], bool],
+		idle_interval: float = 0.001,
+	) -> "Future[None]":
+		"""
+		Deliver streaming data to a callback from a background thread.
+
+		The driver has no data-ready callback for streaming mode, so this runs
+		the ``get_streaming_latest_values`` loop on a new daemon thread
+		instead. ``on_data`` is called with the full flag and the streaming
+		info structures whenever new samples are available or the buffer is
+		full, and must re-register buffers (e.g. with ``set_data_buffers``)
+		when the flag is True. Polling continues until ``on_data`` returns
+		False. Between polls that report no new data, the thread sleeps for
+		``idle_interval`` seconds rather than spinning.
+
+		The calling thread can wait on the returned future, which completes
+		when polling stops and re-raises any exception from the driver or from
+		``on_data``.
+
+		:param on_data: Called with the full flag and the streaming info
+			structures, as returned by ``get_streaming_latest_values``.
+			Returns True to keep polling, or False to stop.
+		:type on_data: Callable[[bool, Array[PicoStreamingDataInfo]], bool]
+		:param idle_interval: Time to sleep after a poll with no new data, in
+			seconds. Optional, defaults to 1 ms.
+		:type idle_interval: float
+		:return: Future which completes when polling stops.
+		:rtype: Future[None]
+		"""
+		future: Future[None] = Future()
+		future.set_running_or_notify_cancel()
+
+		def _poll() -> None:
+			poll = self.get_streaming_latest_values
+			try:
+				while True:
+					full, infos, _ = poll()
+					if full or any(info.no_of_samples for info in infos):
+						if not on_data(full, infos):
+							break
+					elif idle_interval:
+						time.sleep(idle_interval)
+			except BaseException as e:
+				future.set_exception(e)
+			else:
+				future.set_result(None)
+
+		threading.Thread(target=_poll, daemon=True).start()
+		return future
+
 	def no_of_streaming_values(self) -> int:
 		"""
 		Get number of captured samples (ps6000aNoOfStreamingValues).
@@ -1310,8 +2139,8 @@ class PS6000A:
 		:raises PicoStatusException: Will raise if driver returns a status code
 			other than ``PicoStatus.OK``.
 		"""
-		handle = self.handle
-		status, no_of_values = ll.no_of_streaming_values(handle)
+		handle = self._raw_handle_checked()
+		status, no_of_values = _no_of_streaming_values(handle)
 		self._verify_status(status)
 		return no_of_values
 
@@ -1360,10 +2189,10 @@ class PS6000A:
 			samples.
 		:rtype: float
 		"""
-		handle = self.handle
+		handle = self._raw_handle_checked()
 		callback = wrap_block_ready(ready) if ready is not None else None
 
-		status, time_indisposed_ms = ll.run_block(
+		status, time_indisposed_ms = _run_block(
 			handle,
 			no_of_pre_trigger_samples,
 			no_of_post_trigger_samples,
@@ -1389,8 +2218,10 @@ class PS6000A:
 			``get_values`` can be used to retrieve the data.
 		:rtype: bool
 		"""
-		handle = self.handle
-		status, ready = ll.is_ready(handle)
+		handle = self._valid_handle
+		if handle is None:
+			raise PicoHandleError(self._raw_handle)
+		status, ready = _is_ready(handle)
 		self._verify_status(status)
 		return ready
 
@@ -1440,8 +2271,10 @@ class PS6000A:
 
 		:rtype: Tuple[int, PicoChannelFlags]
 		"""
-		handle = self.handle
-		status, no_of_samples, overflow = ll.get_values(
+		handle = self._valid_handle
+		if handle is None:
+			raise PicoHandleError(self._raw_handle)
+		status, no_of_samples, overflow = _get_values(
 			handle,
 			start_index,
 			no_of_samples,
@@ -1473,8 +2306,8 @@ class PS6000A:
 		:raises PicoStatusException: Will raise if driver returns a status code
 			other than ``PicoStatus.OK``.
 		"""
-		handle = self.handle
-		status = ll.stop(handle)
+		handle = self._raw_handle_checked()
+		status = _stop(handle)
 		self._verify_status(status)
 
 	def get_trigger_info(
@@ -1495,12 +2328,16 @@ class PS6000A:
 		:type segment_count: int
 		:return: A sequence of ``PicoTriggerInfo`` structures, one for each
 			buffer segment, containing trigger information. Length will be
-			equal to ``segment_count``.
+			equal to ``segment_count``. To read the fields many times, convert
+			them once with ``ps6000a.types.trigger_info_views``, or view them
+			as columns with ``as_structured_array(info, TRIGGER_INFO_DTYPE)``.
 		:rtype: Array[PicoTriggerInfo]
 		:raises PicoStatusException: Will raise if driver returns a status code
 			other than ``PicoStatus.OK``.
 		"""
-		handle = self.handle
+		handle = self._valid_handle
+		if handle is None:
+			raise PicoHandleError(self._raw_handle)
 		status, trigger_info = ll.get_trigger_info(
 			handle, first_segment_index, segment_count
 		)
@@ -1526,7 +2363,7 @@ class PS6000A:
 		:raises PicoStatusException: Will raise if driver returns a status code
 			other than ``PicoStatus.OK``.
 		"""
-		handle = self.handle
+		handle = self._raw_handle_checked()
 		status, minimum_voltage, maximum_voltage = ll.get_analog_offset_limits(
 			handle, range_, coupling
 		)
@@ -1561,7 +2398,7 @@ class PS6000A:
 		:raises PicoStatusException: Will raise if driver returns a status code
 			other than ``PicoStatus.OK``.
 		"""
-		handle = self.handle
+		handle = self._raw_handle_checked()
 		status, timebase, time_interval = ll.get_minimum_timebase_stateless(
 			handle, enabled_channel_flags, resolution
 		)
@@ -1601,7 +2438,7 @@ class PS6000A:
 		:raises PicoStatusException: Will raise if driver returns a status code
 			other than ``PicoStatus.OK``.
 		"""
-		handle = self.handle
+		handle = self._raw_handle_checked()
 		(
 			status,
 			timebase,
@@ -1634,7 +2471,7 @@ class PS6000A:
 		:raises PicoStatusException: Will raise if driver returns a status code
 			other than ``PicoStatus.OK``.
 		"""
-		handle = self.handle
+		handle = self._raw_handle_checked()
 		status = ll.set_device_resolution(handle, resolution)
 		self._verify_status(status)
 
@@ -1649,7 +2486,7 @@ class PS6000A:
 		:raises PicoStatusException: Will raise if driver returns a status code
 			other than ``PicoStatus.OK``.
 		"""
-		handle = self.handle
+		handle = self._raw_handle_checked()
 		status, resolution = ll.get_device_resolution(handle)
 		self._verify_status(status)
 		return resolution
@@ -1670,7 +2507,7 @@ class PS6000A:
 		:raises PicoStatusException: Will raise if driver returns a status code
 			other than ``PicoStatus.OK``.
 		"""
-		handle = self.handle
+		handle = self._raw_handle_checked()
 		status = ll.get_scaling_values(handle, scaling_values)
 		self._verify_status(status)
 
@@ -1689,7 +2526,7 @@ class PS6000A:
 		:raises PicoStatusException: Will raise if driver returns a status code
 			other than ``PicoStatus.OK``.
 		"""
-		handle = self.handle
-		status, min_value, max_value = ll.get_adc_limits(handle, resolution)
+		handle = self._raw_handle_checked()
+		status, min_value, max_value = _get_adc_limits(handle, resolution)
 		self._verify_status(status)
 		return min_value, max_value
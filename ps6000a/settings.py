@@ -0,0 +1,83 @@
+"""Grouped channel and trigger settings."""
+###############################################################################
+# Project: PicoScope 6000E Driver
+# File: settings.py
+#
+# Grouped channel and trigger settings.
+#
+# Used with ``PS6000A.configure`` to apply a whole configuration at once.
+#
+# Copyright (c) 2024 Marcus Engineering, LLC (MIT Licensed)
+#
+###############################################################################
+
+from dataclasses import dataclass
+from typing import Sequence
+
+from ps6000a.constants import (
+	PicoAction,
+	PicoBandwidthLimiter,
+	PicoChannel,
+	PicoConnectProbeRange,
+	PicoCoupling,
+)
+from ps6000a.types import PicoCondition, PicoDirection, PicoTriggerChannelProperties
+
+
+@dataclass(frozen=True, slots=True)
+class ChannelSettings:
+	# noinspection PyUnresolvedReferences
+	"""
+	Settings for one enabled analog channel, as for ``set_channel_on``.
+
+	:ivar channel: The channel to be configured.
+	:type channel: PicoChannel
+	:ivar coupling: The impedance and coupling type.
+	:type coupling: PicoCoupling
+	:ivar range_: The input voltage range and probe type.
+	:type range_: PicoConnectProbeRange
+	:ivar analog_offset: A voltage to add to the input channel before
+		digitization. Optional, defaults to 0.
+	:type analog_offset: float
+	:ivar bandwidth: The bandwidth limiter setting. Optional, defaults to
+		``BW_FULL``.
+	:type bandwidth: PicoBandwidthLimiter
+	"""
+
+	channel: PicoChannel
+	coupling: PicoCoupling
+	range_: PicoConnectProbeRange
+	analog_offset: float = 0.0
+	bandwidth: PicoBandwidthLimiter = PicoBandwidthLimiter.BW_FULL
+
+
+@dataclass(frozen=True, slots=True)
+class TriggerSettings:
+	# noinspection PyUnresolvedReferences
+	"""
+	Complete trigger setup, as for the ``set_trigger_channel_*`` functions.
+
+	:ivar conditions: Trigger conditions, as for
+		``set_trigger_channel_conditions``. If empty, triggering is switched
+		off.
+	:type conditions: Sequence[PicoCondition]
+	:ivar directions: Trigger directions, as for
+		``set_trigger_channel_directions``.
+	:type directions: Sequence[PicoDirection]
+	:ivar channel_properties: Trigger properties, as for
+		``set_trigger_channel_properties``.
+	:type channel_properties: Sequence[PicoTriggerChannelProperties]
+	:ivar auto_trigger_micro_seconds: The time in microseconds to wait for a
+		trigger event before collecting data anyway. Optional, defaults to 0
+		(wait indefinitely).
+	:type auto_trigger_micro_seconds: int
+	:ivar action: How to apply ``conditions`` to existing trigger conditions.
+		Optional, defaults to replacing them.
+	:type action: PicoAction
+	"""
+
+	conditions: Sequence[PicoCondition]
+	directions: Sequence[PicoDirection]
+	channel_properties: Sequence[PicoTriggerChannelProperties]
+	auto_trigger_micro_seconds: int = 0
+	action: PicoAction = PicoAction.CLEAR_ALL | PicoAction.ADD
@@ -15,6 +15,7 @@
 ###############################################################################
 
 from ctypes import (
+	Array,
 	Structure,
 	c_double,
 	c_int8,
@@ -24,7 +25,12 @@ from ctypes import (
 	c_uint16,
 	c_uint32,
 	c_uint64,
+	sizeof,
 )
+from functools import cached_property
+from typing import Any, Iterable, Mapping
+
+import numpy as np
 
 from ps6000a.constants import (
 	DIGITAL_PORT_CALIBRATION_DATE_LENGTH,
@@ -43,6 +49,30 @@ from ps6000a.constants import (
 )
 
 
+def _public_dtype(struct: type[Structure]) -> np.dtype:
+	"""
+	Get a NumPy structured dtype with the same layout as a ctypes structure.
+
+	Leading underscores are dropped from the field names, so that e.g. the raw
+	``_status`` field of ``PicoTriggerInfo`` is the ``"status"`` column.
+
+	:param struct: The ctypes structure type.
+	:type struct: type[Structure]
+	:return: The matching structured dtype.
+	:rtype: np.dtype
+	"""
+	dtype = np.dtype(struct)
+	fields: Mapping[str, tuple[Any, ...]] = dtype.fields or {}
+	return np.dtype(
+		{
+			"names": [name.lstrip("_") for name in fields],
+			"formats": [field[0] for field in fields.values()],
+			"offsets": [field[1] for field in fields.values()],
+			"itemsize": dtype.itemsize,
+		}
+	)
+
+
 class PicoTriggerInfo(Structure):
 	# noinspection PyUnresolvedReferences
 	"""
@@ -94,12 +124,12 @@ class PicoTriggerInfo(Structure):
 		:raises ValueError: Will raise if stored value is not a member of the
 			PicoStatus enum type.
 		"""
-		return PicoStatus(self._status)
+		return PicoStatus.from_int(self._status)
 
 	@status.setter
 	def status(self, status: PicoStatus) -> None:
 		"""Update ``_status`` from PicoStatus enum."""
-		self._status = status.value
+		self._status = int(status)
 
 	@property
 	def time_units(self) -> PicoTimeUnits:
@@ -109,12 +139,16 @@ class PicoTriggerInfo(Structure):
 		:raises ValueError: Will raise if stored value is not a member of the
 			PicoTimeUnits enum type.
 		"""
-		return PicoTimeUnits(self._time_units)
+		return PicoTimeUnits.from_int(self._time_units)
 
 	@time_units.setter
 	def time_units(self, time_units: PicoTimeUnits) -> None:
 		"""Update ``_time_units`` from PicoTimeUnits enum."""
-		self._time_units = time_units.value
+		self._time_units = int(time_units)
+
+
+TRIGGER_INFO_DTYPE = _public_dtype(PicoTriggerInfo)
+"""NumPy structured dtype with the same layout as PicoTriggerInfo."""
 
 
 class PicoTriggerChannelProperties(Structure):
@@ -172,12 +206,12 @@ class PicoTriggerChannelProperties(Structure):
 		:raises ValueError: Will raise if stored value is not a member of the
 			PicoChannel enum type.
 		"""
-		return PicoChannel(self._channel)
+		return PicoChannel.from_int(self._channel)
 
 	@channel.setter
 	def channel(self, channel: PicoChannel) -> None:
 		"""Update ``_channel`` from PicoChannel enum."""
-		self._channel = channel.value
+		self._channel = int(channel)
 
 
 class PicoCondition(Structure):
@@ -205,12 +239,12 @@ class PicoCondition(Structure):
 		:raises ValueError: Will raise if stored value is not a member of the
 			PicoChannel enum type.
 		"""
-		return PicoChannel(self._source)
+		return PicoChannel.from_int(self._source)
 
 	@source.setter
 	def source(self, source: PicoChannel) -> None:
 		"""Update ``_source`` from PicoChannel enum."""
-		self._source = source.value
+		self._source = int(source)
 
 	@property
 	def condition(self) -> PicoTriggerState:
@@ -220,12 +254,12 @@ class PicoCondition(Structure):
 		:raises ValueError: Will raise if stored value is not a member of the
 			PicoChannel enum type.
 		"""
-		return PicoTriggerState(self._condition)
+		return PicoTriggerState.from_int(self._condition)
 
 	@condition.setter
 	def condition(self, condition: PicoTriggerState) -> None:
 		"""Update ``_condition`` from PicoTriggerState enum."""
-		self._condition = condition.value
+		self._condition = int(condition)
 
 
 class PicoDirection(Structure):
@@ -260,12 +294,12 @@ class PicoDirection(Structure):
 		:raises ValueError: Will raise if stored value is not a member of the
 			PicoChannel enum type.
 		"""
-		return PicoChannel(self._channel)
+		return PicoChannel.from_int(self._channel)
 
 	@channel.setter
 	def channel(self, channel: PicoChannel) -> None:
 		"""Update ``_channel`` from PicoChannel enum."""
-		self._channel = channel.value
+		self._channel = int(channel)
 
 	@property
 	def direction(self) -> PicoThresholdDirection:
@@ -275,12 +309,12 @@ class PicoDirection(Structure):
 		:raises ValueError: Will raise if stored value is not a member of the
 			PicoThresholdDirection enum type.
 		"""
-		return PicoThresholdDirection(self._direction)
+		return PicoThresholdDirection.from_int(self._direction)
 
 	@direction.setter
 	def direction(self, direction: PicoThresholdDirection) -> None:
 		"""Update ``_direction`` from PicoThresholdDirection enum."""
-		self._direction = direction.value
+		self._direction = int(direction)
 
 	@property
 	def threshold_mode(self) -> PicoThresholdMode:
@@ -290,12 +324,12 @@ class PicoDirection(Structure):
 		:raises ValueError: Will raise if stored value is not a member of the
 			PicoThresholdMode enum type.
 		"""
-		return PicoThresholdMode(self._threshold_mode)
+		return PicoThresholdMode.from_int(self._threshold_mode)
 
 	@threshold_mode.setter
 	def threshold_mode(self, threshold_mode: PicoThresholdMode) -> None:
 		"""Update ``_threshold_mode`` from PicoThresholdMode enum."""
-		self._threshold_mode = threshold_mode.value
+		self._threshold_mode = int(threshold_mode)
 
 
 class PicoStreamingDataInfo(Structure):
@@ -348,12 +382,12 @@ class PicoStreamingDataInfo(Structure):
 		:raises ValueError: Will raise if stored value is not a member of the
 			PicoChannel enum type.
 		"""
-		return PicoChannel(self._channel)
+		return PicoChannel.from_int(self._channel)
 
 	@channel.setter
 	def channel(self, channel: PicoChannel) -> None:
 		"""Update ``_channel`` from PicoChannel enum."""
-		self._channel = channel.value
+		self._channel = int(channel)
 
 	@property
 	def mode(self) -> PicoRatioMode:
@@ -363,12 +397,12 @@ class PicoStreamingDataInfo(Structure):
 		:raises ValueError: Will raise if stored value is not a member of the
 			PicoRatioMode enum type.
 		"""
-		return PicoRatioMode(self._mode)
+		return PicoRatioMode.from_int(self._mode)
 
 	@mode.setter
 	def mode(self, mode: PicoRatioMode) -> None:
 		"""Update ``_mode`` from PicoRatioMode enum."""
-		self._mode = mode.value
+		self._mode = int(mode)
 
 	@property
 	def type(self) -> PicoDataType:
@@ -378,17 +412,17 @@ class PicoStreamingDataInfo(Structure):
 		:raises ValueError: Will raise if stored value is not a member of the
 			PicoDataType enum type.
 		"""
-		return PicoDataType(self._type)
+		return PicoDataType.from_int(self._type)
 
 	@type.setter
 	def type(self, type_: PicoDataType) -> None:
 		"""Update ``_type`` from PicoDataType enum."""
-		self._type = type_.value
+		self._type = int(type_)
 
 	@property
 	def overflow(self) -> bool:
 		"""Turn ``_overflow`` integer into boolean value."""
-		return bool(self._overflow)
+		return self._overflow != 0
 
 	@overflow.setter
 	def overflow(self, overflow: bool) -> None:
@@ -396,6 +430,10 @@ class PicoStreamingDataInfo(Structure):
 		self._overflow = bool(overflow)
 
 
+STREAMING_DATA_INFO_DTYPE = _public_dtype(PicoStreamingDataInfo)
+"""NumPy structured dtype with the same layout as PicoStreamingDataInfo."""
+
+
 class PicoStreamingDataTriggerInfo(Structure):
 	# noinspection PyUnresolvedReferences
 	"""
@@ -424,7 +462,7 @@ class PicoStreamingDataTriggerInfo(Structure):
 	@property
 	def triggered(self) -> bool:
 		"""Turn ``_triggered`` integer into boolean value."""
-		return bool(self._triggered)
+		return self._triggered != 0
 
 	@triggered.setter
 	def triggered(self, triggered: bool) -> None:
@@ -434,7 +472,7 @@ class PicoStreamingDataTriggerInfo(Structure):
 	@property
 	def auto_stop(self) -> bool:
 		"""Turn ``_auto_stop`` integer into boolean value."""
-		return bool(self._auto_stop)
+		return self._auto_stop != 0
 
 	@auto_stop.setter
 	def auto_stop(self, auto_stop: bool) -> None:
@@ -482,12 +520,12 @@ class PicoScalingFactorsValues(Structure):
 		:raises ValueError: Will raise if stored value is not a member of the
 			PicoChannel enum type.
 		"""
-		return PicoChannel(self._channel)
+		return PicoChannel.from_int(self._channel)
 
 	@channel.setter
 	def channel(self, channel: PicoChannel) -> None:
 		"""Update ``_channel`` from PicoChannel enum."""
-		self._channel = channel.value
+		self._channel = int(channel)
 
 	@property
 	def range(self) -> PicoConnectProbeRange:
@@ -497,12 +535,12 @@ class PicoScalingFactorsValues(Structure):
 		:raises ValueError: Will raise if stored value is not a member of the
 			PicoConnectProbeRange enum type.
 		"""
-		return PicoConnectProbeRange(self._range)
+		return PicoConnectProbeRange.from_int(self._range)
 
 	@range.setter
 	def range(self, range_: PicoConnectProbeRange) -> None:
 		"""Update ``_range`` from PicoConnectProbeRange enum."""
-		self._range = range_.value
+		self._range = int(range_)
 
 
 class PicoDigitalChannelDirections(Structure):
@@ -530,12 +568,12 @@ class PicoDigitalChannelDirections(Structure):
 		:raises ValueError: Will raise if stored value is not a member of the
 			PicoChannel enum type.
 		"""
-		return PicoChannel(self._channel)
+		return PicoChannel.from_int(self._channel)
 
 	@channel.setter
 	def channel(self, channel: PicoChannel) -> None:
 		"""Update ``_channel`` from PicoChannel enum."""
-		self._channel = channel.value
+		self._channel = int(channel)
 
 	@property
 	def direction(self) -> PicoDigitalDirection:
@@ -545,12 +583,12 @@ class PicoDigitalChannelDirections(Structure):
 		:raises ValueError: Will raise if stored value is not a member of the
 			PicoDigitalDirection enum type.
 		"""
-		return PicoDigitalDirection(self._direction)
+		return PicoDigitalDirection.from_int(self._direction)
 
 	@direction.setter
 	def direction(self, direction: PicoDigitalDirection) -> None:
 		"""Update ``_direction`` from PicoDigitalDirection enum."""
-		self._direction = direction.value
+		self._direction = int(direction)
 
 
 class PicoDigitalPortInteractions(Structure):
@@ -571,6 +609,10 @@ class PicoDigitalPortInteractions(Structure):
 	]
 
 
+DIGITAL_PORT_INTERACTIONS_DTYPE = np.dtype(PicoDigitalPortInteractions)
+"""NumPy structured dtype with the same layout as PicoDigitalPortInteractions."""
+
+
 class PicoChannelOvervoltageTripped(Structure):
 	"""
 	No documentation available.
@@ -585,6 +627,10 @@ class PicoChannelOvervoltageTripped(Structure):
 	]
 
 
+CHANNEL_OVERVOLTAGE_TRIPPED_DTYPE = np.dtype(PicoChannelOvervoltageTripped)
+"""NumPy structured dtype with the same layout as PicoChannelOvervoltageTripped."""
+
+
 class PicoProbeButtonPressParameter(Structure):
 	# noinspection PyUnresolvedReferences
 	"""
@@ -614,12 +660,12 @@ class PicoProbeButtonPressParameter(Structure):
 		:raises ValueError: Will raise if stored value is not a member of the
 			PicoProbeButtonPressType enum type.
 		"""
-		return PicoProbeButtonPressType(self._button_press_type)
+		return PicoProbeButtonPressType.from_int(self._button_press_type)
 
 	@button_press_type.setter
 	def button_press_type(self, button_press_type: PicoProbeButtonPressType) -> None:
 		"""Update ``_button_press_type`` from PicoProbeButtonPressType enum."""
-		self._button_press_type = button_press_type.value
+		self._button_press_type = int(button_press_type)
 
 
 class PicoUserProbeInteractions(Structure):
@@ -651,6 +697,166 @@ class PicoUserProbeInteractions(Structure):
 	]
 
 
+USER_PROBE_INTERACTIONS_DTYPE = np.dtype(PicoUserProbeInteractions)
+"""NumPy structured dtype with the same layout as PicoUserProbeInteractions."""
+
+
+class PicoTriggerInfoView:
+	"""
+	Read-only snapshot of a ``PicoTriggerInfo`` structure.
+
+	Plain fields are copied once; ``status`` and ``time_units`` are converted
+	to enums on first access and then cached. Use ``trigger_info_views`` to
+	convert a whole array returned by ``get_trigger_info`` before iterating
+	over it repeatedly.
+
+	:ivar segment_index: The number of the segment.
+	:type segment_index: int
+	:ivar trigger_index: The index of the sample at which the trigger occurred.
+	:type trigger_index: int
+	:ivar trigger_time: The time at which the trigger occurred.
+	:type trigger_time: float
+	:ivar missed_triggers: The number of trigger events, if any, detected since
+		the start of previous segment.
+	:type missed_triggers: int
+	:ivar time_stamp_counter: The time in samples from the first capture to the
+		current capture.
+	:type time_stamp_counter: int
+	"""
+
+	def __init__(self, info: PicoTriggerInfo) -> None:
+		"""
+		Take a snapshot of a ``PicoTriggerInfo`` structure.
+
+		:param info: The populated structure.
+		:type info: PicoTriggerInfo
+		"""
+		self._status = info._status
+		self._time_units = info._time_units
+		self.segment_index = info.segment_index
+		self.trigger_index = info.trigger_index
+		self.trigger_time = info.trigger_time
+		self.missed_triggers = info.missed_triggers
+		self.time_stamp_counter = info.time_stamp_counter
+
+	@cached_property
+	def status(self) -> PicoStatus:
+		"""Indicates success or failure."""
+		return PicoStatus(self._status)
+
+	@cached_property
+	def time_units(self) -> PicoTimeUnits:
+		"""The units for ``trigger_time``."""
+		return PicoTimeUnits(self._time_units)
+
+
+class PicoStreamingDataInfoView:
+	"""
+	Read-only snapshot of a ``PicoStreamingDataInfo`` structure.
+
+	Plain fields are copied once; ``channel``, ``mode``, and ``type`` are
+	converted to enums on first access and then cached. Use
+	``streaming_data_info_views`` to convert a whole array returned by
+	``get_streaming_latest_values``.
+
+	:ivar no_of_samples: The number of samples made available by the driver.
+	:type no_of_samples: int
+	:ivar buffer_index: An index to the starting sample with the specified
+		waveform buffer.
+	:type buffer_index: int
+	:ivar start_index: An index to the waveform buffer within the capture
+		buffer.
+	:type start_index: int
+	:ivar overflow: True if any sample value overflowed, False otherwise.
+	:type overflow: bool
+	"""
+
+	def __init__(self, info: PicoStreamingDataInfo) -> None:
+		"""
+		Take a snapshot of a ``PicoStreamingDataInfo`` structure.
+
+		:param info: The populated structure.
+		:type info: PicoStreamingDataInfo
+		"""
+		self._channel = info._channel
+		self._mode = info._mode
+		self._type = info._type
+		self.no_of_samples = info.no_of_samples
+		self.buffer_index = info.buffer_index
+		self.start_index = info.start_index
+		self.overflow = info._overflow != 0
+
+	@cached_property
+	def channel(self) -> PicoChannel:
+		"""The oscilloscope channel that the parameters apply to."""
+		return PicoChannel(self._channel)
+
+	@cached_property
+	def mode(self) -> PicoRatioMode:
+		"""The downsampling mode used."""
+		return PicoRatioMode(self._mode)
+
+	@cached_property
+	def type(self) -> PicoDataType:
+		"""The data type used for the sample data."""
+		return PicoDataType(self._type)
+
+
+def trigger_info_views(
+	infos: Iterable[PicoTriggerInfo],
+) -> list[PicoTriggerInfoView]:
+	"""
+	Snapshot each ``PicoTriggerInfo`` structure as a ``PicoTriggerInfoView``.
+
+	:param infos: The populated structures, e.g. from ``get_trigger_info``.
+	:type infos: Iterable[PicoTriggerInfo]
+	:return: One view per structure, in the same order.
+	:rtype: list[PicoTriggerInfoView]
+	"""
+	return [PicoTriggerInfoView(info) for info in infos]
+
+
+def streaming_data_info_views(
+	infos: Iterable[PicoStreamingDataInfo],
+) -> list[PicoStreamingDataInfoView]:
+	"""
+	Snapshot each ``PicoStreamingDataInfo`` as a ``PicoStreamingDataInfoView``.
+
+	:param infos: The populated structures, e.g. from
+		``get_streaming_latest_values``.
+	:type infos: Iterable[PicoStreamingDataInfo]
+	:return: One view per structure, in the same order.
+	:rtype: list[PicoStreamingDataInfoView]
+	"""
+	return [PicoStreamingDataInfoView(info) for info in infos]
+
+
+def as_structured_array(array: "Array[Any]", dtype: np.dtype) -> np.ndarray:
+	"""
+	View a ctypes array of structures as a NumPy structured array.
+
+	No data is copied, so columns such as ``view["trigger_time"]`` can be
+	processed with vectorized NumPy operations directly. The view keeps
+	``array`` alive.
+
+	:param array: The ctypes array, e.g. from ``get_trigger_info``.
+	:type array: Array[Any]
+	:param dtype: Structured dtype matching the array's structure type, e.g.
+		``TRIGGER_INFO_DTYPE``.
+	:type dtype: np.dtype
+	:return: Structured array sharing memory with ``array``.
+	:rtype: np.ndarray
+	:raises ValueError: Will raise if ``dtype`` does not match the size of the
+		array's elements.
+	"""
+	if sizeof(array) != dtype.itemsize * len(array):
+		raise ValueError(
+			f"Structured dtype of {dtype.itemsize} bytes does not match "
+			f"{type(array).__name__}"
+		)
+	return np.frombuffer(memoryview(array), dtype=dtype)
+
+
 class PicoHandle(int):
 	"""The handle to the PicoScope hardware."""
 
@@ -665,3 +871,37 @@ class PicoHandle(int):
 		:rtype: bool
 		"""
 		return self > 0
+
+	def __bool__(self) -> bool:
+		"""
+		Check if this handle is valid, as ``valid``.
+
+		Unlike a plain int, negative (error) handles are falsy, so
+		``if handle:`` is a complete validity check.
+
+		:return: True if this handle is valid, False otherwise.
+		:rtype: bool
+		"""
+		return self > 0
+
+
+_HANDLES: dict[int, PicoHandle] = {}
+
+
+def intern_handle(handle: int) -> PicoHandle:
+	"""
+	Get the shared ``PicoHandle`` instance for a raw handle value.
+
+	Driver callbacks receive the handle as a plain integer on every call.
+	Reusing one ``PicoHandle`` per value avoids constructing a new int subclass
+	instance each time.
+
+	:param handle: The raw handle value.
+	:type handle: int
+	:return: The ``PicoHandle`` for this value.
+	:rtype: PicoHandle
+	"""
+	boxed = _HANDLES.get(handle)
+	if boxed is None:
+		boxed = _HANDLES[handle] = PicoHandle(handle)
+	return boxed
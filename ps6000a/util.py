@@ -14,7 +14,10 @@
 ###############################################################################
 
 from enum import IntEnum, IntFlag
-from typing import Any
+from typing import Any, TypeVar
+
+_T = TypeVar("_T", bound="FlexIntEnum")
+_F = TypeVar("_F", bound="FlexIntFlag")
 
 
 class FlexIntEnum(IntEnum):
@@ -36,6 +39,24 @@ class FlexIntEnum(IntEnum):
 	fake member.
 	"""
 
+	@classmethod
+	def from_int(cls: type[_T], value: int) -> _T:
+		"""
+		Get the member for an integer value, as ``cls(value)`` but faster.
+
+		Known values (including fake members already created) are looked up
+		directly in ``_value2member_map_``, skipping the enum constructor.
+
+		:param value: Integer value of the member.
+		:type value: int
+		:return: The matching (possibly fake) member.
+		:rtype: FlexIntEnum
+		"""
+		member = cls._value2member_map_.get(value)
+		if member is not None:
+			return member  # type: ignore
+		return cls(value)
+
 	@classmethod
 	def _missing_(cls, value: Any) -> "FlexIntEnum":
 		"""
@@ -44,16 +65,34 @@ class FlexIntEnum(IntEnum):
 		Alternatively, create a new "fake" member to accomodate an unknown
 		name/value.
 
+		Fake members are stored in ``_value2member_map_``, so each unknown
+		value only reaches this method once. Integer values skip the name
+		lookup, which could never succeed for them.
+
 		:param value: FlexIntEnum member name.
 		:type value: Any
 		"""
-		try:
-			return cls[value]
-		except KeyError:
-			fake = int.__new__(cls, value)
-			fake._name_ = str(value)
-			fake._value_ = value
-			return cls._value2member_map_.setdefault(value, fake)  # type: ignore
+		if not isinstance(value, int):
+			try:
+				return cls[value]
+			except KeyError:
+				pass
+		fake = int.__new__(cls, value)
+		fake._name_ = cls._fake_member_name(value)
+		fake._value_ = value
+		return cls._value2member_map_.setdefault(value, fake)  # type: ignore
+
+	@classmethod
+	def _fake_member_name(cls, value: Any) -> str:
+		"""
+		Get the name to give a "fake" member created for an unknown value.
+
+		:param value: Value of the new fake member.
+		:type value: Any
+		:return: Name of the new fake member.
+		:rtype: str
+		"""
+		return str(value)
 
 
 class FlexIntFlag(IntFlag):
@@ -73,6 +112,24 @@ class FlexIntFlag(IntFlag):
 	not currently supported.
 	"""
 
+	@classmethod
+	def from_int(cls: type[_F], value: int) -> _F:
+		"""
+		Get the member for an integer value, as ``cls(value)`` but faster.
+
+		Known values (including compound flags already created) are looked up
+		directly in ``_value2member_map_``, skipping the flag constructor.
+
+		:param value: Integer value of the member.
+		:type value: int
+		:return: The matching (possibly compound) member.
+		:rtype: FlexIntFlag
+		"""
+		member = cls._value2member_map_.get(value)
+		if member is not None:
+			return member  # type: ignore
+		return cls(value)
+
 	@classmethod
 	def _missing_(cls, value: Any) -> "FlexIntFlag":
 		"""
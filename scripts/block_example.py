@@ -13,7 +13,9 @@
 #
 ###############################################################################
 
-import time
+import threading
+
+import numpy as np
 
 from ps6000a.constants import (
 	PicoBandwidthLimiter,
@@ -37,7 +39,10 @@ OFFSET = 0.0
 SAMPS = 100_000
 TRIG_DIR = PicoThresholdDirection.FALLING
 TRIG_THR = 0.1  # volts
-TRIG_THR_CT = int(TRIG_THR / RANGE.full_scale * RES.min_type.max)
+DATA_TYPE = RES.min_type
+MAX_CT = DATA_TYPE.max
+VOLT_SCALE = RANGE.full_scale / MAX_CT  # volts per count
+TRIG_THR_CT = int(TRIG_THR / VOLT_SCALE)
 
 ps = PS6000A()
 if not ps.open_unit(None, RES):
@@ -46,7 +51,7 @@ if not ps.open_unit(None, RES):
 if ps.last_status != PicoStatus.OK:
 	print(f"Result of open_unit is {ps.last_status.name}.")
 	exit(-1)
-if ps.raw_handle is None or ps.raw_handle <= 0:
+if not ps.raw_handle:
 	print("Could not find/open scope.")
 	exit(-1)
 
@@ -54,7 +59,7 @@ ps.set_channel_off(PicoChannel.CHANNEL_A)
 ps.set_channel_off(PicoChannel.CHANNEL_B)
 ps.set_channel_off(PicoChannel.CHANNEL_C)
 ps.set_channel_off(PicoChannel.CHANNEL_D)
-ps.clear_data_buffers(CHAN, PicoDeviceResolution.DR_12BIT.min_type, 0)
+ps.clear_data_buffers(CHAN, DATA_TYPE, 0)
 
 ps.set_channel_on(
 	channel=CHAN,
@@ -75,14 +80,17 @@ ps.set_simple_trigger(
 buf = ps.get_data_buffer(
 	channel=CHAN,
 	n_samples=SAMPS,
-	data_type=RES.min_type,
+	data_type=DATA_TYPE,
 	segment=0,
 	down_sample_ratio_mode=PicoRatioMode.RAW,
 	clear_others=True,
 )
-ready = False
+ready = threading.Event()
 timebase, interval = ps.nearest_sample_interval_stateless(CHAN.flag, 1 / RATE, RES)
 print(f"true rate: {1 / interval:.0f}Hz")
+# The time axis only depends on the interval and sample count, so it is built
+# once here rather than for every capture.
+x_axis = np.linspace(-interval * (SAMPS // 2), interval * (SAMPS // 2), SAMPS)
 
 
 def callback(handle: PicoHandle, status: PicoStatus) -> None:
@@ -90,16 +98,15 @@ def callback(handle: PicoHandle, status: PicoStatus) -> None:
 	Relay that data is ready.
 
 	Callbacks are totally optional! You could poll with ``is_ready`` instead.
+	This runs on a driver thread; ``Event.set`` wakes the main thread at once.
 	"""
-	global ready
-	ready = True
+	ready.set()
 
 
 ps.run_block(SAMPS // 2, SAMPS // 2, timebase, buf.segment, callback)
 
 # while not ps.is_ready():  # if you didn't use a callback
-while not ready:
-	time.sleep(0.1)
+while not ready.wait(0.5):
 	print(".", end="")
 print("trig")
 
@@ -110,12 +117,12 @@ if ovf:
 
 try:
 	import matplotlib.pyplot as plt
-	import numpy as np
 except ImportError:
-	print("Won't plot, need numpy and matplotlib.")
+	print("Won't plot, need matplotlib.")
 else:
-	plt.plot(
-		np.linspace(-interval * (SAMPS // 2), interval * (SAMPS // 2), SAMPS),
-		np.array(buf.buffer) / RES.min_type.max * RANGE.full_scale,
-	)
+	# A zero-copy view of the buffer the driver wrote into.
+	samples = buf.as_ndarray()
+	# Counts to volts in a single float32 pass.
+	scale = np.float32(VOLT_SCALE)
+	plt.plot(x_axis, np.multiply(samples, scale, dtype=np.float32))
 	plt.show()
@@ -14,6 +14,7 @@
 #
 ###############################################################################
 
+from ctypes import Array
 import time
 
 try:
@@ -47,7 +48,10 @@ SAMPS = 100_000
 TARG_TIME = 1.0
 TRIG_DIR = PicoThresholdDirection.FALLING
 TRIG_THR = 0.1  # volts
-TRIG_THR_CT = int(TRIG_THR / RANGE.full_scale * RES.min_type.max)
+DATA_TYPE = RES.min_type
+MAX_CT = DATA_TYPE.max
+VOLT_SCALE = RANGE.full_scale / MAX_CT  # volts per count
+TRIG_THR_CT = int(TRIG_THR / VOLT_SCALE)
 
 ps = PS6000A()
 if not ps.open_unit(None, RES):
@@ -56,7 +60,7 @@ if not ps.open_unit(None, RES):
 if ps.last_status != PicoStatus.OK:
 	print(f"Result of open_unit is {ps.last_status.name}.")
 	exit(-1)
-if ps.raw_handle is None or ps.raw_handle <= 0:
+if not ps.raw_handle:
 	print("Could not find/open scope.")
 	exit(-1)
 
@@ -81,13 +85,19 @@ ps.set_simple_trigger(
 	auto_trigger_micro_seconds=0,
 )
 
-buf = ps.get_data_buffer(
-	channel=CHAN,
-	n_samples=SAMPS,
-	data_type=RES.min_type,
-	segment=0,
-	down_sample_ratio_mode=PicoRatioMode.RAW,
-	clear_others=True,
+# Two buffers, so the driver always has an empty one to write into while the
+# last full one is copied out. Each call replaces the previous registration,
+# so ``buf_a`` is registered and ``buf_b`` is kept in reserve.
+buf_b, buf_a = (
+	ps.get_data_buffer(
+		channel=CHAN,
+		n_samples=SAMPS,
+		data_type=DATA_TYPE,
+		segment=0,
+		down_sample_ratio_mode=PicoRatioMode.RAW,
+		clear_others=True,
+	)
+	for _ in range(2)
 )
 # Sum of ``max_pre_trigger_samples`` and ``max_post_trigger_samples`` must
 # be 64 or greater, or the API call will fail with an undocumented error
@@ -106,12 +116,25 @@ print(f"true rate={1/interval:.1f}Hz")
 
 target_samples = int(TARG_TIME / interval)
 total_samples = 0
-result: np.ndarray = np.zeros(target_samples, dtype=RES.min_type.numpy_type)
+# Every sample is written by the callback below before it is used, so there is
+# no need to zero-fill the result first.
+result: np.ndarray = np.empty(target_samples, dtype=DATA_TYPE.numpy_type)
+# Byte views of the result and of the driver's buffers, so copies below are a
+# plain memcpy with no NumPy indexing. The buffers are only ever swapped, never
+# reallocated, so the views stay valid for the whole run.
+result_mv = result.data.cast("B")
+active = (buf_a, memoryview(buf_a.buffer).cast("B"))
+standby = (buf_b, memoryview(buf_b.buffer).cast("B"))
+item_size = result.itemsize
+# Bound once, since the callback below runs for every batch of samples.
+reload_buffers = ps.set_data_buffers
 run_time_start = time.perf_counter()
 overflow = False
 
-while total_samples < target_samples:
-	full, sdia, _ = ps.get_streaming_latest_values()
+
+def on_data(full: bool, sdia: "Array[PicoStreamingDataInfo]") -> bool:
+	"""Copy each full driver buffer into the result."""
+	global total_samples, overflow, active, standby
 	sdi: PicoStreamingDataInfo = sdia[0]
 
 	# The REAL TRUTH about PicoStreamingDataInfo: What the manual says is
@@ -126,22 +149,37 @@ while total_samples < target_samples:
 	# still true, but the buffer is also completely full, starting at the
 	# very first index. And you need to load a new one to get more samples.
 
-	# So for example here... if you just waited until full was True,
-	# then you could set sa_start to 0 and sa_count to buffer.buffer.size.
-	# And that probably is the more efficient way to do it anyways. But
-	# just for demonstration we are really taking some samples every loop.
-	sa_start = sdi.start_index
-	sa_count = sdi.no_of_samples
-	sa_count = min(sa_count, target_samples - total_samples)
-	trim_buffer = np.array(buf.buffer)
-	trim_buffer = trim_buffer[sa_start : sa_start + sa_count]
-	result[total_samples : total_samples + sa_count] = trim_buffer
-	total_samples += sa_count
-	if full:
-		ps.set_data_buffers(buf)
-		print(".", end="")
+	# So here we just wait until full is True and then take the whole buffer
+	# in one copy, starting at index 0. The only exception is the last,
+	# partial buffer: once it holds enough samples to reach the target, take
+	# those from the start of the buffer and stop.
+	# Every ctypes field access builds a new int, so only read the fields
+	# that are needed: a full buffer doesn't need its start or count.
 	if sdi.overflow:
 		overflow = True
+	remaining = target_samples - total_samples
+	if full:
+		sa_count = min(SAMPS, remaining)
+	elif sdi.start_index + sdi.no_of_samples >= remaining:
+		sa_count = remaining
+	else:
+		return True
+	ring_mv = active[1]
+	if full:
+		# Hand the driver the spare buffer first, then copy from this one.
+		reload_buffers(standby[0], clear_others=True)
+		active, standby = standby, active
+		print(".", end="")
+	n_bytes = sa_count * item_size
+	dst = total_samples * item_size
+	result_mv[dst : dst + n_bytes] = ring_mv[:n_bytes]
+	total_samples += sa_count
+	return total_samples < target_samples
+
+
+# Polling happens on a background thread, which only calls ``on_data`` when the
+# driver has samples (or a full buffer) to hand over.
+ps.poll_streaming_in_background(on_data).result()
 
 run_time_end = time.perf_counter()
 run_time = run_time_end - run_time_start
@@ -154,8 +192,12 @@ print(f"{total_samples=}")
 if overflow:
 	print("overflow")
 
-plt.plot(
-	np.linspace(0, interval * target_samples, target_samples),
-	result / RES.min_type.max * RANGE.full_scale,
-)
+# Convert to volts in one pass, straight into a float32 array.
+scale = np.float32(VOLT_SCALE)
+volts = np.empty(target_samples, dtype=np.float32)
+np.multiply(result, scale, out=volts, dtype=np.float32)
+# Uniform grid with a known step, so no need for linspace's float64 math.
+x_axis = np.arange(target_samples, dtype=np.float32)
+x_axis *= np.float32(interval)
+plt.plot(x_axis, volts)
 plt.show()
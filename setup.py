@@ -0,0 +1,36 @@
+"""Optional native extension build."""
+###############################################################################
+# Project: PicoScope 6000E Driver
+# File: setup.py
+#
+# Project metadata lives in pyproject.toml. This file only exists to build the
+# optional native bindings in ps6000a/_ps6000a_fast.c, which needs the Pico
+# SDK headers and import library. Set PICO_SDK_DIR to the SDK install folder
+# (the one containing "inc" and "lib") to build it; otherwise a pure-Python
+# package is built, exactly as before.
+#
+# Copyright (c) 2024 Marcus Engineering, LLC (MIT Licensed)
+#
+###############################################################################
+
+import os
+from pathlib import Path
+
+from setuptools import Extension, setup
+
+ext_modules: list[Extension] = []
+
+_sdk_dir = os.environ.get("PICO_SDK_DIR")
+if _sdk_dir:
+	_sdk_path = Path(_sdk_dir)
+	ext_modules.append(
+		Extension(
+			"ps6000a._ps6000a_fast",
+			sources=["ps6000a/_ps6000a_fast.c"],
+			include_dirs=[str(_sdk_path / "inc")],
+			library_dirs=[str(_sdk_path / "lib")],
+			libraries=["ps6000a"],
+		)
+	)
+
+setup(ext_modules=ext_modules)
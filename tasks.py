@@ -107,6 +107,19 @@ def build_docs() -> bool:
 		return True
 
 
+@_collect_task
+def compile_wrappers() -> bool:
+	"""Compile the low-level wrapper module in place with mypyc."""
+	basepath = Path(__file__).parent.absolute()
+	os.chdir(basepath)
+	res = _pyrun(f"-m mypyc {Path('ps6000a') / 'functions.py'}")
+	if res != 0:
+		print("mypyc failed!")
+		return False
+	else:
+		return True
+
+
 @_collect_task
 def run_tests() -> bool:
 	"""Discover and run all tests in the tests folder."""
@@ -0,0 +1,233 @@
+"""Tests for buffer registration and reuse, without the driver."""
+###############################################################################
+# Project: PicoScope 6000E Driver
+# File: test_buffer_registry.py
+#
+# Tests for buffer registration and reuse, without the driver.
+#
+# Copyright (c) 2024 Marcus Engineering, LLC (MIT Licensed)
+#
+###############################################################################
+
+from contextlib import ExitStack, contextmanager
+import ctypes
+import importlib
+import sys
+from types import ModuleType
+from typing import TYPE_CHECKING, Iterator
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import ps6000a
+from ps6000a.buffers import Buffer
+from ps6000a.constants import (
+	PicoAction,
+	PicoChannel,
+	PicoDataType,
+	PicoRatioMode,
+	PicoStatus,
+)
+from ps6000a.types import PicoHandle
+
+if TYPE_CHECKING:
+	from ps6000a.ps6000a import PS6000A
+
+# Modules that load the driver when imported.
+_DRIVER_MODULES = ("ps6000a.functions", "ps6000a.callbacks", "ps6000a.ps6000a")
+
+
+@contextmanager
+def _stub_driver() -> Iterator[None]:
+	"""Make the driver modules importable with a dummy DLL.
+
+	Every driver function is a mock, so tests must patch the ones they use. The
+	real modules (if any) are put back on exit, both in ``sys.modules`` and as
+	attributes of the package.
+	"""
+	with ExitStack() as stack:
+		stack.enter_context(mock.patch.dict(sys.modules))
+		stack.enter_context(
+			mock.patch.object(ctypes, "windll", mock.MagicMock(), create=True)
+		)
+		stack.enter_context(
+			mock.patch.object(ctypes, "WINFUNCTYPE", ctypes.CFUNCTYPE, create=True)
+		)
+		stack.enter_context(
+			mock.patch("ctypes.util.find_library", return_value="ps6000a")
+		)
+		sys.modules["ps6000a._ps6000a_fast"] = None  # type: ignore[assignment]
+		for name in _DRIVER_MODULES:
+			sys.modules.pop(name, None)
+			attr = name.rpartition(".")[2]
+			stack.enter_context(mock.patch.object(ps6000a, attr, None, create=True))
+		yield
+
+
+def _import_api() -> ModuleType:
+	with _stub_driver():
+		return importlib.import_module("ps6000a.ps6000a")
+
+
+_api = _import_api()
+
+
+class TestBufferPool(unittest.TestCase):
+	"""Tests for buffer memory reuse, with the driver calls mocked out."""
+
+	ps: "PS6000A"
+
+	def setUp(self) -> None:
+		"""Create an instance with a dummy handle and a mocked driver."""
+		patcher = mock.patch.object(
+			_api, "_set_data_buffers", return_value=PicoStatus.OK
+		)
+		patcher.start()
+		self.addCleanup(patcher.stop)
+		self.ps = _api.PS6000A()
+		self.ps.raw_handle = PicoHandle(1)
+
+	def _get(self) -> Buffer:
+		return self.ps.get_data_buffer(
+			PicoChannel.CHANNEL_A, 4096, PicoDataType.INT16_T, 0, PicoRatioMode.RAW
+		)
+
+	def _clear(self) -> None:
+		self.ps.clear_data_buffers(PicoChannel.CHANNEL_A, PicoDataType.INT16_T, 0)
+
+	def test_round_trip(self) -> None:
+		"""Test that a released buffer's memory is zeroed and reused."""
+		buffer = self._get()
+		buffer.as_ndarray()[:] = 7
+		self._clear()
+		self.ps.release_buffer(buffer)
+		reused = self._get()
+		self.assertIs(reused.buffer, buffer.buffer)
+		self.assertFalse(reused.as_ndarray().any())
+
+	def test_double_release(self) -> None:
+		"""Test that releasing a buffer twice does not pool it twice."""
+		buffer = self._get()
+		self._clear()
+		self.ps.release_buffer(buffer)
+		self.ps.release_buffer(buffer)
+		first = self._get()
+		second = self.ps.get_data_buffer(
+			PicoChannel.CHANNEL_B, 4096, PicoDataType.INT16_T, 0, PicoRatioMode.RAW
+		)
+		self.assertIsNot(first.buffer, second.buffer)
+
+	def test_caller_owned(self) -> None:
+		"""Test that caller-owned memory is never zeroed or pooled."""
+		array = np.ones(4096, dtype=np.int16)
+		buffer = self.ps.get_data_buffer_from_array(
+			PicoChannel.CHANNEL_A,
+			array,
+			PicoDataType.INT16_T,
+			0,
+			PicoRatioMode.RAW,
+		)
+		self._clear()
+		self.ps.release_buffer(buffer)
+		self.assertTrue((array == 1).all())
+		self.assertIsNot(self._get().buffer, buffer.buffer)
+
+	def test_registered(self) -> None:
+		"""Test that a buffer still registered with the driver is rejected."""
+		buffer = self._get()
+		with self.assertRaises(ValueError):
+			self.ps.release_buffer(buffer)
+
+	def test_pool_cap(self) -> None:
+		"""Test that only a few buffers of each type and length are kept."""
+		channels = list(PicoChannel)[: _api.MAX_POOLED_BUFFERS + 1]
+		for channel in channels:
+			self.ps.get_data_buffer(
+				channel, 4096, PicoDataType.INT16_T, 0, PicoRatioMode.RAW
+			)
+		for channel in channels:
+			self.ps.clear_data_buffers(channel, PicoDataType.INT16_T, 0, release=True)
+		pool = self.ps._buffer_pool[(PicoDataType.INT16_T, 4096)]
+		self.assertEqual(len(pool), _api.MAX_POOLED_BUFFERS)
+
+	def test_close_unit(self) -> None:
+		"""Test that closing the unit empties the pool."""
+		buffer = self._get()
+		self._clear()
+		self.ps.release_buffer(buffer)
+		with mock.patch.object(_api.ll, "close_unit", return_value=PicoStatus.OK):
+			self.ps.close_unit()
+		self.ps.raw_handle = PicoHandle(1)
+		self.assertIsNot(self._get().buffer, buffer.buffer)
+
+
+class TestBatchedBufferSetup(unittest.TestCase):
+	"""Tests for deferred buffer registration, with the driver mocked out."""
+
+	ps: "PS6000A"
+
+	def setUp(self) -> None:
+		"""Create an instance with a dummy handle and a recording driver."""
+		patcher = mock.patch.object(
+			_api, "_set_data_buffers", return_value=PicoStatus.OK
+		)
+		self.driver = patcher.start()
+		self.addCleanup(patcher.stop)
+		self.ps = _api.PS6000A()
+		self.ps.raw_handle = PicoHandle(1)
+
+	def test_replay_order(self) -> None:
+		"""Test that a repeated call is replayed after later calls."""
+		with self.ps.batched_buffer_setup():
+			for channel, clear_others in (
+				(PicoChannel.CHANNEL_A, False),
+				(PicoChannel.CHANNEL_B, True),
+				(PicoChannel.CHANNEL_A, False),
+			):
+				self.ps.get_data_buffer(
+					channel,
+					64,
+					PicoDataType.INT16_T,
+					0,
+					PicoRatioMode.RAW,
+					clear_others=clear_others,
+				)
+			self.driver.assert_not_called()
+		calls = [(c.args[1], c.args[7]) for c in self.driver.call_args_list]
+		self.assertEqual(
+			calls,
+			[
+				(PicoChannel.CHANNEL_B, PicoAction.CLEAR_ALL | PicoAction.ADD),
+				(PicoChannel.CHANNEL_A, PicoAction.ADD),
+			],
+		)
+
+	def test_replay_clear_first(self) -> None:
+		"""Test that a repeated clearing call keeps its place in the replay."""
+		with self.ps.batched_buffer_setup():
+			for channel, clear_others in (
+				(PicoChannel.CHANNEL_A, True),
+				(PicoChannel.CHANNEL_B, False),
+				(PicoChannel.CHANNEL_A, False),
+			):
+				self.ps.get_data_buffer(
+					channel,
+					64,
+					PicoDataType.INT16_T,
+					0,
+					PicoRatioMode.RAW,
+					clear_others=clear_others,
+				)
+		calls = [(c.args[1], c.args[7]) for c in self.driver.call_args_list]
+		self.assertEqual(
+			calls,
+			[
+				(PicoChannel.CHANNEL_A, PicoAction.CLEAR_ALL | PicoAction.ADD),
+				(PicoChannel.CHANNEL_B, PicoAction.ADD),
+			],
+		)
+
+
+if __name__ == "__main__":
+	unittest.main()
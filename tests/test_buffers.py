@@ -0,0 +1,92 @@
+"""Tests for the data buffer allocation helpers."""
+###############################################################################
+# Project: PicoScope 6000E Driver
+# File: test_buffers.py
+#
+# Tests for the data buffer allocation helpers.
+#
+# Copyright (c) 2024 Marcus Engineering, LLC (MIT Licensed)
+#
+###############################################################################
+
+from ctypes import addressof, sizeof
+import unittest
+
+import numpy as np
+
+from ps6000a.buffers import (
+	BUFFER_ALIGNMENT,
+	Buffer,
+	_aligned_zeros,
+	make_data_array,
+	make_waveform_buffer,
+)
+from ps6000a.constants import PicoChannel, PicoDataType, PicoRatioMode
+
+
+class TestAlignedZeros(unittest.TestCase):
+	"""Tests for aligned array allocation."""
+
+	def test_aligned(self) -> None:
+		"""Test that arrays of several sizes start on an aligned address."""
+		for n_samples in (1, 3, 64, 1000):
+			with self.subTest(n_samples=n_samples):
+				array = _aligned_zeros(n_samples, np.int16)
+				self.assertEqual(array.ctypes.data % BUFFER_ALIGNMENT, 0)
+
+	def test_contents(self) -> None:
+		"""Test the length, type and zero-fill of the array."""
+		array = _aligned_zeros(100, np.int32)
+		self.assertEqual(array.shape, (100,))
+		self.assertEqual(array.dtype, np.int32)
+		self.assertFalse(array.any())
+
+	def test_waveform_buffer(self) -> None:
+		"""Test the waveform buffer type and size checks."""
+		buffer = make_waveform_buffer(500)
+		self.assertEqual(buffer.shape, (500,))
+		self.assertEqual(buffer.dtype, np.int16)
+		self.assertEqual(buffer.ctypes.data % BUFFER_ALIGNMENT, 0)
+		with self.assertRaises(ValueError):
+			make_waveform_buffer(0)
+
+
+class TestDataArray(unittest.TestCase):
+	"""Tests for sample data array allocation."""
+
+	def test_data_array(self) -> None:
+		"""Test the length, type, alignment and zero-fill for each data type."""
+		for data_type in PicoDataType:
+			with self.subTest(data_type=data_type.name):
+				array = make_data_array(data_type, 257)
+				self.assertEqual(len(array), 257)
+				self.assertIs(array._type_, data_type.ctype)
+				self.assertEqual(sizeof(array), 257 * sizeof(data_type.ctype))
+				self.assertEqual(addressof(array) % BUFFER_ALIGNMENT, 0)
+				self.assertFalse(any(array))
+
+
+class TestBuffer(unittest.TestCase):
+	"""Tests for the Buffer wrapper."""
+
+	def test_as_ndarray(self) -> None:
+		"""Test that the NumPy view shares memory with the ctypes array."""
+		buffer = Buffer(
+			buffer=make_data_array(PicoDataType.INT16_T, 16),
+			channel=PicoChannel.CHANNEL_A,
+			datatype=PicoDataType.INT16_T,
+			segment=0,
+			downsampling_mode=PicoRatioMode.RAW,
+		)
+		view = buffer.as_ndarray()
+		self.assertEqual(view.dtype, np.int16)
+		self.assertEqual(view.shape, (16,))
+		self.assertEqual(view.ctypes.data, addressof(buffer.buffer))
+		buffer.buffer[3] = -5
+		self.assertEqual(view[3], -5)
+		view[4] = 9
+		self.assertEqual(buffer.buffer[4], 9)
+
+
+if __name__ == "__main__":
+	unittest.main()
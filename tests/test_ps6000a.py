@@ -48,29 +48,25 @@ logger = logging.getLogger(__name__)
 class TestPicoScope6000A(unittest.TestCase):
 	"""Tests for some operations on a real PicoScope device."""
 
-	def __init__(self, methodName: str = "runTest") -> None:
-		"""Initialize TestPicoScope6000A suite."""
+	ps: "PS6000A"
+
+	@classmethod
+	def setUpClass(cls) -> None:
+		"""Open PicoScope device once, shared by every test."""
 		logging.basicConfig(level=logging.INFO)
-		super().__init__(methodName)
-		self._skip_all = False
-
-	def setUp(self) -> None:
-		"""Open PicoScope device."""
-		if self._skip_all:
-			raise unittest.SkipTest("Device not connected.")
-		self.ps = PS6000A()
+		cls.ps = PS6000A()
 		try:
-			assert self.ps.open_unit(None, PicoDeviceResolution.DR_8BIT)
+			assert cls.ps.open_unit(None, PicoDeviceResolution.DR_8BIT)
 		except PicoStatusError as e:
 			if e.status == PicoStatus.NOT_FOUND:
-				self._skip_all = True
 				raise unittest.SkipTest("Device not connected.")
 			else:
 				raise e
 
-	def tearDown(self) -> None:
+	@classmethod
+	def tearDownClass(cls) -> None:
 		"""Close PicoScope device."""
-		self.ps.close_unit()
+		cls.ps.close_unit()
 
 	def test_aaa_unit_open(self) -> None:
 		"""Test that unit was opened successfully (must be first test)."""
@@ -108,14 +104,15 @@ class TestPicoScope6000A(unittest.TestCase):
 		]
 
 		for info_code in info_items:
-			try:
-				string = self.ps.get_unit_info(info_code)
-			except PicoStatusError:
-				self.fail(
-					f"Result of get_unit_info for {info_code.name} is "
-					f"{self.ps.last_status.name}."
-				)
-			logger.info(f"{info_code.name} result: {string}")
+			with self.subTest(info=info_code.name):
+				try:
+					string = self.ps.get_unit_info(info_code)
+				except PicoStatusError:
+					self.fail(
+						f"Result of get_unit_info for {info_code.name} is "
+						f"{self.ps.last_status.name}."
+					)
+				logger.info(f"{info_code.name} result: {string}")
 
 
 if __name__ == "__main__":
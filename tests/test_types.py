@@ -0,0 +1,54 @@
+"""Tests for the structure type helpers."""
+###############################################################################
+# Project: PicoScope 6000E Driver
+# File: test_types.py
+#
+# Tests for the structure type helpers.
+#
+# Copyright (c) 2024 Marcus Engineering, LLC (MIT Licensed)
+#
+###############################################################################
+
+from ctypes import sizeof
+import unittest
+
+from ps6000a.constants import PicoStatus
+from ps6000a.types import (
+	STREAMING_DATA_INFO_DTYPE,
+	TRIGGER_INFO_DTYPE,
+	PicoStreamingDataInfo,
+	PicoTriggerInfo,
+	as_structured_array,
+)
+
+
+class TestStructuredArrays(unittest.TestCase):
+	"""Tests for viewing structure arrays as NumPy structured arrays."""
+
+	def test_layout(self) -> None:
+		"""Test that the dtypes match the size of the structures."""
+		self.assertEqual(TRIGGER_INFO_DTYPE.itemsize, sizeof(PicoTriggerInfo))
+		self.assertEqual(
+			STREAMING_DATA_INFO_DTYPE.itemsize, sizeof(PicoStreamingDataInfo)
+		)
+
+	def test_view(self) -> None:
+		"""Test that the view shares memory and exposes public field names."""
+		infos = (PicoTriggerInfo * 3)()
+		infos[1].trigger_time = 2.5
+		infos[2].status = PicoStatus.NOT_FOUND
+		view = as_structured_array(infos, TRIGGER_INFO_DTYPE)
+		self.assertEqual(list(view["trigger_time"]), [0.0, 2.5, 0.0])
+		self.assertEqual(view["status"][2], PicoStatus.NOT_FOUND)
+		view["trigger_index"][0] = 42
+		self.assertEqual(infos[0].trigger_index, 42)
+
+	def test_mismatch(self) -> None:
+		"""Test that a dtype of the wrong size is rejected."""
+		infos = (PicoTriggerInfo * 2)()
+		with self.assertRaises(ValueError):
+			as_structured_array(infos, STREAMING_DATA_INFO_DTYPE)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,58 @@
+"""Tests for the flexible enum helpers."""
+###############################################################################
+# Project: PicoScope 6000E Driver
+# File: test_util.py
+#
+# Tests for the flexible enum helpers.
+#
+# Copyright (c) 2024 Marcus Engineering, LLC (MIT Licensed)
+#
+###############################################################################
+
+import unittest
+
+from ps6000a.constants import PicoRatioMode, PicoStatus
+
+
+class TestFlexIntEnum(unittest.TestCase):
+	"""Tests for FlexIntEnum construction."""
+
+	def test_by_value(self) -> None:
+		"""Test construction of a known member by value."""
+		self.assertIs(PicoStatus(0), PicoStatus.OK)
+
+	def test_by_name(self) -> None:
+		"""Test construction of a known member by name."""
+		status = PicoStatus("NOT_FOUND")  # type: ignore[arg-type]
+		self.assertIs(status, PicoStatus.NOT_FOUND)
+
+	def test_unknown_value(self) -> None:
+		"""Test that an undocumented status code becomes a cached member."""
+		status = PicoStatus(0x7FFF_0001)
+		self.assertIsInstance(status, PicoStatus)
+		self.assertEqual(status, 0x7FFF_0001)
+		self.assertEqual(status.name, "UNKNOWN_0x7fff0001")
+		self.assertIs(PicoStatus(0x7FFF_0001), status)
+
+	def test_from_int(self) -> None:
+		"""Test the integer fast path for known and unknown values."""
+		self.assertIs(PicoStatus.from_int(0), PicoStatus.OK)
+		status = PicoStatus.from_int(0x7FFF_0002)
+		self.assertEqual(status.name, "UNKNOWN_0x7fff0002")
+		self.assertIs(PicoStatus.from_int(0x7FFF_0002), status)
+		self.assertIs(PicoStatus(0x7FFF_0002), status)
+
+
+class TestFlexIntFlag(unittest.TestCase):
+	"""Tests for FlexIntFlag construction."""
+
+	def test_from_int(self) -> None:
+		"""Test the integer fast path for single and compound flags."""
+		self.assertIs(PicoRatioMode.from_int(1), PicoRatioMode.AGGREGATE)
+		both = PicoRatioMode.from_int(3)
+		self.assertEqual(both, PicoRatioMode.AGGREGATE | PicoRatioMode.DECIMATE)
+		self.assertIs(PicoRatioMode.from_int(3), both)
+
+
+if __name__ == "__main__":
+	unittest.main()